@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+bench.py — per-stage benchmark and regression gate for the crossrd pipeline
+
+runs every process() stage (process.pipeline_stages) on synthetic families
+of 10^2, 10^4 (and optionally 10^6) specialties — "how does it scale" — or,
+with --families, on the real families — "did the real build get slower".
+per target and stage it records the median wall time over several runs,
+the peak traced memory of the stage (tracemalloc) and the peak RSS reached
+by the end of it. results are compared with bench_baseline.json: any
+stage slower or hungrier than the tolerance allows fails the run.
+
+the baseline holds absolute seconds and RSS, so it only means something on
+the machine that recorded it: its commit, python, machine and host are
+stored with it, and a run on another host says so. on a new host, record
+one first with --save-baseline (before your change, same checkout) and
+compare against that; the committed file is one machine's numbers.
+
+each target runs in a fresh process so its RSS isn't inflated by the ones
+before it, and targets run one after another so they don't compete for
+cpu. the first run is a warm-up (its RSS is recorded, its times are not);
+tracemalloc skews timings, so the traced run comes last and separately.
+
+synthetic families come from synth_family.py, are written to
+data/_bench_<size>/ (the leading underscore keeps them out of
+list_families) and are removed afterwards.
+
+usage:
+  python bench.py                          # 10^2 and 10^4, compare to baseline
+  python bench.py --full                   # also run 10^6 (slow, needs lots of RAM)
+  python bench.py --sizes 100 --repeat 5
+  python bench.py --families               # every real family
+  python bench.py --families law trades --repeat 9
+  python bench.py --save-baseline          # record this machine's baseline (first run on a host,
+                                           #   or after an intentional change)
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import multiprocessing
+import platform
+import resource
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from config import list_families
+from process import STAGES, pipeline_stages
+from synth_family import write_family
+
+DEFAULT_SIZES = [100, 10_000]
+FULL_SIZES = [100, 10_000, 1_000_000]
+DEFAULT_REPEAT = 3
+BASELINE_PATH = Path(__file__).parent / "bench_baseline.json"
+# bump when what's measured changes (stages, units); older baselines are rejected
+BASELINE_VERSION = 2
+
+# slowdowns / growth below these are noise (timer jitter, interpreter caches)
+SECONDS_FLOOR = 0.005
+MEMORY_FLOOR_KB = 1024
+RSS_FLOOR_KB = 4096
+
+
+# ── stages ──
+
+def _max_rss_kb():
+    """this process's peak resident set size so far, in KB."""
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss // 1024 if sys.platform == "darwin" else rss  # bytes on macOS
+
+
+def run_once(slug, output_path, trace_memory=False):
+    """run every stage once. returns {stage: (seconds, peak_kb, rss_kb)}."""
+    results = {}
+    if trace_memory:
+        tracemalloc.start()
+    try:
+        stages, _ = pipeline_stages(slug, output_path)
+        for name, fn in stages:
+            if trace_memory:
+                tracemalloc.reset_peak()
+                before, _ = tracemalloc.get_traced_memory()
+            t0 = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                fn()
+            elapsed = time.perf_counter() - t0
+            peak_kb = 0
+            if trace_memory:
+                _, peak = tracemalloc.get_traced_memory()
+                peak_kb = max(0, peak - before) // 1024
+            results[name] = (elapsed, peak_kb, _max_rss_kb())
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+    return results
+
+
+def bench_family(slug, repeat=DEFAULT_REPEAT):
+    """benchmark one family. returns {stage: {seconds, peak_kb, rss_kb}}.
+
+    meant to run in a fresh process (see bench_targets).
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        out = Path(tmp) / f"{slug}.json"
+        rss = {name: r[2] for name, r in run_once(slug, out).items()}
+        times = {name: [] for name in STAGES}
+        for _ in range(repeat):
+            for name, (secs, _, _) in run_once(slug, out).items():
+                times[name].append(secs)
+        memory = run_once(slug, out, trace_memory=True)
+    return {
+        name: {
+            "seconds": round(statistics.median(times[name]), 6),
+            "peak_kb": memory[name][1],
+            "rss_kb": rss[name],
+        }
+        for name in STAGES
+    }
+
+
+def _bench_args(args):
+    return bench_family(*args)
+
+
+def _bench_isolated(slug, repeat):
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=ctx) as pool:
+        return pool.submit(_bench_args, (slug, repeat)).result()
+
+
+def bench_size(size, repeat=DEFAULT_REPEAT, template="healthcare", seed=0):
+    """benchmark one synthetic size, adding specialties/sec to each stage."""
+    slug = f"_bench_{size}"
+    print(f"\n[{size:,} specialties] generating synthetic family...")
+    family_dir = write_family(slug, size, seed=seed, template=template, force=True)
+    try:
+        stages = _bench_isolated(slug, repeat)
+    finally:
+        shutil.rmtree(family_dir)
+    for r in stages.values():
+        r["per_sec"] = round(size / r["seconds"]) if r["seconds"] > 0 else 0
+    return stages
+
+
+def bench_targets(sizes=(), families=(), repeat=DEFAULT_REPEAT, template="healthcare", seed=0):
+    """{"sizes": {size: stages}, "families": {slug: stages}} for whatever was asked for."""
+    results = {"sizes": {}, "families": {}}
+    for size in sizes:
+        results["sizes"][str(size)] = bench_size(size, repeat, template, seed)
+    for family in families:
+        print(f"\n[{family}] timing ({repeat} runs)...")
+        results["families"][family] = _bench_isolated(family, repeat)
+    return results
+
+
+# ── reporting + baselines ──
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+            cwd=Path(__file__).parent, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def make_baseline(results, repeat, previous=None):
+    """the baseline document for a set of results, keeping targets that weren't re-run."""
+    previous = previous or {}
+    return {
+        "version": BASELINE_VERSION,
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "machine": f"{platform.system()} {platform.machine()}",
+        "host": platform.node(),
+        "repeat": repeat,
+        "stages": STAGES,
+        "sizes": {**previous.get("sizes", {}), **results["sizes"]},
+        "families": {**previous.get("families", {}), **results["families"]},
+    }
+
+
+def _label(kind, target):
+    return f"{int(target):,}" if kind == "sizes" else target
+
+
+def print_report(results, baseline=None):
+    """per target: stage medians (and change vs the baseline), throughput, memory."""
+    baseline = baseline or {}
+    for kind in ("sizes", "families"):
+        for target, stages in results[kind].items():
+            base = baseline.get(kind, {}).get(target, {})
+            print(f"\n{_label(kind, target)}" + (" specialties" if kind == "sizes" else ""))
+            print(f"  {'stage':<16} {'ms':>10} {'baseline':>10} {'change':>8} "
+                  f"{'specs/sec':>12} {'peak MB':>8} {'rss MB':>8}")
+            for name in STAGES:
+                cur, old = stages[name], base.get(name)
+                line = f"  {name:<16} {cur['seconds'] * 1000:>10.2f}"
+                if old and old["seconds"]:
+                    line += f" {old['seconds'] * 1000:>10.2f} {cur['seconds'] / old['seconds'] - 1:>+8.0%}"
+                else:
+                    line += f" {'-':>10} {'-':>8}"
+                per_sec = f"{cur['per_sec']:,}" if "per_sec" in cur else "-"
+                print(f"{line} {per_sec:>12} {cur['peak_kb'] / 1024:>8.1f} {cur['rss_kb'] / 1024:>8.1f}")
+            total = sum(s["seconds"] for s in stages.values())
+            print(f"  {'total':<16} {total * 1000:>10.2f}"
+                  + (f" {sum(s['seconds'] for s in base.values()) * 1000:>10.2f}" if base else ""))
+
+
+def compare_to_baseline(results, baseline, tolerance):
+    """compare results to the stored baseline. returns a list of regression messages.
+
+    a stage regresses when its median time, or its peak traced memory, is
+    more than (1 + tolerance) x the baseline and past the noise floor
+    (SECONDS_FLOOR, MEMORY_FLOOR_KB); a target regresses when its peak RSS
+    does the same (RSS_FLOOR_KB). targets or stages missing from the
+    baseline are skipped.
+    """
+    regressions = []
+    for kind in ("sizes", "families"):
+        for target, stages in results[kind].items():
+            base = baseline.get(kind, {}).get(target)
+            if not base:
+                continue
+            label = _label(kind, target)
+            for name, cur in stages.items():
+                old = base.get(name)
+                if not old:
+                    continue
+                if cur["seconds"] > max(old["seconds"] * (1 + tolerance), old["seconds"] + SECONDS_FLOOR):
+                    regressions.append(
+                        f"{label} {name}: {cur['seconds'] * 1000:.2f} ms vs baseline "
+                        f"{old['seconds'] * 1000:.2f} ms ({cur['seconds'] / old['seconds'] - 1:+.0%})"
+                    )
+                if cur["peak_kb"] > max(old["peak_kb"] * (1 + tolerance), old["peak_kb"] + MEMORY_FLOOR_KB):
+                    regressions.append(
+                        f"{label} {name}: peak {cur['peak_kb']:,} KB vs baseline {old['peak_kb']:,} KB"
+                    )
+            cur_rss = max(s["rss_kb"] for s in stages.values())
+            old_rss = max(s["rss_kb"] for s in base.values())
+            if cur_rss > max(old_rss * (1 + tolerance), old_rss + RSS_FLOOR_KB):
+                regressions.append(f"{label} peak RSS: {cur_rss / 1024:.1f} MB vs baseline {old_rss / 1024:.1f} MB")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="crossrd pipeline benchmark with a baseline gate")
+    parser.add_argument("--sizes", type=int, nargs="+", help="synthetic specialty counts to benchmark")
+    parser.add_argument("--full", action="store_true", help="run 10^2, 10^4 and 10^6")
+    parser.add_argument("--families", nargs="*", metavar="SLUG",
+                        help="benchmark real families (default with no slugs: all of them)")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="timed runs per target (median is kept)")
+    parser.add_argument("--template", default="healthcare", help="family whose rubric the synthetic data follows")
+    parser.add_argument("--seed", type=int, default=0, help="random seed for synthetic data")
+    parser.add_argument("--tolerance", type=float, default=0.5,
+                        help="allowed slowdown / memory growth before failing (0.5 = 50%%)")
+    parser.add_argument("--baseline", default=str(BASELINE_PATH), help="baseline json path")
+    parser.add_argument("--save-baseline", action="store_true", help="write results as the new baseline (baselines only compare on the machine that recorded them)")
+    args = parser.parse_args()
+
+    sizes = args.sizes or (FULL_SIZES if args.full else [])
+    families = args.families
+    if families == []:
+        families = list_families()
+    if not sizes and families is None:
+        sizes = DEFAULT_SIZES
+    results = bench_targets(sizes, families or [], args.repeat, args.template, args.seed)
+
+    baseline_path = Path(args.baseline)
+    baseline = json.loads(baseline_path.read_text()) if baseline_path.exists() else None
+    if baseline is not None and baseline.get("version") != BASELINE_VERSION:
+        print(f"\nbaseline {baseline_path} is version {baseline.get('version')}, "
+              f"expected {BASELINE_VERSION} — re-record it with --save-baseline")
+        baseline = None
+
+    if baseline is not None and baseline.get("host") != platform.node():
+        print(f"\nnote: baseline {baseline_path} was recorded on {baseline.get('host') or 'another machine'}, "
+              f"not {platform.node()} — absolute times and RSS only compare on the same host, "
+              f"so record one here with --save-baseline before judging a change")
+
+    print_report(results, baseline)
+
+    if args.save_baseline:
+        saved = make_baseline(results, args.repeat, baseline)
+        baseline_path.write_text(json.dumps(saved, indent=2) + "\n")
+        print(f"\nsaved baseline to {baseline_path}")
+        return
+
+    if baseline is None:
+        print(f"\nno usable baseline at {baseline_path} — run with --save-baseline first (on this machine)")
+        sys.exit(1)
+
+    regressions = compare_to_baseline(results, baseline, args.tolerance)
+    if regressions:
+        print(f"\nFAILED — {len(regressions)} regressions (tolerance {args.tolerance:.0%}, "
+              f"baseline from {baseline.get('commit') or 'unknown commit'}):")
+        for r in regressions:
+            print(f"  x {r}")
+        sys.exit(1)
+    print(f"\nPASSED — no stage regressed past {args.tolerance:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+columnar.py — struct-of-arrays encoding for the tracks array
+
+every track object repeats the same ~80 key names. the columnar format
+stores each field once, as one array across all tracks:
+
+  {"format": "columnar/1", "count": 64, "columns": [
+     {"path": "name", "values": ["Neurosurgery", ...]},
+     {"path": "profession", "dict": ["MD/DO", "OD"], "codes": [0, 0, 1, ...]},
+     {"path": "scores.category_1", "scale": 100, "values": [325, 325, ...]},
+     ...
+  ]}
+
+- nested sections (raw_data, scores, financial, ...) become "section.field"
+  columns; column order is the original key order, so decoding rebuilds
+  the exact object shape
+- repetitive string columns are dictionary-encoded (dict + codes)
+- scores and scenario totals are quantized to fixed-point integers
+  (value * scale) whenever that is lossless
+
+src/utils/decodeColumnar.js turns it back into the usual tracks array, so
+components don't change. decode_tracks() here is the reference decoder.
+
+usage:
+  python columnar.py                       # every src/data/<family>.json
+  python columnar.py ../src/data/law.json
+  python process.py --family law --columnar
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from compact import minify
+from config import list_families
+
+FORMAT = "columnar/1"
+
+# sections whose numbers are quantized to fixed-point ints
+QUANTIZED_SECTIONS = {"scores", "scenario_totals"}
+SCORE_SCALE = 100
+
+
+def _field_layout(tracks):
+    """return [(section, field)] in key order; field is None for top-level values.
+
+    raises ValueError if the tracks don't all share the same shape —
+    the columnar format has no way to express a missing key.
+    """
+    first = tracks[0]
+    layout = []
+    for section, value in first.items():
+        if isinstance(value, dict):
+            layout.extend((section, field) for field in value)
+        else:
+            layout.append((section, None))
+
+    for t in tracks:
+        if list(t) != list(first):
+            raise ValueError(f"track '{t.get('key')}' has different top-level keys")
+        for section, value in first.items():
+            if isinstance(value, dict) and list(t[section]) != list(value):
+                raise ValueError(f"track '{t.get('key')}' has a different '{section}' shape")
+    return layout
+
+
+def _quantize(values, scale):
+    """return fixed-point ints if every value survives the round trip, else None."""
+    ints = []
+    for v in values:
+        if isinstance(v, bool) or not isinstance(v, (int, float)):
+            return None
+        q = round(v * scale)
+        if q / scale != v:
+            return None
+        ints.append(q)
+    return ints
+
+
+def _encode_column(path, values, section):
+    column = {"path": path}
+
+    if section in QUANTIZED_SECTIONS:
+        ints = _quantize(values, SCORE_SCALE)
+        if ints is not None:
+            column["scale"] = SCORE_SCALE
+            column["values"] = ints
+            return column
+
+    if values and all(isinstance(v, str) for v in values):
+        distinct = list(dict.fromkeys(values))
+        if len(distinct) * 2 <= len(values):
+            index = {v: i for i, v in enumerate(distinct)}
+            column["dict"] = distinct
+            column["codes"] = [index[v] for v in values]
+            return column
+
+    column["values"] = values
+    return column
+
+
+def encode_tracks(tracks):
+    """encode a tracks array as columns. see the module docstring for the shape."""
+    if not tracks:
+        return {"format": FORMAT, "count": 0, "columns": []}
+
+    columns = []
+    for section, field in _field_layout(tracks):
+        if field is None:
+            values = [t[section] for t in tracks]
+            columns.append(_encode_column(section, values, section))
+        else:
+            values = [t[section][field] for t in tracks]
+            columns.append(_encode_column(f"{section}.{field}", values, section))
+    return {"format": FORMAT, "count": len(tracks), "columns": columns}
+
+
+def _column_values(column):
+    if "codes" in column:
+        return [column["dict"][c] for c in column["codes"]]
+    if "scale" in column:
+        scale = column["scale"]
+        return [v / scale for v in column["values"]]
+    return column["values"]
+
+
+def decode_tracks(encoded):
+    """rebuild the tracks array from encode_tracks() output."""
+    if encoded.get("format") != FORMAT:
+        raise ValueError(f"unsupported columnar format: {encoded.get('format')}")
+    tracks = [{} for _ in range(encoded["count"])]
+    for column in encoded["columns"]:
+        section, _, field = column["path"].partition(".")
+        for track, value in zip(tracks, _column_values(column)):
+            if field:
+                track.setdefault(section, {})[field] = value
+            else:
+                track[section] = value
+    return tracks
+
+
+def encode_output(output):
+    """a copy of a family output with `tracks` swapped for `tracks_columnar`."""
+    encoded = {}
+    for k, v in output.items():
+        if k == "tracks":
+            encoded["tracks_columnar"] = encode_tracks(v)
+        else:
+            encoded[k] = v
+    return encoded
+
+
+def write_columnar(output, json_path):
+    """write <name>.columnar.json (minified) next to json_path. returns its path."""
+    json_path = Path(json_path)
+    out_path = json_path.with_suffix(".columnar.json")
+    out_path.write_bytes(minify(encode_output(output)))
+    return out_path
+
+
+def print_report(rows):
+    """print minified row-format size vs columnar size per family."""
+    print(f"\n{'family':<14}{'rows KB':>10}{'columnar KB':>13}{'saved':>8}")
+    for family, row_bytes, col_bytes in rows:
+        saved = 1 - col_bytes / row_bytes if row_bytes else 0
+        print(f"{family:<14}{row_bytes / 1024:>10.1f}{col_bytes / 1024:>13.1f}{saved:>8.0%}")
+
+
+def columnar_file(json_path):
+    """encode an existing output file, verify it decodes back exactly, report sizes."""
+    with open(json_path) as f:
+        output = json.load(f)
+    out_path = write_columnar(output, json_path)
+    with open(out_path) as f:
+        if decode_tracks(json.load(f)["tracks_columnar"]) != output["tracks"]:
+            raise ValueError(f"{out_path}: columnar round trip changed the tracks")
+    return Path(json_path).stem, len(minify(output)), out_path.stat().st_size
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write columnar (struct-of-arrays) track output")
+    parser.add_argument("paths", nargs="*", help="pretty output json files (default: all families)")
+    args = parser.parse_args()
+
+    paths = args.paths
+    if not paths:
+        data_dir = Path(__file__).parent.parent / "src" / "data"
+        paths = [data_dir / f"{fam}.json" for fam in list_families()]
+    missing = [p for p in paths if not Path(p).exists()]
+    if missing:
+        print(f"ERROR: not found: {', '.join(map(str, missing))}", file=sys.stderr)
+        sys.exit(1)
+
+    print_report([columnar_file(p) for p in paths])
+
+
+if __name__ == "__main__":
+    main()
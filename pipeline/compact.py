@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+compact.py — minified + precompressed JSON artifacts
+
+writes a minified copy of a family's output JSON (compact separators,
+floats rounded) next to the pretty one, plus precompressed .gz and .br
+siblings so a static host can serve them directly. brotli is optional —
+without the package only the .gz is written.
+
+  healthcare.json          pretty, git-tracked (unchanged)
+  healthcare.min.json      minified
+  healthcare.min.json.gz   gzip -9
+  healthcare.min.json.br   brotli q11 (if installed)
+
+usage:
+  python compact.py                        # every src/data/<family>.json
+  python compact.py ../src/data/law.json
+  python process.py --family law --compact # same, right after the pipeline
+"""
+
+import argparse
+import gzip
+import json
+import sys
+import time
+from pathlib import Path
+
+try:
+    import brotli
+except ImportError:  # optional dependency
+    brotli = None
+
+from config import list_families
+
+# every value in the output is already rounded to <= 2 decimals at the
+# source, so this only trims float noise — it never changes a number
+FLOAT_DIGITS = 2
+PARSE_RUNS = 5
+
+
+def round_floats(obj, ndigits=FLOAT_DIGITS):
+    """return a copy of a JSON-like structure with every float rounded."""
+    if isinstance(obj, float):
+        return round(obj, ndigits)
+    if isinstance(obj, dict):
+        return {k: round_floats(v, ndigits) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [round_floats(v, ndigits) for v in obj]
+    return obj
+
+
+def minify(output, ndigits=FLOAT_DIGITS):
+    """serialize an output dict as minified UTF-8 JSON bytes."""
+    text = json.dumps(round_floats(output, ndigits), separators=(",", ":"), ensure_ascii=False)
+    return text.encode("utf-8")
+
+
+def write_compact(output, json_path, ndigits=FLOAT_DIGITS):
+    """write <name>.min.json plus .gz/.br siblings next to json_path.
+
+    returns {variant: path} for everything that was written.
+    """
+    json_path = Path(json_path)
+    min_path = json_path.with_suffix(".min.json")
+    data = minify(output, ndigits)
+    min_path.write_bytes(data)
+    written = {"min": min_path}
+
+    gz_path = min_path.with_name(min_path.name + ".gz")
+    # mtime=0 keeps the .gz byte-identical across rebuilds
+    gz_path.write_bytes(gzip.compress(data, compresslevel=9, mtime=0))
+    written["gz"] = gz_path
+
+    if brotli is not None:
+        br_path = min_path.with_name(min_path.name + ".br")
+        br_path.write_bytes(brotli.compress(data, quality=11))
+        written["br"] = br_path
+
+    return written
+
+
+def _parse_ms(path):
+    """best-of-N json.loads time for a file, in milliseconds."""
+    raw = Path(path).read_bytes()
+    best = None
+    for _ in range(PARSE_RUNS):
+        t0 = time.perf_counter()
+        json.loads(raw)
+        elapsed = (time.perf_counter() - t0) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def size_report(json_path, written):
+    """return a dict comparing sizes and parse times of the variants."""
+    pretty = Path(json_path)
+    row = {
+        "family": pretty.stem,
+        "pretty": pretty.stat().st_size,
+        "pretty_parse_ms": _parse_ms(pretty),
+        "min_parse_ms": _parse_ms(written["min"]),
+    }
+    for variant, path in written.items():
+        row[variant] = Path(path).stat().st_size
+    return row
+
+
+def print_report(rows):
+    """print the per-family size / parse-time comparison table."""
+    def kb(n):
+        return f"{n / 1024:8.1f}" if n is not None else "       -"
+
+    print(f"\n{'family':<14}{'pretty KB':>10}{'min KB':>9}{'gz KB':>9}{'br KB':>9}"
+          f"{'parse ms':>10}{'min ms':>9}")
+    for r in rows:
+        print(f"{r['family']:<14}{kb(r['pretty']):>10}{kb(r['min']):>9}{kb(r['gz']):>9}"
+              f"{kb(r.get('br')):>9}{r['pretty_parse_ms']:>10.2f}{r['min_parse_ms']:>9.2f}")
+    if brotli is None:
+        print("\n(brotli not installed — skipped .br; pip install brotli to enable)")
+
+
+def compact_file(json_path, ndigits=FLOAT_DIGITS):
+    """compact an existing pretty output file. returns its report row."""
+    with open(json_path) as f:
+        output = json.load(f)
+    return size_report(json_path, write_compact(output, json_path, ndigits))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write minified + precompressed JSON artifacts")
+    parser.add_argument("paths", nargs="*", help="pretty output json files (default: all families)")
+    parser.add_argument("--digits", type=int, default=FLOAT_DIGITS, help="float rounding digits")
+    args = parser.parse_args()
+
+    paths = args.paths
+    if not paths:
+        data_dir = Path(__file__).parent.parent / "src" / "data"
+        paths = [data_dir / f"{fam}.json" for fam in list_families()]
+    missing = [p for p in paths if not Path(p).exists()]
+    if missing:
+        print(f"ERROR: not found: {', '.join(map(str, missing))}", file=sys.stderr)
+        sys.exit(1)
+
+    print_report([compact_file(p, args.digits) for p in paths])
+
+
+if __name__ == "__main__":
+    main()
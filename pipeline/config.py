@@ -66,15 +66,16 @@ def load_family_config(family_slug):
         return yaml.safe_load(f)
 
 
-def list_families():
+def list_families(data_dir=None):
     """list all registered profession families.
 
-    scans data/*/config.yaml and returns a sorted list of family slugs.
+    scans data/*/config.yaml (or <data_dir>/*/config.yaml) and returns a
+    sorted list of family slugs. directories starting with "_"
+    (scratch/benchmark families) are skipped.
     """
-    repo_root = Path(__file__).parent.parent
-    data_dir = repo_root / "data"
+    data_dir = Path(data_dir) if data_dir else Path(__file__).parent.parent / "data"
     families = []
     for d in sorted(data_dir.iterdir()):
-        if d.is_dir() and (d / "config.yaml").exists():
+        if d.is_dir() and not d.name.startswith("_") and (d / "config.yaml").exists():
             families.append(d.name)
     return families
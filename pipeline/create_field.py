@@ -145,7 +145,7 @@ def main():
     print(f"  1. Copy or create your Excel workbook at data/{args.slug}/career_framework.xlsx")
     print(f"  2. Edit data/{args.slug}/config.yaml — fill in professions, finalists, etc.")
     print(f"  3. Run: python pipeline/process.py --family {args.slug}")
-    print(f"  4. Import the JSON in src/components/App.jsx")
+    print(f"  4. Run: python pipeline/shards.py  (the app lists every family in the shard manifest)")
 
 
 if __name__ == "__main__":
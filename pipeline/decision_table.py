@@ -0,0 +1,128 @@
+"""
+decision_table.py — flatten a family's decision tree into a lookup table
+
+config.yaml's decision_tree is a nested quiz. two node shapes are in use:
+
+  {"q": ..., "yes": <node>, "no": <node>}             yes/no question
+  {"q": ..., "options": [{"label": ..., <node>}]}     multiple choice
+
+plus the older third-level form {"q": ..., "procedural": key, "variety": key},
+which DecisionTree.jsx always treated as yes -> procedural, no -> variety.
+a leaf is a result key (a plain string, or {"result": key}).
+
+the compiled table keys every node by its answer path ("yes/no", "1/0"):
+
+  "decision_table": {
+    "depth": 3,
+    "questions": {"": {"q": ..., "choices": [{"step": "yes"}, ...]}, ...},
+    "results": {"yes/yes/yes": {"key", "name", "color", "path", "group",
+                                "tagline", "stat", "scenario_totals", "radar"}}
+  }
+
+so the quiz is one lookup per answer instead of a tree walk plus a scan
+over the tracks. compiling fails if any path dead-ends: a question with no
+choices, a leaf without a key, a key with no track, or a key missing from
+decision_tree_results.
+"""
+
+# the legacy yes/no leaf names, in yes/no order
+LEGACY_LEAVES = (("yes", "procedural"), ("no", "variety"))
+
+# track fields copied into each result
+RESULT_TRACK_FIELDS = ("key", "name", "color", "path", "group", "scenario_totals", "radar")
+
+
+def _children(node):
+    """[(step, label, child)] for a question node, [] for anything else."""
+    if not isinstance(node, dict) or "result" in node:
+        return []
+    if "options" in node:
+        return [(str(i), opt.get("label", ""), opt) for i, opt in enumerate(node["options"])]
+    if "yes" in node or "no" in node:
+        return [(step, None, node[step]) for step in ("yes", "no") if step in node]
+    return [(step, None, node[leaf]) for step, leaf in LEGACY_LEAVES if leaf in node]
+
+
+def _leaf_key(node):
+    """the result key of a leaf node, or None if the node is a question."""
+    if isinstance(node, str):
+        return node
+    if isinstance(node, dict) and "result" in node:
+        return node["result"]
+    return None
+
+
+def walk(tree):
+    """yield (path, node) for every node, depth first; the root's path is ""."""
+    stack = [("", tree)]
+    while stack:
+        path, node = stack.pop()
+        yield path, node
+        for step, _, child in reversed(_children(node)):
+            stack.append((f"{path}/{step}" if path else step, child))
+
+
+def leaf_keys(tree):
+    """every result key the tree can end on."""
+    if not tree:
+        return set()
+    return {key for _, node in walk(tree) if (key := _leaf_key(node)) is not None}
+
+
+def compile_decision_table(tree, results, tracks_by_key):
+    """the lookup table for a decision tree. see the module docstring.
+
+    tracks_by_key only needs the tracks the tree ends on. raises ValueError
+    listing every dead end; an empty tree compiles to an empty table.
+    """
+    table = {"depth": 0, "questions": {}, "results": {}}
+    if not tree:
+        return table
+
+    errors = []
+    for path, node in walk(tree):
+        where = f"decision_tree '{path or '<root>'}'"
+        key = _leaf_key(node)
+        if key is None:
+            choices = _children(node)
+            if not isinstance(node, dict) or not choices:
+                errors.append(f"{where}: question has no answers")
+                continue
+            table["questions"][path] = {
+                "q": node.get("q", ""),
+                "choices": [
+                    {"step": step, "label": label} if label is not None else {"step": step}
+                    for step, label, _ in choices
+                ],
+            }
+            continue
+
+        if not key:
+            errors.append(f"{where}: empty result")
+        elif key not in tracks_by_key:
+            errors.append(f"{where}: result '{key}' is not a track")
+        elif key not in results:
+            errors.append(f"{where}: result '{key}' missing from decision_tree_results")
+        else:
+            track = tracks_by_key[key]
+            table["results"][path] = {
+                **{f: track[f] for f in RESULT_TRACK_FIELDS if f in track},
+                "tagline": results[key].get("tagline", ""),
+                "stat": results[key].get("stat", ""),
+            }
+            table["depth"] = max(table["depth"], path.count("/") + 1)
+
+    if errors:
+        raise ValueError("decision tree dead ends:\n  " + "\n  ".join(errors))
+    return table
+
+
+def capture_tracks(tracks, keys, store):
+    """pass tracks through, keeping the ones whose key is in `keys` in store.
+
+    lets the streaming writer compile the table after the tracks have gone by.
+    """
+    for track in tracks:
+        if track["key"] in keys:
+            store[track["key"]] = track
+        yield track
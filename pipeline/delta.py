@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+delta.py — build-to-build delta (JSON Patch) and change report
+
+a rebuild ships whole new family files even when one salary moved. this
+compares a family's previous output with the new one and writes
+
+  src/data/<family>.delta.json
+    {"format": "delta/1", "family": ..., "from": <old last_updated>,
+     "to": <new last_updated>, "patch": [RFC 6902 ops], "summary": {...}}
+
+tracks are matched by key and compared by content hash, so only tracks
+whose hash changed are walked — the diff costs O(changed tracks), not a
+deep walk of the whole file. the summary lists, per changed track, the
+category scores and scenario totals that moved, plus every track whose
+rank changed in any scenario (a rank can move without the track changing).
+
+usage:
+  python delta.py old.json new.json            # print the report
+  python delta.py --family law                 # vs the last commit (git show HEAD:...)
+  python delta.py --family law --ref HEAD~3 --write
+  python process.py --family law --delta       # vs the file being overwritten
+"""
+
+import argparse
+import hashlib
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+FORMAT = "delta/1"
+HASH_LEN = 16
+REPO_ROOT = Path(__file__).parent.parent
+
+
+# ---- hashing ----
+
+def track_hash(track):
+    """content hash of one track (key order independent)."""
+    data = json.dumps(track, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(data).hexdigest()[:HASH_LEN]
+
+
+def track_hashes(output):
+    """{track key: content hash} for every track in an output."""
+    return {t["key"]: track_hash(t) for t in output.get("tracks", [])}
+
+
+# ---- json patch ----
+
+def _pointer(*parts):
+    """RFC 6901 pointer from path parts."""
+    return "".join("/" + str(p).replace("~", "~0").replace("/", "~1") for p in parts)
+
+
+def diff_values(old, new, path=()):
+    """JSON Patch ops turning old into new.
+
+    dicts are diffed key by key, equal-length lists item by item; anything
+    else that differs is replaced whole.
+    """
+    if type(old) is not type(new):
+        return [{"op": "replace", "path": _pointer(*path), "value": new}]
+
+    if isinstance(old, dict):
+        ops = []
+        for k in old:
+            if k not in new:
+                ops.append({"op": "remove", "path": _pointer(*path, k)})
+            elif old[k] != new[k]:
+                ops.extend(diff_values(old[k], new[k], (*path, k)))
+        for k in new:
+            if k not in old:
+                ops.append({"op": "add", "path": _pointer(*path, k), "value": new[k]})
+        return ops
+
+    if isinstance(old, list) and len(old) == len(new):
+        ops = []
+        for i, (a, b) in enumerate(zip(old, new)):
+            if a != b:
+                ops.extend(diff_values(a, b, (*path, i)))
+        return ops
+
+    if old != new:
+        return [{"op": "replace", "path": _pointer(*path), "value": new}]
+    return []
+
+
+def _diff_tracks(old_tracks, new_tracks, old_hashes, new_hashes):
+    """patch ops for the tracks array, touching only tracks whose hash changed.
+
+    removals go first (highest index first), then additions in new order,
+    then in-place diffs at the new indices. a reorder of surviving tracks
+    can't be expressed that way, so the array is replaced whole.
+    """
+    old_keys = [t["key"] for t in old_tracks]
+    new_keys = [t["key"] for t in new_tracks]
+    removed = [i for i, k in enumerate(old_keys) if k not in new_hashes]
+    added = [i for i, k in enumerate(new_keys) if k not in old_hashes]
+
+    kept_old = [k for k in old_keys if k in new_hashes]
+    kept_new = [k for k in new_keys if k in old_hashes]
+    if kept_old != kept_new or len(set(new_keys)) != len(new_keys):
+        return [{"op": "replace", "path": "/tracks", "value": new_tracks}]
+
+    ops = [{"op": "remove", "path": _pointer("tracks", i)} for i in reversed(removed)]
+    ops += [{"op": "add", "path": _pointer("tracks", i), "value": new_tracks[i]} for i in added]
+
+    old_index = {k: i for i, k in enumerate(old_keys)}
+    for i, key in enumerate(new_keys):
+        if key in old_hashes and old_hashes[key] != new_hashes[key]:
+            ops.extend(diff_values(old_tracks[old_index[key]], new_tracks[i], ("tracks", i)))
+    return ops
+
+
+def build_patch(old, new, old_hashes=None, new_hashes=None):
+    """JSON Patch ops turning output `old` into output `new`."""
+    old_hashes = old_hashes if old_hashes is not None else track_hashes(old)
+    new_hashes = new_hashes if new_hashes is not None else track_hashes(new)
+    ops = []
+    for k in old:
+        if k not in new:
+            ops.append({"op": "remove", "path": _pointer(k)})
+        elif k == "tracks":
+            ops.extend(_diff_tracks(old[k], new[k], old_hashes, new_hashes))
+        elif old[k] != new[k]:
+            ops.extend(diff_values(old[k], new[k], (k,)))
+    for k in new:
+        if k not in old:
+            ops.append({"op": "add", "path": _pointer(k), "value": new[k]})
+    return ops
+
+
+def _unescape(part):
+    return part.replace("~1", "/").replace("~0", "~")
+
+
+def apply_patch(doc, ops):
+    """apply add/remove/replace ops to a JSON-like doc in place. returns doc."""
+    for op in ops:
+        parts = [_unescape(p) for p in op["path"].split("/")[1:]]
+        if not parts:
+            raise ValueError("patching the document root is not supported")
+        parent = doc
+        for p in parts[:-1]:
+            parent = parent[int(p)] if isinstance(parent, list) else parent[p]
+        last = parts[-1]
+        if isinstance(parent, list):
+            idx = len(parent) if last == "-" else int(last)
+            if op["op"] == "add":
+                parent.insert(idx, op["value"])
+            elif op["op"] == "remove":
+                del parent[idx]
+            else:
+                parent[idx] = op["value"]
+        elif op["op"] == "remove":
+            del parent[last]
+        else:
+            parent[last] = op["value"]
+    return doc
+
+
+# ---- change summary ----
+
+def _scenario_ranks(output):
+    """{scenario: {track key: rank}} by scenario total, highest first."""
+    tracks = output.get("tracks", [])
+    ranks = {}
+    for scenario in output.get("scenario_profiles", {}):
+        ordered = sorted(tracks, key=lambda t: -t["scenario_totals"].get(scenario, 0))
+        ranks[scenario] = {t["key"]: i + 1 for i, t in enumerate(ordered)}
+    return ranks
+
+
+def _moved(old, new):
+    """{field: [old, new]} for every field whose value differs."""
+    return {k: [old.get(k), new.get(k)] for k in {**old, **new} if old.get(k) != new.get(k)}
+
+
+def summarize(old, new, old_hashes=None, new_hashes=None):
+    """which tracks were added, removed, rescored, retotalled or reranked."""
+    old_hashes = old_hashes if old_hashes is not None else track_hashes(old)
+    new_hashes = new_hashes if new_hashes is not None else track_hashes(new)
+    old_by_key = {t["key"]: t for t in old.get("tracks", [])}
+    new_by_key = {t["key"]: t for t in new.get("tracks", [])}
+
+    changed = {}
+    for key, h in new_hashes.items():
+        if key not in old_hashes or old_hashes[key] == h:
+            continue
+        a, b = old_by_key[key], new_by_key[key]
+        entry = {"name": b["name"]}
+        scores = _moved(a.get("scores", {}), b.get("scores", {}))
+        totals = _moved(a.get("scenario_totals", {}), b.get("scenario_totals", {}))
+        if scores:
+            entry["scores"] = scores
+        if totals:
+            entry["scenario_totals"] = totals
+        other = sorted(k for k in {**a, **b} if k not in ("scores", "scenario_totals") and a.get(k) != b.get(k))
+        if other:
+            entry["other"] = other
+        changed[key] = entry
+
+    old_ranks, new_ranks = _scenario_ranks(old), _scenario_ranks(new)
+    reranked = {}
+    for scenario, ranks in new_ranks.items():
+        before = old_ranks.get(scenario, {})
+        for key, rank in ranks.items():
+            if key in before and before[key] != rank:
+                reranked.setdefault(key, {})[scenario] = [before[key], rank]
+
+    return {
+        "added": [k for k in new_hashes if k not in old_hashes],
+        "removed": [k for k in old_hashes if k not in new_hashes],
+        "changed": changed,
+        "reranked": reranked,
+        "unchanged": sum(1 for k, h in new_hashes.items() if old_hashes.get(k) == h),
+    }
+
+
+def build_delta(old, new, family=None):
+    """the full delta document: patch plus summary."""
+    old_hashes, new_hashes = track_hashes(old), track_hashes(new)
+    return {
+        "format": FORMAT,
+        "family": family or new.get("meta", {}).get("profession_family", ""),
+        "from": old.get("meta", {}).get("last_updated", ""),
+        "to": new.get("meta", {}).get("last_updated", ""),
+        "patch": build_patch(old, new, old_hashes, new_hashes),
+        "summary": summarize(old, new, old_hashes, new_hashes),
+    }
+
+
+def write_delta(delta, json_path):
+    """write <name>.delta.json next to json_path. returns its path."""
+    out_path = Path(json_path).with_suffix(".delta.json")
+    with open(out_path, "w") as f:
+        json.dump(delta, f, indent=2)
+    return out_path
+
+
+def format_summary(summary, limit=50):
+    """human-readable change report lines."""
+    lines = []
+    for label in ("added", "removed"):
+        if summary[label]:
+            lines.append(f"{label}: {', '.join(summary[label])}")
+    for key, entry in list(summary["changed"].items())[:limit]:
+        lines.append(f"changed {key} ({entry['name']})")
+        for section in ("scores", "scenario_totals"):
+            for field, (a, b) in sorted(entry.get(section, {}).items()):
+                lines.append(f"    {section}.{field}: {a} -> {b}")
+        if entry.get("other"):
+            lines.append(f"    also: {', '.join(entry['other'])}")
+    for key, moves in list(summary["reranked"].items())[:limit]:
+        moved = ", ".join(f"{s} #{a}->#{b}" for s, (a, b) in moves.items())
+        lines.append(f"reranked {key}: {moved}")
+    hidden = max(0, len(summary["changed"]) - limit) + max(0, len(summary["reranked"]) - limit)
+    if hidden:
+        lines.append(f"... and {hidden} more")
+    lines.append(f"{len(summary['changed'])} changed, {len(summary['added'])} added, "
+                 f"{len(summary['removed'])} removed, {len(summary['reranked'])} reranked, "
+                 f"{summary['unchanged']} unchanged")
+    return lines
+
+
+def load_git_output(family, ref="HEAD"):
+    """a family's committed output at a git ref, or None if it isn't there."""
+    result = subprocess.run(
+        ["git", "show", f"{ref}:src/data/{family}.json"],
+        cwd=REPO_ROOT, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        return None
+    return json.loads(result.stdout)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build-to-build delta and change report")
+    parser.add_argument("paths", nargs="*", help="old.json new.json")
+    parser.add_argument("--family", help="compare src/data/<family>.json against a git ref")
+    parser.add_argument("--ref", default="HEAD", help="git ref for --family (default HEAD)")
+    parser.add_argument("--write", action="store_true", help="also write <new>.delta.json")
+    args = parser.parse_args()
+
+    if args.family:
+        new_path = REPO_ROOT / "src" / "data" / f"{args.family}.json"
+        old = load_git_output(args.family, args.ref)
+        if old is None:
+            print(f"ERROR: src/data/{args.family}.json not found at {args.ref}", file=sys.stderr)
+            sys.exit(1)
+    elif len(args.paths) == 2:
+        with open(args.paths[0]) as f:
+            old = json.load(f)
+        new_path = Path(args.paths[1])
+    else:
+        parser.print_help()
+        sys.exit(1)
+
+    with open(new_path) as f:
+        new = json.load(f)
+
+    delta = build_delta(old, new, args.family)
+    print(f"{len(delta['patch'])} patch ops")
+    for line in format_summary(delta["summary"]):
+        print(f"  {line}")
+    if args.write:
+        print(f"wrote {write_delta(delta, new_path)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+export_excel.py — stream the YAML families back out to Excel for analysts
+
+one workbook per family, one sheet per profession laid out like the
+original L2 Matrix sheets (title row, category row, column labels, the
+Dec / Ref weight row, data from row 5): the specialty's raw YAML fields,
+then the computed category scores, scenario totals, stress and financial
+metrics (the full financial params, profession defaults included). a
+Scenario Profiles sheet holds the weights the totals used.
+
+tracks come from process.iter_tracks, scored one at a time, and go
+straight into openpyxl write-only sheets, which stream rows to temp files
+instead of keeping cells — neither the scored family nor the sheets are
+ever held in memory.
+
+usage:
+  python export_excel.py                      # every family -> exports/<family>.xlsx
+  python export_excel.py --family law --out /tmp/xlsx
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import re
+import sys
+import time
+from pathlib import Path
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Font, PatternFill
+
+from config import CATEGORIES, list_families
+from financial import derive_financial_params, resolve_financial
+from lint import load_framework
+from process import INPUT_STAGES, iter_tracks, pipeline_stages
+
+REPO_ROOT = Path(__file__).parent.parent
+DEFAULT_OUT = REPO_ROOT / "exports"
+
+# spec keys the pipeline adds on load; the sheet shows key and group itself
+SKIP_FIELDS = {"name", "profession", "key", "color"}
+
+# a resolved track's financial params: the profession defaults, then the
+# fields every specialty sets — the same for every track, so the columns
+# don't depend on which track comes first
+FINANCIAL_COLUMNS = list(derive_financial_params({}, "MD/DO"))
+
+# Excel's limit, and the characters it won't take in a sheet name
+SHEET_NAME_MAX = 31
+_BAD_SHEET_CHARS = re.compile(r"[\[\]:*?/\\]")
+
+TITLE_FONT = Font(bold=True, size=13)
+HEADER_FONT = Font(bold=True)
+HEADER_FILL = PatternFill("solid", fgColor="DDE5F0")
+COMPUTED_FILL = PatternFill("solid", fgColor="E8F0DD")
+
+
+def sheet_name(profession, used):
+    """'L2 Matrix — MD-DO' for 'MD/DO', made unique and cut to Excel's limit."""
+    base = _BAD_SHEET_CHARS.sub("-", f"L2 Matrix — {profession}")[:SHEET_NAME_MAX]
+    name, n = base, 2
+    while name in used:
+        suffix = f" {n}"
+        name, n = base[:SHEET_NAME_MAX - len(suffix)] + suffix, n + 1
+    used.add(name)
+    return name
+
+
+def _cell(ws, value, font=None, fill=None, wrap=False):
+    cell = WriteOnlyCell(ws, value=value)
+    if font:
+        cell.font = font
+    if fill:
+        cell.fill = fill
+    if wrap:
+        cell.alignment = Alignment(wrap_text=True, vertical="top")
+    return cell
+
+
+def _excel_value(value):
+    """a yaml / json value as something a cell can hold."""
+    if isinstance(value, (list, dict)):
+        return json.dumps(value)
+    return value
+
+
+# ── columns ──
+
+def spec_columns(specs, rubric):
+    """raw fields in sheet order: rubric fields first, then anything else the specs carry."""
+    present = {}
+    for spec in specs:
+        present.update(dict.fromkeys(spec))
+    columns = [f for f in rubric if f in present]
+    columns += [f for f in present if f not in rubric and f not in SKIP_FIELDS]
+    return columns
+
+
+def field_header(field, rubric, framework):
+    """(category, label, weight) header cells for one raw field."""
+    field_def = rubric.get(field)
+    if field_def is None:
+        return "", field, ""
+    cats = field_def.get("categories") or [field_def.get("category")]
+    category = ", ".join(f"{c}. {CATEGORIES[c - 1]['name']}" for c in cats if c)
+    point = framework.get(field_def.get("data_point_id")) or {}
+    weight = "Dec" if field_def.get("type") == "decision" else "Ref"
+    return category, point.get("name", field), weight
+
+
+def computed_columns(track):
+    """[(section, key)] for a track's computed metrics, in sheet order."""
+    cols = [("scores", k) for k in track["scores"]]
+    cols += [("scenario_totals", k) for k in track["scenario_totals"]]
+    cols += [("stress", k) for k in track["stress"]]
+    cols += [("financial", k) for k in FINANCIAL_COLUMNS]
+    return cols
+
+
+COMPUTED_SECTIONS = {
+    "scores": "Category Scores",
+    "scenario_totals": "Scenario Totals",
+    "stress": "Stress Test",
+    "financial": "Financial",
+}
+
+
+def computed_label(section, key):
+    if section == "scores":
+        cat_id = int(key.rsplit("_", 1)[1])
+        return f"{cat_id}. {CATEGORIES[cat_id - 1]['name']}"
+    return key
+
+
+# ── sheets ──
+
+class ProfessionSheet:
+    """a write-only L2 Matrix sheet for one profession; the header goes out with the first track."""
+
+    def __init__(self, wb, name, profession, count, columns, rubric, framework):
+        self.ws = wb.create_sheet(name)
+        self.profession = profession
+        self.count = count
+        self.columns = columns
+        self.rubric = rubric
+        self.framework = framework
+        self.computed = None
+        self.rows = 0
+        # layout has to be set before the first row is written
+        self.ws.freeze_panes = "B5"
+        self.ws.column_dimensions["A"].width = 34
+
+    def _header(self, computed):
+        ws = self.ws
+        heads = [field_header(f, self.rubric, self.framework) for f in self.columns]
+        ws.append([_cell(ws, f"L2 SPECIALTY MATRIX — {self.profession} ({self.count} Specialties)",
+                         font=TITLE_FONT)])
+        ws.append([None, None, None]
+                  + [_cell(ws, cat, fill=HEADER_FILL) for cat, _, _ in heads]
+                  + [_cell(ws, COMPUTED_SECTIONS[s], fill=COMPUTED_FILL) for s, _ in computed])
+        ws.append([_cell(ws, label, font=HEADER_FONT, fill=fill, wrap=True) for label, fill in
+                   [("Specialty / Track", HEADER_FILL), ("Key", HEADER_FILL), ("Group", HEADER_FILL)]
+                   + [(label, HEADER_FILL) for _, label, _ in heads]
+                   + [(computed_label(s, k), COMPUTED_FILL) for s, k in computed]])
+        ws.append(["Weight →", None, None] + [w for _, _, w in heads] + ["Calc"] * len(computed))
+
+    def append(self, spec, track):
+        if self.computed is None:
+            self.computed = computed_columns(track)
+            self._header(self.computed)
+        # tracks carry only their own financial fields; the sheet shows the
+        # full params, profession defaults included
+        sections = {**track, "financial": resolve_financial(track["financial"], track["profession"])}
+        self.ws.append(
+            [track["name"], track["key"], track.get("group")]
+            + [_excel_value(spec.get(f)) for f in self.columns]
+            + [sections[s].get(k) for s, k in self.computed]
+        )
+        self.rows += 1
+
+
+def write_scenario_sheet(wb, profiles):
+    """categories x scenarios, the weights behind scenario_totals."""
+    ws = wb.create_sheet("Scenario Profiles")
+    ws.column_dimensions["A"].width = 34
+    ws.append([_cell(ws, "Category", font=HEADER_FONT, fill=HEADER_FILL)]
+              + [_cell(ws, name, font=HEADER_FONT, fill=HEADER_FILL) for name in profiles])
+    for cat in CATEGORIES:
+        ws.append([f"{cat['id']}. {cat['name']}"]
+                  + [weights.get(str(cat["id"])) for weights in profiles.values()])
+
+
+def export_family(family_slug, out_path):
+    """score a family track by track into an .xlsx at out_path. returns {sheet: rows}."""
+    stages, state = pipeline_stages(family_slug)
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _, fn in stages[:INPUT_STAGES]:
+            fn()
+    specs, rubric = state["specs"], state["rubric"]
+    framework = load_framework(family_slug)
+    columns = spec_columns(specs, rubric)
+
+    counts = {}
+    for spec in specs:
+        counts[spec["profession"]] = counts.get(spec["profession"], 0) + 1
+
+    wb = Workbook(write_only=True)
+    used = set()
+    sheets = {
+        prof: ProfessionSheet(wb, sheet_name(prof, used), prof, n, columns, rubric, framework)
+        for prof, n in counts.items()
+    }
+    tracks = iter_tracks(specs, state["l1"], rubric, state["profiles"], state["cfg"]["professions"])
+    for spec, track in zip(specs, tracks):
+        sheets[spec["profession"]].append(spec, track)
+    write_scenario_sheet(wb, state["profiles"])
+
+    out_path = Path(out_path)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    wb.save(out_path)
+    return {sheet.ws.title: sheet.rows for sheet in sheets.values()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stream the YAML families out to Excel workbooks")
+    parser.add_argument("--family", action="append", help="family slug (default: all, repeatable)")
+    parser.add_argument("--out", default=str(DEFAULT_OUT), help="output directory (one <family>.xlsx each)")
+    args = parser.parse_args()
+
+    families = args.family or list_families()
+    if not families:
+        print("no families found (no data/*/config.yaml files)")
+        sys.exit(1)
+
+    out_dir = Path(args.out)
+    t0 = time.perf_counter()
+    total = 0
+    for fam in families:
+        path = out_dir / f"{fam}.xlsx"
+        rows = export_family(fam, path)
+        total += sum(rows.values())
+        print(f"  {fam}: {sum(rows.values())} specialties in {len(rows)} sheets -> {path}")
+    print(f"\ndone! exported {total} specialties from {len(families)} families "
+          f"in {time.perf_counter() - t0:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,10 @@ extract_from_excel.py — one-time migration tool
 reads the career framework excel workbook and writes YAML data files
 that replace the excel as the pipeline's source of truth.
 
+extract_workbook.py re-extracts the specialty columns, data point framework
+and L1 scores in a single streaming pass; this remains for the finalist-era
+sheets (financial model, stress test, finals matrix).
+
 usage:
     python extract_from_excel.py --family healthcare
 """
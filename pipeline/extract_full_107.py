@@ -7,6 +7,9 @@ Phase 1 of the full-107 migration:
 2. Extracts the 11 missing L2 columns from the L2 Matrix sheets
 3. Enriches l1_scores.yaml with labels and data point IDs
 
+Superseded by extract_workbook.py, which reads every sheet once and writes
+all 38 L2 columns directly instead of patching extract_from_excel's output.
+
 Usage:
     python extract_full_107.py --family healthcare
 """
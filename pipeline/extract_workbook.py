@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""
+extract_workbook.py — single-pass streaming extraction of the career workbook
+
+extract_from_excel.py and extract_full_107.py each walked the L2 Matrix
+and L1 Scoring Results sheets on their own: one for the scored columns,
+the other for the 9 it skipped, plus the data point framework and labels,
+patching the first script's yaml afterwards. this does it in one go:
+
+- every L2 Matrix sheet is read once, all 38 columns per row, and each
+  specialty is appended to its yaml file as soon as its row is read
+- the Data Points Framework sheet is read once and streamed out the same way
+- the L1 Scoring Results sheet is read once for the data point scores,
+  their labels / ids and the category averages
+
+the workbook is opened in openpyxl's read-only mode, which streams rows
+from the xml instead of building every cell, and nothing keeps more than
+the current row (plus the L1 table, which is fixed-size) — memory stays
+flat however many rows the sheets have.
+
+output goes to data/<family>/archive/extracted/ by default, not over the
+live yaml: the specialties files have been curated since (groups,
+annualSpots, AI risk) and are the source of truth now. the finalist-era
+sheets (financial model, stress test, finals matrix) are still
+extract_from_excel.py's job.
+
+usage:
+  python extract_workbook.py --family healthcare
+  python extract_workbook.py --family healthcare --input book.xlsx --out /tmp/extracted
+"""
+
+import argparse
+import re
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import openpyxl
+import yaml
+
+from patch_fields import Dumper
+
+REPO_ROOT = Path(__file__).parent.parent
+WORKBOOK_NAME = "career_framework_v4.xlsx"
+
+L2_SHEET_PREFIX = "L2 Matrix — "
+L2_FIRST_ROW = 5
+
+# column index (0-based) -> field name, all 38 L2 Matrix columns
+L2_COLUMNS = {
+    0: "name",
+    1: "residencyYears",
+    2: "fellowshipOptions",
+    3: "matchComp",
+    4: "startSalary",
+    5: "midSalary",
+    6: "peakSalary",
+    7: "compModel",
+    8: "revPerPatientVisit",
+    9: "partTimeFlex",
+    10: "dailyWorkflow",
+    11: "patientVolume",
+    12: "procedureMix",
+    13: "callSchedule",
+    14: "adminBurden",
+    15: "supportStaffModel",
+    16: "hoursWeek",
+    17: "burnout",
+    18: "partTimeFeasibility",
+    19: "vacation",
+    20: "careerLongevity",
+    21: "malpracticeFreq",
+    22: "malpracticeCost",
+    23: "geographicFlex",
+    24: "geographicDemandNotes",
+    25: "telehealthPotential",
+    26: "automationRisk",
+    27: "handsOnInsulation",
+    28: "satisfaction",
+    29: "chooseAgain",
+    30: "intellectualStim",
+    31: "varietyRepetition",
+    32: "patientImpact",
+    33: "genderDistribution",
+    34: "physicalToll",
+    35: "emotionalToll",
+    36: "malpracticeLiability",
+    37: "injuryCareerRisk",
+}
+
+# L1 Scoring Results layout
+L1_SHEET = "L1 Scoring Results"
+L1_PROF_COLS = {"MD/DO": 2, "DDS/DMD": 3, "DPM": 4, "OD": 5}
+L1_AVERAGES_HEADER = "CATEGORY AVERAGE SCORES"
+L1_PROXY_LABEL = "Profession-level proxy score"
+
+FRAMEWORK_SHEET = "Data Points Framework"
+
+
+def _number(val):
+    """a cell value as an int when it's integral, a float when numeric, else unchanged."""
+    if isinstance(val, bool) or val is None:
+        return val
+    try:
+        num = float(val)
+    except (ValueError, TypeError):
+        return val.strip() if isinstance(val, str) else val
+    return int(num) if num == int(num) else num
+
+
+class YamlListWriter:
+    """append items to a yaml list under a fixed header, one at a time."""
+
+    def __init__(self, path, comment, header, list_key):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.count = 0
+        self._f = open(self.path, "w")
+        self._f.write(comment + "\n")
+        if header:
+            self._f.write(yaml.dump(header, Dumper=Dumper, sort_keys=False, allow_unicode=True))
+        self._f.write(f"{list_key}:\n")
+
+    def append(self, item):
+        self._f.write(yaml.dump([item], Dumper=Dumper, sort_keys=False, allow_unicode=True))
+        self.count += 1
+
+    def close(self):
+        self._f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# ── sheets ──
+
+def l2_sheets(wb):
+    """{profession: sheet name} for every L2 Matrix sheet ("MD-DO" -> "MD/DO")."""
+    return {
+        name[len(L2_SHEET_PREFIX):].replace("-", "/"): name
+        for name in wb.sheetnames if name.startswith(L2_SHEET_PREFIX)
+    }
+
+
+def iter_specialties(ws, columns=L2_COLUMNS):
+    """yield one specialty dict per L2 Matrix row, stopping at the first blank name."""
+    for row in ws.iter_rows(min_row=L2_FIRST_ROW, values_only=True):
+        if not row or row[0] is None:
+            return
+        spec = {}
+        for col, field in columns.items():
+            val = row[col] if col < len(row) else None
+            spec[field] = str(val).strip() if field == "name" else _number(val)
+        yield spec
+
+
+def iter_data_points(ws):
+    """yield the Data Points Framework rows as data point dicts."""
+    for row in ws.iter_rows(min_row=2, values_only=True):
+        if not row or row[0] is None:
+            return
+        cat_str = str(row[1])
+        m = re.match(r"(\d+)\.", cat_str)
+        yield {
+            "id": int(row[0]),
+            "category_id": int(m.group(1)) if m else 0,
+            "category_name": cat_str.split(". ", 1)[-1] if ". " in cat_str else cat_str,
+            "name": str(row[2]).strip(),
+            "layer": str(row[3]).strip(),
+            "data_type": str(row[4]).strip(),
+            "decision_weight": str(row[5]).strip(),
+            "scoring_notes": str(row[6]).strip() if row[6] else None,
+        }
+
+
+def read_l1(ws, prof_cols=L1_PROF_COLS):
+    """one pass over L1 Scoring Results.
+
+    returns {profession: {cat_id: {scores, count, average, labels, data_point_ids}}},
+    the l1_data_points layout of l1_scores.yaml.
+    """
+    entries = {p: {} for p in prof_cols}   # prof -> cat -> [(dp id, label, score)]
+    averages = {p: {} for p in prof_cols}
+    current_cat = None
+    in_averages = False
+
+    for row in ws.iter_rows(min_row=3, values_only=True):
+        cell0, label = row[0], str(row[1]).strip() if row[1] else ""
+        if label.startswith(L1_AVERAGES_HEADER):
+            in_averages = True
+            continue
+
+        if in_averages:
+            try:
+                cat_id = int(cell0)
+            except (ValueError, TypeError):
+                continue
+            for prof, col in prof_cols.items():
+                if row[col] is not None:
+                    averages[prof][cat_id] = round(float(row[col]), 2)
+            continue
+
+        if cell0 is None and label.startswith("Cat "):
+            m = re.match(r"Cat (\d+)", label)
+            current_cat = int(m.group(1)) if m else None
+            continue
+        if current_cat is None:
+            continue
+        if cell0 is not None:
+            try:
+                dp_id = int(float(cell0))
+            except (ValueError, TypeError):
+                continue
+        elif label == L1_PROXY_LABEL:
+            dp_id = None
+        else:
+            continue
+        for prof, col in prof_cols.items():
+            score = _number(row[col])
+            if isinstance(score, (int, float)):
+                entries[prof].setdefault(current_cat, []).append(
+                    (dp_id, label or f"Data Point {dp_id}", score))
+
+    l1 = {}
+    for prof, cats in entries.items():
+        l1[prof] = {}
+        for cat_id, points in cats.items():
+            scores = [s for _, _, s in points]
+            avg = averages[prof].get(cat_id)
+            l1[prof][cat_id] = {
+                "scores": scores,
+                "count": len(scores),
+                "average": avg if avg is not None else round(sum(scores) / len(scores), 2),
+                "labels": [label for _, label, _ in points],
+                "data_point_ids": [dp for dp, _, _ in points],
+            }
+    return l1
+
+
+# ── extraction ──
+
+def _slug(profession):
+    return profession.lower().replace("/", "_")
+
+
+def extract(input_path, out_dir):
+    """stream everything out of the workbook into out_dir. returns {what: count}."""
+    out_dir = Path(out_dir)
+    counts = {}
+    wb = openpyxl.load_workbook(str(input_path), read_only=True, data_only=True)
+    try:
+        for profession, sheet in l2_sheets(wb).items():
+            path = out_dir / "specialties" / f"{_slug(profession)}.yaml"
+            with YamlListWriter(path, f"# {profession} specialty raw data — all 38 L2 columns, "
+                                      f"extracted from {Path(input_path).name}",
+                                {"profession": profession}, "specialties") as out:
+                for spec in iter_specialties(wb[sheet]):
+                    out.append(spec)
+            counts[sheet] = out.count
+            print(f"  {sheet}: {out.count} specialties -> {path}")
+
+        if FRAMEWORK_SHEET in wb.sheetnames:
+            path = out_dir / "data_points_framework.yaml"
+            with YamlListWriter(path, "# All 107 data points — master catalog extracted from "
+                                      "Excel Data Points Framework sheet", None, "data_points") as out:
+                for point in iter_data_points(wb[FRAMEWORK_SHEET]):
+                    out.append(point)
+            counts[FRAMEWORK_SHEET] = out.count
+            print(f"  {FRAMEWORK_SHEET}: {out.count} data points -> {path}")
+
+        if L1_SHEET in wb.sheetnames:
+            l1 = read_l1(wb[L1_SHEET])
+            path = out_dir / "l1_scores.yaml"
+            with open(path, "w") as f:
+                f.write("# L1 profession-level category scores — extracted from L1 Scoring Results, "
+                        "with data point labels\n")
+                yaml.dump({"professions": {p: {"l1_only": {}, "l1_data_points": cats}
+                                           for p, cats in l1.items()}},
+                          f, Dumper=Dumper, sort_keys=False, allow_unicode=True)
+            counts[L1_SHEET] = sum(len(cats) for cats in l1.values())
+            print(f"  {L1_SHEET}: {len(l1)} professions -> {path}")
+    finally:
+        wb.close()
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Single-pass streaming extraction of the career workbook")
+    parser.add_argument("--family", default="healthcare", help="profession family slug")
+    parser.add_argument("--input", help=f"workbook path (default: data/<family>/archive/{WORKBOOK_NAME})")
+    parser.add_argument("--out", help="output directory (default: data/<family>/archive/extracted)")
+    parser.add_argument("--memory", action="store_true", help="report peak traced memory")
+    args = parser.parse_args()
+
+    archive = REPO_ROOT / "data" / args.family / "archive"
+    input_path = Path(args.input) if args.input else archive / WORKBOOK_NAME
+    out_dir = Path(args.out) if args.out else archive / "extracted"
+    if not input_path.exists():
+        print(f"ERROR: {input_path} not found", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"reading {input_path} (read-only, streaming)...")
+    if args.memory:
+        tracemalloc.start()
+    t0 = time.perf_counter()
+    counts = extract(input_path, out_dir)
+    elapsed = time.perf_counter() - t0
+    print(f"\ndone! {sum(counts.values())} rows from {len(counts)} sheets in {elapsed:.2f}s -> {out_dir}/")
+    if args.memory:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"peak traced memory: {peak / 1024 / 1024:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
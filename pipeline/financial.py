@@ -5,6 +5,8 @@ computes net worth trajectory from financial assumptions,
 builds the money scoreboard data, and derives training timelines.
 """
 
+import re
+
 from scoring import _parse_numeric
 
 
@@ -469,13 +471,23 @@ PROFESSION_DEFAULTS = {
 }
 
 
-def derive_financial_params(spec, profession):
-    """Derive financial model params from raw specialty data + profession defaults.
+def financial_defaults_for(profession):
+    """Return the profession-level financial defaults (MD/DO if unknown)."""
+    return PROFESSION_DEFAULTS.get(profession, PROFESSION_DEFAULTS["MD/DO"])
+
+
+_FELLOWSHIP_YEARS = re.compile(r'(\d+)\s*(?:-\s*(\d+))?\s*yr')
 
-    Uses per-specialty fields: startSalary, midSalary, peakSalary, residencyYears, malpracticeCost
-    Uses profession-level defaults for: school cost, debt, trainee salary, overhead, etc.
+
+def track_financial_params(spec, profession):
+    """The financial params a specialty sets itself — everything but the profession defaults.
+
+    Uses per-specialty fields: startSalary, midSalary, peakSalary, residencyYears, malpracticeCost.
+    None of these keys is a profession default, so this is exactly what a
+    track stores (the output holds the defaults once per profession, in
+    profession_financial_defaults).
     """
-    defaults = PROFESSION_DEFAULTS.get(profession, PROFESSION_DEFAULTS["MD/DO"])
+    defaults = financial_defaults_for(profession)
 
     res_yrs = _parse_numeric(spec.get("residencyYears", 3))
     if res_yrs is None:
@@ -486,8 +498,7 @@ def derive_financial_params(spec, profession):
     fellow_text = spec.get("fellowshipOptions")
     if fellow_text and isinstance(fellow_text, str):
         # try to extract fellowship years from text like "Optional 1-2yr"
-        import re
-        m = re.search(r'(\d+)\s*(?:-\s*(\d+))?\s*yr', fellow_text.lower())
+        m = _FELLOWSHIP_YEARS.search(fellow_text.lower())
         if m:
             # use the lower bound
             fellowship_years = int(m.group(1))
@@ -503,7 +514,6 @@ def derive_financial_params(spec, profession):
     typical_peak = spec.get("typicalPeak", round(mid_salary * 1.2))
 
     return {
-        **defaults,
         "residency_years": res_yrs,
         "fellowship_years": fellowship_years,
         "age_independent": age_independent,
@@ -515,12 +525,31 @@ def derive_financial_params(spec, profession):
     }
 
 
+def derive_financial_params(spec, profession):
+    """Derive financial model params from raw specialty data + profession defaults.
+
+    Uses per-specialty fields (see track_financial_params) on top of the
+    profession-level defaults for school cost, debt, trainee salary, overhead, etc.
+    """
+    return {**financial_defaults_for(profession), **track_financial_params(spec, profession)}
+
+
+def resolve_financial(financial, profession, defaults_table=None):
+    """Rebuild the full financial params from a track's financial dict (track_financial_params).
+
+    defaults_table is the output's profession_financial_defaults; without it
+    the pipeline's own PROFESSION_DEFAULTS are used.
+    """
+    defaults = (defaults_table or {}).get(profession) or financial_defaults_for(profession)
+    return {**defaults, **financial}
+
+
 def derive_timeline(spec, profession):
     """Derive training timeline from raw specialty data + profession defaults.
 
     Returns dict with training phases for the Timeline tab.
     """
-    defaults = PROFESSION_DEFAULTS.get(profession, PROFESSION_DEFAULTS["MD/DO"])
+    defaults = financial_defaults_for(profession)
 
     res_yrs = _parse_numeric(spec.get("residencyYears", 3))
     if res_yrs is None:
@@ -530,8 +559,7 @@ def derive_timeline(spec, profession):
     fellowship_years = 0
     fellow_text = spec.get("fellowshipOptions")
     if fellow_text and isinstance(fellow_text, str):
-        import re
-        m = re.search(r'(\d+)\s*(?:-\s*(\d+))?\s*yr', fellow_text.lower())
+        m = _FELLOWSHIP_YEARS.search(fellow_text.lower())
         if m:
             fellowship_years = int(m.group(1))
 
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+ground_truth.py — computed scores vs the excel-era ground truth
+
+data/<family>/ground_truth.yaml holds the category scores and scenario
+totals the original spreadsheet computed for the finalists. this joins
+them to a family's computed tracks as two matrices (finalists x categories,
+finalists x scenarios) and reports absolute error statistics: mean and max
+overall and per column, plus every cell off by more than OUTLIER_ABS.
+
+the scoring model has moved on since the spreadsheet (annualSpots replaced
+matchComp, more data points), so the errors aren't zero. what matters is
+that they don't move: ground_truth_baseline.json records the stats, and any
+mean or max that shifts by more than the tolerance fails — a scoring
+refactor or a faster engine has to reproduce them exactly.
+test_regression.py runs this on its in-process builds.
+
+usage:
+  python ground_truth.py                   # every family with a ground_truth.yaml
+  python ground_truth.py --family healthcare
+  python ground_truth.py --save-baseline   # re-record after an intentional change
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+
+from config import list_families
+from yaml_reader import load_ground_truth
+
+BASELINE_PATH = Path(__file__).parent / "ground_truth_baseline.json"
+
+# a single cell this far from the ground truth is listed as an outlier
+OUTLIER_ABS = 1.0
+# how far a baseline stat may move before the check fails
+TOLERANCE = 0.001
+
+
+def join(tracks, truth, field, column_key):
+    """(row keys, column ids, truth matrix, computed matrix) for one ground truth table.
+
+    truth is {track key: {column: value}}; column_key maps a column id to
+    the key in track[field]. cells missing on either side are nan.
+    """
+    rows = sorted(truth)
+    cols = sorted({c for values in truth.values() for c in values},
+                  key=lambda c: (isinstance(c, str), c))
+    row_ix = {k: i for i, k in enumerate(rows)}
+    col_ix = {c: j for j, c in enumerate(cols)}
+
+    expected = np.full((len(rows), len(cols)), np.nan)
+    computed = np.full((len(rows), len(cols)), np.nan)
+    for key, values in truth.items():
+        expected[row_ix[key], [col_ix[c] for c in values]] = list(values.values())
+    for track in tracks:
+        i = row_ix.get(track["key"])
+        if i is None:
+            continue
+        values = track.get(field, {})
+        computed[i] = [values.get(column_key(c), np.nan) for c in cols]
+    return rows, cols, expected, computed
+
+
+def error_stats(rows, cols, expected, computed, outlier=OUTLIER_ABS):
+    """mean / max absolute error overall and per column, plus outlier cells."""
+    err = np.abs(computed - expected)
+    present = ~np.isnan(err)
+    missing = [f"{rows[i]}/{cols[j]}" for i, j in zip(*np.nonzero(~present & ~np.isnan(expected)))]
+
+    def summary(e):
+        e = e[~np.isnan(e)]
+        if not e.size:
+            return {"n": 0, "mae": None, "max": None}
+        return {"n": int(e.size), "mae": round(float(e.mean()), 4), "max": round(float(e.max()), 4)}
+
+    stats = {
+        "overall": summary(err),
+        "columns": {str(c): summary(err[:, j]) for j, c in enumerate(cols)},
+        "missing": missing,
+        "outliers": [],
+    }
+    for i, j in sorted(zip(*np.nonzero(present & (err > outlier))), key=lambda ij: -err[ij]):
+        stats["outliers"].append({
+            "track": rows[i], "column": str(cols[j]),
+            "expected": float(expected[i, j]), "computed": float(computed[i, j]),
+        })
+    return stats
+
+
+def check_output(family_slug, output):
+    """error stats for one family output, or None if it has no ground truth."""
+    category_scores, scenario_totals = load_ground_truth(family_slug)
+    if not category_scores and not scenario_totals:
+        return None
+    report = {}
+    if category_scores:
+        report["categories"] = error_stats(*join(
+            output["tracks"], category_scores, "scores", lambda c: f"category_{c}"))
+    if scenario_totals:
+        report["scenarios"] = error_stats(*join(
+            output["tracks"], scenario_totals, "scenario_totals", str))
+    return report
+
+
+def baseline_stats(report):
+    """the part of a report the baseline keeps: mean / max per table and column."""
+    return {
+        table: {"overall": stats["overall"], "columns": stats["columns"]}
+        for table, stats in report.items()
+    }
+
+
+def compare_to_baseline(family_slug, report, baseline, tolerance=TOLERANCE):
+    """messages for every stat that moved more than tolerance from the baseline."""
+    base = baseline.get(family_slug)
+    if base is None:
+        return [f"{family_slug}: no ground truth baseline — run ground_truth.py --save-baseline"]
+    moved = []
+    for table, stats in baseline_stats(report).items():
+        base_table = base.get(table, {})
+        entries = [("overall", stats["overall"], base_table.get("overall"))]
+        entries += [(c, s, base_table.get("columns", {}).get(c)) for c, s in stats["columns"].items()]
+        for column, cur, old in entries:
+            if old is None:
+                moved.append(f"{family_slug} {table}.{column}: not in the baseline")
+                continue
+            for stat in ("mae", "max"):
+                if cur[stat] is None or old[stat] is None:
+                    if cur[stat] != old[stat]:
+                        moved.append(f"{family_slug} {table}.{column} {stat}: {old[stat]} -> {cur[stat]}")
+                elif abs(cur[stat] - old[stat]) > tolerance:
+                    direction = "worse" if cur[stat] > old[stat] else "better"
+                    moved.append(f"{family_slug} {table}.{column} {stat}: "
+                                 f"{old[stat]:.4f} -> {cur[stat]:.4f} ({direction})")
+    return moved
+
+
+def format_report(family_slug, report, outlier_limit=5):
+    """printable lines for one family's report."""
+    lines = []
+    for table, stats in report.items():
+        o = stats["overall"]
+        if not o["n"]:
+            lines.append(f"{family_slug} {table}: no comparable cells")
+            continue
+        lines.append(f"{family_slug} {table}: {o['n']} cells, mae {o['mae']:.3f}, max {o['max']:.3f}, "
+                     f"{len(stats['outliers'])} outliers (> {OUTLIER_ABS:g})")
+        cols = "  ".join(
+            f"{c}:{s['mae']:.2f}/{s['max']:.2f}" for c, s in stats["columns"].items() if s["n"]
+        )
+        lines.append(f"    mae/max by column  {cols}")
+        for cell in stats["outliers"][:outlier_limit]:
+            lines.append(f"    outlier {cell['track']}/{cell['column']}: "
+                         f"{cell['expected']:g} expected, {cell['computed']:g} computed")
+        if outlier_limit and len(stats["outliers"]) > outlier_limit:
+            lines.append(f"    ... and {len(stats['outliers']) - outlier_limit} more outliers")
+        if stats["missing"]:
+            lines.append(f"    missing from the output: {', '.join(stats['missing'][:10])}")
+    return lines
+
+
+def ground_truth_families():
+    """families that ship a ground_truth.yaml."""
+    return [fam for fam in list_families() if load_ground_truth(fam)[0] is not None]
+
+
+def load_baseline(path=BASELINE_PATH):
+    path = Path(path)
+    return json.loads(path.read_text()) if path.exists() else {}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Computed scores vs the excel-era ground truth")
+    parser.add_argument("--family", action="append", help="family slug (default: all with ground truth)")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE,
+                        help="allowed change in any mean / max error vs the baseline")
+    parser.add_argument("--baseline", default=str(BASELINE_PATH), help="baseline json path")
+    parser.add_argument("--save-baseline", action="store_true", help="write results as the new baseline")
+    args = parser.parse_args()
+
+    from process import build_family
+
+    families = args.family or ground_truth_families()
+    reports = {}
+    for fam in families:
+        with contextlib.redirect_stdout(io.StringIO()):
+            output = build_family(fam)
+        report = check_output(fam, output)
+        if report is None:
+            print(f"{fam}: no ground_truth.yaml — skipped")
+            continue
+        reports[fam] = report
+        for line in format_report(fam, report):
+            print(line)
+
+    baseline_path = Path(args.baseline)
+    if args.save_baseline:
+        baseline = load_baseline(baseline_path)
+        baseline.update({fam: baseline_stats(r) for fam, r in reports.items()})
+        baseline_path.write_text(json.dumps(baseline, indent=2) + "\n")
+        print(f"\nsaved baseline to {baseline_path}")
+        return
+
+    baseline = load_baseline(baseline_path)
+    moved = [m for fam, r in reports.items()
+             for m in compare_to_baseline(fam, r, baseline, args.tolerance)]
+    if moved:
+        print(f"\nFAILED — {len(moved)} stats moved from the baseline (tolerance {args.tolerance:g}):")
+        for m in moved:
+            print(f"  x {m}")
+        sys.exit(1)
+    print(f"\nPASSED — ground truth errors match the baseline for {len(reports)} families")
+
+
+if __name__ == "__main__":
+    main()
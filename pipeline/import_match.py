@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+"""
+import_match.py — annualSpots and annualGraduates from match / position exports
+
+process.py turns annualSpots (per specialty) and annualGraduates (per
+profession, in config.yaml) into oneInX and matchComp, and matchComp
+drives the stress test's "failure to match" score. both numbers were kept
+by hand (and by replace_matchcomp.py). this reads local CSV exports:
+
+- match / position data: one row per program (or per specialty) with a
+  name and a position count; rows are matched to specialties by name and
+  summed into annualSpots
+- graduates (--graduates): family, profession, annualGraduates per row
+
+program names rarely match ours exactly ("Orthopaedic Surgery",
+"Otolaryngology - Head and Neck Surgery"), so names are looked up in an
+index of every family's specialty names: normalized tokens narrow the
+candidates, difflib scores them, and a match has to clear --min-score
+and beat the runner-up. each distinct name is resolved once. rows that
+don't clear the bar, or that match two specialties equally (the same name
+in two families — give a family / profession column), are reported with
+their best guess, not applied, and the run exits 1.
+
+before anything is written it prints how oneInX, matchComp and the stress
+match score would change, using process.py's and stress.py's own
+formulas. edits go through patch_fields (comments kept, atomic writes).
+
+usage:
+  python import_match.py nrmp_programs.csv --graduates grads.csv --dry-run
+  python import_match.py positions.csv --name-col program --spots-col quota --family healthcare
+"""
+
+import argparse
+import csv
+import difflib
+import re
+import sys
+from pathlib import Path
+
+import yaml
+
+from config import list_families
+from patch_fields import DATA_DIR, Loader, Update, YamlFile, apply_updates, mapping_child
+from process import compute_one_in_x, one_in_x_to_match_comp
+from stress import derive_stress_scores
+
+DEFAULT_MIN_SCORE = 0.85
+# the best candidate has to beat the next one by this much
+MIN_MARGIN = 0.05
+
+# column names tried, in order, when --*-col isn't given
+NAME_COLUMNS = ("specialty", "program", "program_name", "name", "specialty_name")
+SPOTS_COLUMNS = ("positions", "positions_offered", "annual_spots", "annualspots", "spots", "quota")
+FAMILY_COLUMNS = ("family",)
+PROFESSION_COLUMNS = ("profession",)
+GRADUATE_COLUMNS = ("annualgraduates", "annual_graduates", "graduates")
+
+_STOPWORDS = {"and", "the", "of", "in", "for"}
+_SYNONYMS = {"orthopaedic": "orthopedic", "paediatric": "pediatric", "paediatrics": "pediatrics",
+             "gynaecology": "gynecology", "anaesthesiology": "anesthesiology"}
+
+
+def normalize(name):
+    """lowercase tokens with punctuation, stopwords and british spellings ironed out."""
+    tokens = re.findall(r"[a-z0-9]+", name.lower().replace("&", " and "))
+    return [_SYNONYMS.get(t, t) for t in tokens if t not in _STOPWORDS]
+
+
+class NameIndex:
+    """every specialty name of some families, for fuzzy lookup."""
+
+    def __init__(self, entries, min_score=DEFAULT_MIN_SCORE):
+        # entries: [(family, profession, name)]
+        self.entries = entries
+        self.min_score = min_score
+        self._norm = [" ".join(normalize(name)) for _, _, name in entries]
+        self._sorted = [" ".join(sorted(n.split())) for n in self._norm]
+        # "Pediatrics (General)" should be what "Pediatrics" finds
+        self._base = [" ".join(normalize(re.sub(r"\(.*?\)", " ", name))) for _, _, name in entries]
+        self._tokens = {}
+        for i, norm in enumerate(self._norm):
+            for token in set(norm.split()):
+                self._tokens.setdefault(token, set()).add(i)
+        self._cache = {}
+
+    def _score(self, query, i):
+        norm, srt = " ".join(query), " ".join(sorted(query))
+        return max(difflib.SequenceMatcher(None, norm, self._norm[i]).ratio(),
+                   difflib.SequenceMatcher(None, srt, self._sorted[i]).ratio(),
+                   difflib.SequenceMatcher(None, norm, self._base[i]).ratio())
+
+    def lookup(self, name, family=None, profession=None):
+        """(entry or None, score, best guess, entry tied with it) for a program name.
+
+        guess is None when nothing was scored; the tied entry is None unless
+        another entry scored exactly as well.
+        """
+        key = (name, family, profession)
+        if key not in self._cache:
+            query = normalize(name)
+            candidates = set().union(*(self._tokens.get(t, set()) for t in query)) if query else set()
+            if not candidates:
+                candidates = range(len(self.entries))
+            scored = sorted(
+                ((self._score(query, i), i) for i in candidates
+                 if (family is None or self.entries[i][0] == family)
+                 and (profession is None or self.entries[i][1] == profession)),
+                reverse=True,
+            )
+            if not scored:
+                self._cache[key] = (None, 0.0, None, None)
+            else:
+                best_score, best = scored[0]
+                runner_up, second = scored[1] if len(scored) > 1 else (0.0, None)
+                # the same name in two families / professions scores the same
+                # twice: that's ambiguous, not a match for whichever sorts first
+                tied = self.entries[second] if second is not None and runner_up == best_score else None
+                ok = tied is None and (" ".join(query) == self._norm[best] or (
+                    best_score >= self.min_score and best_score - runner_up >= MIN_MARGIN))
+                entry = self.entries[best]
+                self._cache[key] = (entry if ok else None, best_score, entry, tied)
+        return self._cache[key]
+
+
+# ── reading ──
+
+def _header_key(name):
+    """"Positions Offered", "positions_offered" and "positions-offered" all match."""
+    return re.sub(r"[\s_-]+", "", name.strip().lower())
+
+
+def _column(fieldnames, explicit, options, what, path, required=True):
+    keyed = {_header_key(f): f for f in fieldnames}
+    for name in ([explicit] if explicit else options):
+        if name and _header_key(name) in keyed:
+            return keyed[_header_key(name)]
+    if required:
+        raise ValueError(f"{path}: no {what} column (tried {', '.join([explicit] if explicit else options)})")
+    return None
+
+
+def _count(cell):
+    try:
+        return int(float(cell.replace(",", "").strip()))
+    except (ValueError, AttributeError):
+        return None
+
+
+def read_positions(paths, name_col=None, spots_col=None):
+    """[(source, name, family or None, profession or None, positions)] from match / position csvs."""
+    rows = []
+    for path in paths:
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            reader = csv.DictReader(f)
+            fields = reader.fieldnames or []
+            name_c = _column(fields, name_col, NAME_COLUMNS, "name", path)
+            spots_c = _column(fields, spots_col, SPOTS_COLUMNS, "positions", path)
+            fam_c = _column(fields, None, FAMILY_COLUMNS, "family", path, required=False)
+            prof_c = _column(fields, None, PROFESSION_COLUMNS, "profession", path, required=False)
+            for row in reader:
+                rows.append((
+                    f"{path}:{reader.line_num}", (row[name_c] or "").strip(),
+                    (row[fam_c] or "").strip() or None if fam_c else None,
+                    (row[prof_c] or "").strip() or None if prof_c else None,
+                    _count(row[spots_c]),
+                ))
+    return rows
+
+
+def read_graduates(path):
+    """{(family, profession): annualGraduates}."""
+    grads = {}
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.DictReader(f)
+        fields = reader.fieldnames or []
+        fam_c = _column(fields, None, FAMILY_COLUMNS, "family", path)
+        prof_c = _column(fields, None, PROFESSION_COLUMNS, "profession", path)
+        grads_c = _column(fields, None, GRADUATE_COLUMNS, "graduates", path)
+        for row in reader:
+            count = _count(row[grads_c])
+            if count is None:
+                raise ValueError(f"{path}:{reader.line_num}: can't read a count from {row[grads_c]!r}")
+            grads[((row[fam_c] or "").strip(), (row[prof_c] or "").strip())] = count
+    return grads
+
+
+def load_family(data_dir, family):
+    """(config dict, [specialty dicts with 'profession']) read straight from data_dir."""
+    fam_dir = Path(data_dir) / family
+    with open(fam_dir / "config.yaml") as f:
+        cfg = yaml.load(f, Loader=Loader)
+    specs = []
+    for path in sorted((fam_dir / "specialties").glob("*.yaml")):
+        with open(path) as f:
+            data = yaml.load(f, Loader=Loader)
+        for spec in data["specialties"]:
+            spec["profession"] = data["profession"]
+            specs.append(spec)
+    return cfg, specs
+
+
+# ── matching + diff ──
+
+def match_rows(rows, index):
+    """sum positions per specialty. returns ({(family, profession, name): spots}, problems)."""
+    spots, problems, unmatched = {}, [], {}
+    for source, name, family, profession, positions in rows:
+        if positions is None:
+            problems.append(f"{source}: no position count for {name!r} — skipped")
+            continue
+        entry, score, guess, tied = index.lookup(name, family, profession)
+        if entry is None:
+            unmatched.setdefault(name, [source, 0, score, guess, tied])[1] += 1
+            continue
+        spots[entry] = spots.get(entry, 0) + positions
+    for name, (source, n, score, guess, tied) in unmatched.items():
+        if tied:
+            problems.append(f"{source}: {name!r} is ambiguous, {n} rows: {'/'.join(guess)} and "
+                            f"{'/'.join(tied)} match equally ({score:.2f}) — add a family / profession column")
+            continue
+        hint = f" (best: {guess[0]}/{guess[2]}, {score:.2f})" if guess else ""
+        problems.append(f"{source}: {name!r} matched no specialty, {n} rows{hint}")
+    return spots, problems
+
+
+def difficulty(spec, grads):
+    """(oneInX, matchComp, stress match) for a spec under a graduate count."""
+    one_in_x = compute_one_in_x(grads, spec.get("annualSpots", 0))
+    match_comp = one_in_x_to_match_comp(one_in_x)
+    stress = derive_stress_scores({**spec, "matchComp": match_comp}, spec["profession"])
+    return one_in_x, match_comp, stress["match"]
+
+
+def diff_family(cfg, specs, family, new_spots, new_grads):
+    """[(label, changes)] for every specialty whose spots or derived scores move."""
+    rows = []
+    for spec in specs:
+        prof = spec["profession"]
+        grads = cfg["professions"].get(prof, {}).get("annualGraduates", 0)
+        grads_new = new_grads.get((family, prof), grads)
+        spots_new = new_spots.get((family, prof, spec["name"]), spec.get("annualSpots", 0))
+        before = (spec.get("annualSpots", 0),) + difficulty(spec, grads)
+        after = (spots_new,) + difficulty({**spec, "annualSpots": spots_new}, grads_new)
+        if before != after:
+            rows.append((f"{family}/{prof}/{spec['name']}", before, after))
+    return rows
+
+
+def print_diff(rows, verbose=False):
+    """the diff table; rows where only oneInX moves are counted unless verbose."""
+    names = ("spots", "oneInX", "matchComp", "stress.match")
+    shown = [r for r in rows if verbose or r[1][0] != r[2][0] or r[1][2:] != r[2][2:]]
+    print(f"\n{'specialty':<60} " + " ".join(f"{n:>15}" for n in names))
+    for label, before, after in shown:
+        cells = [f"{b}" if b == a else f"{b}->{a}" for b, a in zip(before, after)]
+        flag = " *" if before[2:] != after[2:] else ""
+        print(f"{label[:60]:<60} " + " ".join(f"{c:>15}" for c in cells) + flag)
+    if len(shown) < len(rows):
+        print(f"... and {len(rows) - len(shown)} more where only oneInX moves (-v to list)")
+    moved = sum(1 for _, b, a in rows if b[2:] != a[2:])
+    print(f"\n{len(rows)} specialties change, {moved} with a new matchComp or stress match (*)")
+
+
+def write_graduates(data_dir, new_grads, dry_run=False):
+    """set professions.<prof>.annualGraduates in each config.yaml. returns (written, problems)."""
+    written, problems = [], []
+    by_family = {}
+    for (family, prof), count in new_grads.items():
+        by_family.setdefault(family, {})[prof] = count
+    for family, counts in by_family.items():
+        path = Path(data_dir) / family / "config.yaml"
+        if not path.exists():
+            problems.append(f"graduates: no family '{family}'")
+            continue
+        doc = YamlFile(path)
+        professions = mapping_child(doc.root, "professions")
+        for prof, count in counts.items():
+            node = mapping_child(professions, prof) if professions else None
+            if node is None:
+                problems.append(f"graduates: no profession '{prof}' in {family}")
+                continue
+            doc.set_in(node, "annualGraduates", count)
+        try:
+            if doc.save(dry_run):
+                written.append(path)
+        except ValueError as e:
+            problems.append(f"graduates: {e}")
+    return written, problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="annualSpots / annualGraduates from match and position exports")
+    parser.add_argument("positions", nargs="*", help="match / position CSVs (name + position count per row)")
+    parser.add_argument("--graduates", help="CSV of family,profession,annualGraduates")
+    parser.add_argument("--family", action="append", help="only match against these families (repeatable)")
+    parser.add_argument("--name-col", help=f"program / specialty name column (default: first of {', '.join(NAME_COLUMNS)})")
+    parser.add_argument("--spots-col", help=f"position count column (default: first of {', '.join(SPOTS_COLUMNS)})")
+    parser.add_argument("--min-score", type=float, default=DEFAULT_MIN_SCORE, help="fuzzy match threshold (0-1)")
+    parser.add_argument("--data-dir", default=str(DATA_DIR), help="data directory (default: repo data/)")
+    parser.add_argument("--dry-run", action="store_true", help="print the diff without writing")
+    parser.add_argument("--verbose", "-v", action="store_true", help="list rows where only oneInX moves too")
+    args = parser.parse_args()
+    if not args.positions and not args.graduates:
+        parser.error("give position CSVs, --graduates, or both")
+
+    try:
+        rows = read_positions(args.positions, args.name_col, args.spots_col)
+        new_grads = read_graduates(args.graduates) if args.graduates else {}
+    except (OSError, ValueError) as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    families = args.family or list_families(args.data_dir)
+    loaded = {fam: load_family(args.data_dir, fam) for fam in families}
+    index = NameIndex([(fam, s["profession"], s["name"]) for fam, (_, specs) in loaded.items() for s in specs],
+                      args.min_score)
+
+    new_spots, problems = match_rows(rows, index)
+    print(f"{len(rows)} position rows -> {len(new_spots)} specialties, "
+          f"{len(new_grads)} graduate counts")
+
+    diff = [r for fam, (cfg, specs) in loaded.items()
+            for r in diff_family(cfg, specs, fam, new_spots, new_grads)]
+    print_diff(diff, args.verbose)
+
+    updates = [Update(fam, prof, name, "annualSpots", count, "positions")
+               for (fam, prof, name), count in new_spots.items()]
+    applied, unmatched, written = apply_updates(updates, args.data_dir, args.dry_run)
+    grad_written, grad_problems = write_graduates(args.data_dir, new_grads, args.dry_run)
+    problems += grad_problems + [f"{u}: {reason}" for u, reason in unmatched]
+
+    verb = "would write" if args.dry_run else "wrote"
+    print(f"\n{verb} {len(written) + len(grad_written)} files")
+    for path in written + grad_written:
+        print(f"  {path}")
+    if problems:
+        print(f"\nFAILED — {len(problems)} rows not applied:")
+        for p in problems:
+            print(f"  x {p}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
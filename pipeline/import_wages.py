@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+import_wages.py — salary fields from BLS OES-format wage files
+
+startSalary / midSalary / typicalPeak / peakSalary were typed in by hand.
+this reads OES flat files (the BLS occupational employment and wage
+statistics layout: OCC_CODE, AREA_TYPE, I_GROUP, TOT_EMP, A_PCT10 ...
+A_PCT90, H_* hourly twins), maps occupation codes to specialties with a
+crosswalk, and turns wage percentiles into the four salary fields ($K):
+
+  startSalary  <- A_PCT25      typicalPeak <- A_PCT75
+  midSalary    <- A_MEDIAN     peakSalary  <- A_PCT90
+
+(override with --map field=COLUMN). the updates go through patch_fields,
+so comments and formatting in the yaml are kept and files are written
+atomically.
+
+wage files are streamed with pandas in chunks (--chunksize rows), reading
+only the columns used and keeping only rows for crosswalked codes, so a
+multi-hundred-MB file is never loaded whole. by default only national,
+cross-industry rows count (AREA_TYPE 1, I_GROUP cross-industry, where the
+file has those columns); --area picks one area code instead.
+
+OES marks suppressed wages "*" and top-coded ones "#" (at or above the
+published cap). an annual percentile that's missing falls back to the
+hourly one x 2080; a top-coded one is left alone and reported — physician
+P75 / P90 usually are.
+
+the crosswalk is a CSV of family, profession, specialty, occ_code (profession
+may be blank, as in patch_fields). a specialty mapped to several codes gets
+the employment-weighted mean of their percentiles, or the plain mean (and a
+note) when some code's employment is suppressed.
+
+usage:
+  python import_wages.py all_data_M_2024.csv --crosswalk wage_crosswalk.csv --dry-run -v
+  python import_wages.py oes.txt --sep '\\t' --crosswalk cw.csv --map startSalary=A_PCT10
+  python import_wages.py oes.csv --crosswalk cw.csv --emit updates.csv   # review, then patch_fields.py
+"""
+
+import argparse
+import csv
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from patch_fields import DATA_DIR, Update, apply_updates, render
+
+DEFAULT_MAP = {
+    "startSalary": "A_PCT25",
+    "midSalary": "A_MEDIAN",
+    "typicalPeak": "A_PCT75",
+    "peakSalary": "A_PCT90",
+}
+DEFAULT_CHUNKSIZE = 200_000
+HOURS_PER_YEAR = 2080
+
+# OES cell markers
+TOP_CODED = "#"
+SUPPRESSED = {"*", "**", ""}
+
+NATIONAL_AREA_TYPE = "1"
+CROSS_INDUSTRY = "cross-industry"
+
+
+def read_crosswalk(path):
+    """{occ code: [(family, profession, specialty, source)]}."""
+    crosswalk = {}
+    with open(path, newline="") as f:
+        reader = csv.DictReader(f)
+        missing = [c for c in ("family", "profession", "specialty", "occ_code")
+                   if c not in (reader.fieldnames or [])]
+        if missing:
+            raise ValueError(f"{path}: missing columns: {', '.join(missing)}")
+        for row in reader:
+            code = row["occ_code"].strip()
+            crosswalk.setdefault(code, []).append((
+                row["family"].strip(), row["profession"].strip(), row["specialty"].strip(),
+                f"{path}:{reader.line_num}",
+            ))
+    return crosswalk
+
+
+def _hourly(column):
+    """the hourly twin of an annual column (A_PCT25 -> H_PCT25), or None."""
+    return "H_" + column[2:] if column.startswith("A_") else None
+
+
+def _wages(values):
+    """OES wage cells as floats: suppressed and top-coded become nan."""
+    cleaned = values.str.replace(",", "", regex=False).str.strip()
+    return pd.to_numeric(cleaned.where(~cleaned.isin(SUPPRESSED | {TOP_CODED})), errors="coerce")
+
+
+def scan_wages(paths, codes, wage_columns, area=None, sep=",", chunksize=DEFAULT_CHUNKSIZE):
+    """stream wage files, keeping the rows for codes.
+
+    returns {occ code: [{"emp": n, column: dollars or nan or TOP_CODED, ...}]}
+    and the number of rows read.
+    """
+    hourly = {c: _hourly(c) for c in wage_columns}
+    needed = {"OCC_CODE", "TOT_EMP", "AREA", "AREA_TYPE", "I_GROUP"}
+    needed |= set(wage_columns) | {h for h in hourly.values() if h}
+
+    found, rows_read = {}, 0
+    for path in paths:
+        chunks = pd.read_csv(
+            path, sep=sep, dtype=str, keep_default_na=False, chunksize=chunksize,
+            usecols=lambda c: c.strip().upper() in needed, encoding_errors="replace",
+        )
+        for chunk in chunks:
+            rows_read += len(chunk)
+            chunk.columns = [c.strip().upper() for c in chunk.columns]
+            keep = chunk["OCC_CODE"].str.strip().isin(codes)
+            if area is not None:
+                keep &= chunk["AREA"].str.strip() == area
+            elif "AREA_TYPE" in chunk:
+                keep &= chunk["AREA_TYPE"].str.strip() == NATIONAL_AREA_TYPE
+            if "I_GROUP" in chunk and area is None:
+                keep &= chunk["I_GROUP"].str.strip().str.lower() == CROSS_INDUSTRY
+            rows = chunk[keep]
+            if rows.empty:
+                continue
+
+            emp = _wages(rows["TOT_EMP"]) if "TOT_EMP" in rows else pd.Series(np.nan, index=rows.index)
+            values = {}
+            for column, h in hourly.items():
+                raw = rows[column].str.strip() if column in rows else pd.Series("", index=rows.index)
+                annual = _wages(raw)
+                if h and h in rows:
+                    annual = annual.fillna(_wages(rows[h]) * HOURS_PER_YEAR)
+                values[column] = annual.astype(object).where(raw != TOP_CODED, TOP_CODED)
+            for i, code in enumerate(rows["OCC_CODE"].str.strip()):
+                found.setdefault(code, []).append(
+                    {"emp": emp.iat[i], **{c: values[c].iat[i] for c in wage_columns}})
+    return found, rows_read
+
+
+def salaries(rows, wage_map):
+    """{field: $K} for one specialty's wage rows, the fields that were top-coded,
+    and the fields averaged without weights.
+
+    several rows (codes) are combined by employment-weighted mean; if any
+    of them has suppressed employment the mean is unweighted (a stand-in
+    weight would be swamped by real counts in the thousands). a field any
+    row has top-coded is skipped.
+    """
+    result, top_coded, unweighted = {}, [], []
+    for field, column in wage_map.items():
+        cells = [(r["emp"], r[column]) for r in rows]
+        if any(v == TOP_CODED for _, v in cells):
+            top_coded.append(field)
+            continue
+        known = [(e, float(v)) for e, v in cells if not pd.isna(v)]
+        if not known:
+            continue
+        dollars = [v for _, v in known]
+        if all(not pd.isna(e) and e > 0 for e, _ in known):
+            mean = np.average(dollars, weights=[float(e) for e, _ in known])
+        else:
+            mean = np.mean(dollars)
+            if len(known) > 1:
+                unweighted.append(field)
+        result[field] = int(round(mean / 1000))
+    return result, top_coded, unweighted
+
+
+def build_updates(crosswalk, found, wage_map):
+    """(updates, notes) for every crosswalked specialty with wage data."""
+    by_specialty = {}
+    for code, targets in crosswalk.items():
+        for family, profession, specialty, source in targets:
+            entry = by_specialty.setdefault((family, profession, specialty), {"codes": [], "source": source})
+            entry["codes"].append(code)
+
+    updates, notes = [], []
+    for (family, profession, specialty), entry in by_specialty.items():
+        label = f"{entry['source']}: {family}/{profession + '/' if profession else ''}{specialty}"
+        rows = [r for code in entry["codes"] for r in found.get(code, [])]
+        missing = [c for c in entry["codes"] if c not in found]
+        if missing:
+            notes.append(f"{label}: no wage rows for {', '.join(missing)}")
+        if not rows:
+            continue
+        values, top_coded, unweighted = salaries(rows, wage_map)
+        if top_coded:
+            notes.append(f"{label}: top-coded, left as is: {', '.join(top_coded)}")
+        if unweighted:
+            notes.append(f"{label}: employment suppressed for some codes, unweighted mean: "
+                         f"{', '.join(unweighted)}")
+        if values.get("startSalary", 0) > values.get("midSalary", float("inf")) or \
+                values.get("typicalPeak", 0) > values.get("peakSalary", float("inf")):
+            notes.append(f"{label}: salaries out of order {values}")
+        for field, value in values.items():
+            updates.append(Update(family, profession, specialty, field, value,
+                                  f"{entry['source']} ({'+'.join(entry['codes'])})"))
+    return updates, notes
+
+
+def write_updates_csv(updates, path):
+    """the updates in patch_fields.py's CSV format."""
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["family", "profession", "specialty", "field", "value"])
+        for u in updates:
+            writer.writerow([u.family, u.profession or "", u.specialty, u.field, render(u.value)])
+
+
+def parse_map(items):
+    wage_map = dict(DEFAULT_MAP)
+    for item in items or []:
+        field, sep, column = item.partition("=")
+        if not sep or field not in DEFAULT_MAP:
+            raise argparse.ArgumentTypeError(
+                f"--map expects one of {', '.join(DEFAULT_MAP)}=COLUMN, got {item!r}")
+        wage_map[field] = column.strip().upper()
+    return wage_map
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Salary fields from OES-format wage files")
+    parser.add_argument("wages", nargs="+", help="OES flat files (csv / delimited text)")
+    parser.add_argument("--crosswalk", required=True, help="CSV of family,profession,specialty,occ_code")
+    parser.add_argument("--map", action="append", metavar="FIELD=COLUMN",
+                        help="wage column for a salary field (repeatable; default: "
+                             + ", ".join(f"{k}={v}" for k, v in DEFAULT_MAP.items()) + ")")
+    parser.add_argument("--area", help="AREA code to use instead of the national rows")
+    parser.add_argument("--sep", default=",", help="field separator (default ','; '\\t' for tab)")
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE, help="rows per chunk")
+    parser.add_argument("--data-dir", default=str(DATA_DIR), help="data directory (default: repo data/)")
+    parser.add_argument("--emit", help="write the updates as a patch_fields CSV instead of applying them")
+    parser.add_argument("--dry-run", action="store_true", help="report what would change without writing")
+    parser.add_argument("--verbose", "-v", action="store_true", help="list every update")
+    args = parser.parse_args()
+
+    wage_map = parse_map(args.map)
+    sep = "\t" if args.sep in ("\\t", "tab") else args.sep
+    try:
+        crosswalk = read_crosswalk(args.crosswalk)
+    except (OSError, ValueError) as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    t0 = time.perf_counter()
+    print(f"scanning {len(args.wages)} wage file(s) for {len(crosswalk)} occupation codes...")
+    found, rows_read = scan_wages(args.wages, set(crosswalk), list(wage_map.values()),
+                                  args.area, sep, args.chunksize)
+    updates, notes = build_updates(crosswalk, found, wage_map)
+    print(f"  {rows_read:,} rows read, {sum(len(r) for r in found.values())} matched, "
+          f"{len(updates)} salary updates ({time.perf_counter() - t0:.2f}s)")
+    for note in notes:
+        print(f"  ! {note}")
+
+    if args.emit:
+        write_updates_csv(updates, args.emit)
+        print(f"\nwrote {args.emit} — apply with: python patch_fields.py {args.emit}")
+        return
+
+    applied, unmatched, written = apply_updates(updates, args.data_dir, args.dry_run)
+    if args.verbose:
+        for u, old in applied:
+            print(f"  {u}: {old if old is not None else '(new)'} -> {render(u.value)}")
+    verb = "would write" if args.dry_run else "wrote"
+    print(f"\n{len(applied)} of {len(updates)} updates applied, {verb} {len(written)} files")
+    for path in written:
+        print(f"  {path}")
+    if unmatched:
+        print(f"\nFAILED — {len(unmatched)} updates didn't match:")
+        for u, reason in unmatched:
+            print(f"  x {u}: {reason}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
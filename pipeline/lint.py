@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+"""
+lint.py — check the YAML inputs before anything is scored
+
+the pipeline is forgiving on purpose: a missing peakSalary becomes 400, a
+missing rubric field just drops out of its category average, and a typo'd
+field name is never read at all. this catches those at the source, with
+file:line locations:
+
+- every specialty file against a field schema compiled from the family's
+  scoring_rubric.yaml plus data_points_framework.yaml (types and ranges
+  from each data point's data_type)
+- fields the pipeline reads with silent defaults are required; unknown
+  fields are errors, with a "did you mean" for near misses
+- duplicate yaml keys and duplicate specialty names
+- profession / group references against config.yaml
+- salaries that go backwards (start <= mid <= peak, typical <= peak)
+- the rubric itself: data points, categories and conversions
+
+families are linted in parallel processes. process.py lints before it
+scores, so a bad input fails the build immediately.
+
+usage:
+  python lint.py                                    # every family
+  python lint.py --family law
+  python lint.py ../data/law/specialties/jd.yaml    # just these files (pre-save hook)
+"""
+
+import argparse
+import difflib
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+
+import yaml
+
+from config import CATEGORIES, list_families
+from scoring import _parse_numeric
+
+REPO_ROOT = Path(__file__).parent.parent
+DATA_DIR = REPO_ROOT / "data"
+# the master data point catalog; a family can ship its own
+FRAMEWORK_PATH = DATA_DIR / "healthcare" / "data_points_framework.yaml"
+
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+CATEGORY_IDS = {cat["id"] for cat in CATEGORIES}
+CONVERSION_METHODS = {"passthrough", "linear"}
+
+# fields the pipeline reads directly rather than through the rubric
+PIPELINE_FIELDS = {
+    "name": {"kind": "text", "required": True},
+    "group": {"kind": "text", "required": True},
+    "annualSpots": {"kind": "number", "min": 0, "required": True},
+    "typicalPeak": {"kind": "number", "min": 0, "required": True},
+    "aiRiskNow": {"kind": "number", "min": 1, "max": 10, "required": True},
+    "aiRiskMedium": {"kind": "number", "min": 1, "max": 10, "required": True},
+    "aiRiskLong": {"kind": "number", "min": 1, "max": 10, "required": True},
+    "aiNarrative": {"kind": "text", "required": True},
+}
+
+# computed by process.annotate_difficulty; a value in the yaml is overwritten
+DERIVED_FIELDS = {"matchComp": "annualSpots", "oneInX": "annualSpots"}
+
+
+# ---- yaml with line numbers ----
+
+class Document:
+    """a parsed yaml file: the data plus the composed node tree for line lookups."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.display = _display(path)
+        text = self.path.read_text()
+        self.node = yaml.compose(text, Loader=Loader)
+        self.data = Loader(text).construct_document(self.node) if self.node else None
+
+    def where(self, node):
+        """'path:line' for a node (1-based line)."""
+        return f"{self.display}:{node.start_mark.line + 1}"
+
+
+def _display(path):
+    try:
+        return str(Path(path).resolve().relative_to(REPO_ROOT))
+    except ValueError:
+        return str(path)
+
+
+def _mapping_items(node):
+    """[(key, key node, value node)] for a mapping node."""
+    return [(k.value, k, v) for k, v in node.value]
+
+
+def _key_node(node, key):
+    """the value node for a key of a mapping node, or None."""
+    for k, _, v in _mapping_items(node):
+        if k == key:
+            return v
+    return None
+
+
+# ---- schema ----
+
+def _is_number(v):
+    return isinstance(v, (int, float)) and not isinstance(v, bool)
+
+
+def field_rule(field_def, data_point):
+    """the schema rule for one rubric field."""
+    conversion = field_def.get("conversion") or {}
+    data_type = (data_point or {}).get("data_type", "")
+    rule = {"required": field_def.get("type") == "decision"}
+
+    if conversion.get("method") == "passthrough" or data_type.startswith("Scale 1-10"):
+        rule.update(kind="number", min=1, max=10)
+    elif data_type == "Quantitative" and rule["required"]:
+        # decision fields go through _parse_numeric, so "5+2" is fine
+        rule.update(kind="numeric", min=0)
+        notes = f"{data_point.get('name', '')} {data_point.get('scoring_notes', '')}".lower()
+        if "%" in notes or "rate" in notes:
+            rule["max"] = 100
+    elif data_type == "Binary":
+        rule.update(kind="binary")
+    elif data_type in ("Qualitative", "Quantitative"):
+        rule.update(kind="text or number")
+    else:
+        rule.update(kind="any")
+    return rule
+
+
+def compile_schema(rubric, framework):
+    """{field: rule} for a family's specialties."""
+    schema = {}
+    for field, field_def in rubric.items():
+        if field in DERIVED_FIELDS:
+            continue
+        schema[field] = field_rule(field_def, framework.get(field_def.get("data_point_id")))
+    schema.update(PIPELINE_FIELDS)
+    return schema
+
+
+def check_value(value, rule):
+    """what's wrong with a value under a rule, or None."""
+    kind = rule["kind"]
+    if kind == "any" or value is None and not rule["required"]:
+        return None
+    if kind == "text":
+        return None if isinstance(value, str) and value.strip() else "expected non-empty text"
+    if kind == "text or number":
+        return None if isinstance(value, str) or _is_number(value) else "expected text or a number"
+    if kind == "binary":
+        return None if isinstance(value, (bool, str)) or value in (0, 1) else "expected yes/no"
+
+    if kind == "numeric" and isinstance(value, str):
+        num = _parse_numeric(value)
+        if num is None:
+            return f"can't read a number from {value!r}"
+    elif not _is_number(value):
+        return f"expected a number, got {value!r}"
+    else:
+        num = value
+    if rule.get("min") is not None and num < rule["min"]:
+        return f"{num:g} is below {rule['min']}"
+    if rule.get("max") is not None and num > rule["max"]:
+        return f"{num:g} is above {rule['max']}"
+    return None
+
+
+# ---- linting ----
+
+def _load(path, errors):
+    """a Document, or None after recording why it couldn't be read."""
+    try:
+        return Document(path)
+    except yaml.MarkedYAMLError as e:
+        mark = e.problem_mark or e.context_mark
+        line = mark.line + 1 if mark else 0
+        errors.append(f"{_display(path)}:{line}: yaml: {e.problem or e.context}")
+    except OSError as e:
+        errors.append(f"{_display(path)}:0: {e.strerror}")
+    return None
+
+
+@lru_cache(maxsize=None)
+def _read_framework(path):
+    with open(path) as f:
+        return {d["id"]: d for d in yaml.load(f, Loader=Loader)["data_points"]}
+
+
+def load_framework(family_slug):
+    """{data point id: data point} for a family (its own catalog or the master one)."""
+    path = DATA_DIR / family_slug / "data_points_framework.yaml"
+    return _read_framework(path if path.exists() else FRAMEWORK_PATH)
+
+
+def lint_rubric(doc, framework, errors):
+    """the rubric's own fields: data points, categories, conversions."""
+    fields = _key_node(doc.node, "fields")
+    if fields is None:
+        errors.append(f"{doc.where(doc.node)}: no 'fields' mapping")
+        return
+    for field, key_node, node in _mapping_items(fields):
+        where = doc.where(key_node)
+        field_def = doc.data["fields"][field]
+        dp = field_def.get("data_point_id")
+        if dp is not None and dp not in framework:
+            errors.append(f"{where}: {field}: data_point_id {dp} is not in the data points framework")
+        cats = field_def.get("categories", [field_def.get("category")])
+        for cat in cats if isinstance(cats, list) else [cats]:
+            if cat not in CATEGORY_IDS:
+                errors.append(f"{where}: {field}: unknown category {cat!r}")
+        if field_def.get("type") not in ("decision", "reference"):
+            errors.append(f"{where}: {field}: type must be decision or reference")
+        conversion = field_def.get("conversion")
+        if field_def.get("type") == "decision":
+            method = (conversion or {}).get("method")
+            if method not in CONVERSION_METHODS:
+                errors.append(f"{where}: {field}: unknown conversion method {method!r}")
+            elif method == "linear" and not (_is_number(conversion.get("min"))
+                                             and _is_number(conversion.get("max"))):
+                errors.append(f"{where}: {field}: linear conversion needs numeric min and max")
+
+
+def lint_specialty_file(doc, schema, cfg, errors, names):
+    """one data/<family>/specialties/*.yaml file. names collects specialty names seen."""
+    if not isinstance(doc.data, dict):
+        errors.append(f"{doc.display}:1: expected a mapping")
+        return
+    profession = doc.data.get("profession")
+    professions = cfg.get("professions") or {}
+    if profession is None:
+        errors.append(f"{doc.where(doc.node)}: missing 'profession'")
+    elif professions and profession not in professions:
+        errors.append(f"{doc.where(_key_node(doc.node, 'profession'))}: profession "
+                      f"'{profession}' is not in config.yaml professions")
+    specs = _key_node(doc.node, "specialties")
+    if specs is None or not isinstance(doc.data.get("specialties"), list):
+        errors.append(f"{doc.where(doc.node)}: missing 'specialties' list")
+        return
+
+    groups = cfg.get("groups") or {}
+    known = sorted(set(schema) | set(DERIVED_FIELDS))
+    for spec_node, spec in zip(specs.value, doc.data["specialties"]):
+        if not isinstance(spec, dict):
+            errors.append(f"{doc.where(spec_node)}: expected a specialty mapping")
+            continue
+        label = spec.get("name", "<unnamed>")
+        seen = set()
+        for field, key_node, value_node in _mapping_items(spec_node):
+            where = doc.where(key_node)
+            if field in seen:
+                errors.append(f"{where}: {label}: duplicate field '{field}' (the last one wins)")
+            seen.add(field)
+            if field in DERIVED_FIELDS:
+                errors.append(f"{where}: {label}: {field} is computed from "
+                              f"{DERIVED_FIELDS[field]}; this value is ignored")
+                continue
+            rule = schema.get(field)
+            if rule is None:
+                close = difflib.get_close_matches(field, known, n=1)
+                hint = f" (did you mean '{close[0]}'?)" if close else ""
+                errors.append(f"{where}: {label}: unknown field '{field}'{hint}")
+                continue
+            problem = check_value(spec[field], rule)
+            if problem:
+                errors.append(f"{doc.where(value_node)}: {label}: {field}: {problem}")
+
+        for field, rule in schema.items():
+            if rule["required"] and field not in spec:
+                errors.append(f"{doc.where(spec_node)}: {label}: missing {field}")
+
+        group = spec.get("group")
+        if groups and isinstance(group, str) and group not in groups:
+            errors.append(f"{doc.where(_key_node(spec_node, 'group'))}: {label}: "
+                          f"group '{group}' is not in config.yaml groups")
+
+        salaries = [spec.get(k) for k in ("startSalary", "midSalary", "peakSalary")]
+        if all(map(_is_number, salaries)) and not salaries[0] <= salaries[1] <= salaries[2]:
+            errors.append(f"{doc.where(spec_node)}: {label}: start/mid/peak salary "
+                          f"not increasing {salaries}")
+        typical, peak = spec.get("typicalPeak"), spec.get("peakSalary")
+        if _is_number(typical) and _is_number(peak) and typical > peak:
+            errors.append(f"{doc.where(spec_node)}: {label}: typicalPeak {typical} > peakSalary {peak}")
+
+        if isinstance(spec.get("name"), str):
+            if spec["name"] in names:
+                errors.append(f"{doc.where(spec_node)}: duplicate specialty name "
+                              f"'{spec['name']}' (also {names[spec['name']]})")
+            names.setdefault(spec["name"], doc.where(spec_node))
+
+
+def lint_family(family_slug, files=None):
+    """(family, files checked, errors) for one family; files limits the specialty files."""
+    errors = []
+    family_dir = DATA_DIR / family_slug
+    cfg_doc = _load(family_dir / "config.yaml", errors)
+    rubric_doc = _load(family_dir / "scoring_rubric.yaml", errors)
+    if cfg_doc is None or rubric_doc is None:
+        return family_slug, 0, errors
+
+    framework = load_framework(family_slug)
+    lint_rubric(rubric_doc, framework, errors)
+    schema = compile_schema(rubric_doc.data.get("fields") or {}, framework)
+
+    names = {}
+    paths = files or sorted((family_dir / "specialties").glob("*.yaml"))
+    for path in paths:
+        doc = _load(path, errors)
+        if doc is not None:
+            lint_specialty_file(doc, schema, cfg_doc.data or {}, errors, names)
+    return family_slug, len(paths), errors
+
+
+def _lint_args(args):
+    return lint_family(*args)
+
+
+def lint(families=None, files=None, jobs=None):
+    """lint families (default: all) or specific specialty files, in parallel.
+
+    returns [(family, files checked, errors)].
+    """
+    if files:
+        by_family = {}
+        for path in files:
+            path = Path(path).resolve()
+            by_family.setdefault(path.parent.parent.name, []).append(path)
+        work = list(by_family.items())
+    else:
+        work = [(fam, None) for fam in (families or list_families())]
+    jobs = min(jobs or os.cpu_count() or 1, len(work))
+    if jobs <= 1:
+        return [lint_family(*w) for w in work]
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(_lint_args, work))
+
+
+def print_results(results):
+    """print every error, then a per-family summary. returns True if clean."""
+    ok = True
+    for family, n_files, errors in results:
+        for e in errors:
+            print(e)
+        ok = ok and not errors
+    for family, n_files, errors in results:
+        status = f"{len(errors)} errors" if errors else "ok"
+        print(f"  {family:<14} {n_files:>3} files  {status}")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Lint the YAML inputs")
+    parser.add_argument("files", nargs="*", help="specialty yaml files (default: every family)")
+    parser.add_argument("--family", action="append", help="lint just this family (repeatable)")
+    parser.add_argument("--jobs", "-j", type=int, help="parallel processes (default: cpu count)")
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    results = lint(args.family, args.files, args.jobs)
+    ok = print_results(results)
+    n_errors = sum(len(errors) for _, _, errors in results)
+    print(f"\n{'PASSED' if ok else f'FAILED — {n_errors} errors'} "
+          f"in {(time.perf_counter() - t0) * 1000:.0f} ms")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
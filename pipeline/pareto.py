@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+pareto.py — Pareto frontiers (skylines) over career trade-offs
+
+a track is on the frontier of a trade-off set (say money vs free time) if
+no other track is at least as good on every metric and better on one.
+sets are pairs or triples of ranking metric ids (rankings.py), so
+direction is already known: "asc" metrics (hours, burnout, ...) count as
+better when lower.
+
+per family, the output gets
+
+  "pareto": [{"id": "radar:Money|radar:Free Time",
+              "metrics": ["radar:Money", "radar:Free Time"],
+              "frontier": [track index, ...],       best on the first metric first
+              "dominated": [track index, ...]}, ...]
+
+and the same sets over every family together go to
+src/public/data/pareto.json with "family/key" ids.
+
+the skylines are sort-and-sweep, O(n log n). 2D keeps the best second
+metric seen so far. 3D sweeps the first metric and keeps, per rank of the
+second metric, the best third metric seen so far in a max Fenwick tree, so
+"is anything at least as good on both" is one O(log n) query.
+families can override the sets with `pareto_sets:` in config.yaml.
+
+usage:
+  python pareto.py                        # global frontiers from src/data/*.json
+  python process.py --all --pareto        # right after the pipeline
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from compact import minify
+from rankings import ranking_metrics, metric_columns
+from shards import load_outputs
+
+REPO_ROOT = Path(__file__).parent.parent
+PARETO_PATH = REPO_ROOT / "src" / "public" / "data" / "pareto.json"
+
+DEFAULT_PARETO_SETS = [
+    ["radar:Money", "radar:Free Time"],
+    ["radar:Money", "radar:Robot-Proof"],
+    ["radar:Money", "radar:Hard to Get In"],
+    ["radar:Money", "radar:Free Time", "radar:Robot-Proof"],
+    ["typicalPeak", "hoursWeek"],
+    ["typicalPeak", "hoursWeek", "aiRiskAvg"],
+]
+
+
+# ---- skylines (every coordinate: higher is better) ----
+
+def _groups_by_first(points):
+    """indices grouped by equal first coordinate, highest first."""
+    firsts = [p[0] for p in points]
+    groups = []
+    for i in sorted(range(len(points)), key=firsts.__getitem__, reverse=True):
+        if groups and firsts[groups[-1][0]] == firsts[i]:
+            groups[-1].append(i)
+        else:
+            groups.append([i])
+    return groups
+
+
+def _skyline_2d(points):
+    """the non-dominated indices of 2D points."""
+    frontier = []
+    best_y = float("-inf")  # best y among strictly larger x
+    for group in _groups_by_first(points):
+        group_best = max(points[i][1] for i in group)
+        for i in group:
+            y = points[i][1]
+            if y > best_y and y == group_best:
+                frontier.append(i)
+        best_y = max(best_y, group_best)
+    return frontier
+
+
+def _skyline_3d(points):
+    """the non-dominated indices of 3D points.
+
+    sweeps x from high to low. `best` is a Fenwick tree over y ranks, highest
+    y first, holding the max z of every point with a strictly larger x; a
+    point is dominated from there iff the max z over y' >= y is >= z. ties
+    on x are settled with a 2D skyline inside the group. one query and one
+    update per point, O(log n) each.
+    """
+    rank = {y: r for r, y in enumerate(sorted({p[1] for p in points}, reverse=True), 1)}
+    best = [float("-inf")] * (len(rank) + 1)
+
+    def covered_z(r):  # max z over ranks 1..r, i.e. y' >= y
+        z = float("-inf")
+        while r:
+            z = max(z, best[r])
+            r -= r & -r
+        return z
+
+    def add(r, z):
+        while r < len(best):
+            if best[r] < z:
+                best[r] = z
+            r += r & -r
+
+    frontier = []
+    for group in _groups_by_first(points):
+        survivors = [i for i in group if covered_z(rank[points[i][1]]) < points[i][2]]
+        if survivors:
+            local = _skyline_2d([points[i][1:] for i in survivors])
+            frontier.extend(survivors[j] for j in local)
+        for i in group:
+            add(rank[points[i][1]], points[i][2])
+    return frontier
+
+
+def skyline(points):
+    """indices of the non-dominated points (every coordinate: higher is better).
+
+    points are 2- or 3-tuples; returned indices are in input order.
+    """
+    if not points:
+        return []
+    dims = len(points[0])
+    if dims == 2:
+        return sorted(_skyline_2d(points))
+    if dims == 3:
+        return sorted(_skyline_3d(points))
+    raise ValueError(f"skyline supports 2 or 3 metrics, got {dims}")
+
+
+# ---- frontiers ----
+
+def build_frontiers(columns, metrics, sets):
+    """one frontier entry per trade-off set, from per-metric value columns.
+
+    columns and metrics are what rankings.py uses: columns[col][i] is track
+    i's value for metrics[col].
+    """
+    col = {m["id"]: (c, m["order"]) for c, m in enumerate(metrics)}
+    n = len(columns[0]) if columns else 0
+    out = []
+    for metric_ids in sets:
+        unknown = [m for m in metric_ids if m not in col]
+        if unknown:
+            raise ValueError(f"pareto set {metric_ids}: unknown metrics {unknown}")
+        axes = [columns[col[m][0]] if col[m][1] == "desc" else [-v for v in columns[col[m][0]]]
+                for m in metric_ids]
+        points = list(zip(*axes))
+        frontier = skyline(points)
+        on_frontier = set(frontier)
+        out.append({
+            "id": "|".join(metric_ids),
+            "metrics": list(metric_ids),
+            "frontier": sorted(frontier, key=lambda i: (-points[i][0], i)),
+            "dominated": [i for i in range(n) if i not in on_frontier],
+        })
+    return out
+
+
+def build_global(outputs, sets=None):
+    """frontiers over every family's tracks together, with "family/key" ids.
+
+    only metrics every family shares (radar dimensions, raw fields) make
+    sense here — scenario ids differ per family.
+    """
+    metrics = ranking_metrics({})
+    ids = [f"{family}/{track['key']}" for family, output in outputs.items() for track in output["tracks"]]
+    tracks = [track for output in outputs.values() for track in output["tracks"]]
+    frontiers = build_frontiers(metric_columns(tracks, metrics), metrics, sets or DEFAULT_PARETO_SETS)
+    for f in frontiers:
+        f["frontier"] = [ids[i] for i in f["frontier"]]
+        f["dominated"] = [ids[i] for i in f["dominated"]]
+    return {"format": "pareto/1", "tracks": len(ids), "sets": frontiers}
+
+
+def write_global(pareto, path=PARETO_PATH):
+    """write the global frontiers minified. returns the path."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(minify(pareto))
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Global Pareto frontiers across every family")
+    parser.add_argument("--out", default=str(PARETO_PATH), help="output path")
+    args = parser.parse_args()
+
+    outputs = load_outputs()
+    if not outputs:
+        print("ERROR: no src/data/<family>.json outputs — run process.py first", file=sys.stderr)
+        sys.exit(1)
+    pareto = build_global(outputs)
+    path = write_global(pareto, args.out)
+    print(f"wrote {path}")
+    for f in pareto["sets"]:
+        print(f"  {f['id']:<52} {len(f['frontier']):>3} of {pareto['tracks']} on the frontier")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,378 @@
+#!/usr/bin/env python3
+"""
+patch_fields.py — bulk field updates across the specialty YAML files
+
+the general form of replace_matchcomp.py: takes a CSV or YAML list of
+(family, profession, specialty, field, value) updates and applies them to
+data/<family>/specialties/*.yaml.
+
+- each file is read and composed once; every update for it is applied as
+  an in-place text edit at the value's position, so comments, blank lines,
+  key order and quoting everywhere else are left exactly as they were
+- a field the specialty doesn't have yet is added as the last key of its
+  mapping
+- files are written atomically (temp file + rename), and only if changed
+- updates that don't match (unknown family / profession / specialty, or a
+  name that's ambiguous across professions) are reported, not applied
+- a file whose patched text no longer parses isn't written; its updates
+  are reported with the others that didn't apply
+
+profession may be left empty when the specialty name is unique in its
+family. CSV values are read as yaml scalars, so 5 is a number and "5"
+(quoted) a string.
+
+usage:
+  python patch_fields.py updates.csv
+  python patch_fields.py updates.yaml --dry-run
+  python patch_fields.py a.csv b.csv --data-dir /tmp/data
+"""
+
+import argparse
+import csv
+import json
+import os
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+
+REPO_ROOT = Path(__file__).parent.parent
+DATA_DIR = REPO_ROOT / "data"
+
+# libyaml's parser and emitter are several times faster when it's available
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+COLUMNS = ("family", "profession", "specialty", "field", "value")
+# strings that are safe to write unquoted (when the old value wasn't quoted)
+_PLAIN = re.compile(r"^[A-Za-z_][\w./+-]*$")
+
+
+class Update:
+    """one requested change; `source` is 'file:line' for reporting."""
+
+    __slots__ = ("family", "profession", "specialty", "field", "value", "source")
+
+    def __init__(self, family, profession, specialty, field, value, source):
+        self.family = family
+        self.profession = profession or None
+        self.specialty = specialty
+        self.field = field
+        self.value = value
+        self.source = source
+
+    def __repr__(self):
+        prof = f"{self.profession}/" if self.profession else ""
+        return f"{self.source}: {self.family}/{prof}{self.specialty}.{self.field}"
+
+
+# ── reading updates ──
+
+def read_csv(path):
+    updates = []
+    with open(path, newline="") as f:
+        reader = csv.DictReader(f)
+        missing = [c for c in COLUMNS if c not in (reader.fieldnames or [])]
+        if missing:
+            raise ValueError(f"{path}: missing columns: {', '.join(missing)}")
+        for row in reader:
+            raw = row["value"]
+            try:
+                value = yaml.load(raw, Loader=Loader) if raw.strip() else raw
+            except yaml.YAMLError:
+                value = raw
+            if isinstance(value, (list, dict)):
+                # "a: b" in a cell is text, not a mapping
+                value = raw
+            updates.append(Update(
+                row["family"].strip(), row["profession"].strip(), row["specialty"].strip(),
+                row["field"].strip(), value, f"{path}:{reader.line_num}",
+            ))
+    return updates
+
+
+def read_yaml(path):
+    with open(path) as f:
+        data = yaml.load(f, Loader=Loader)
+    if isinstance(data, dict):
+        data = data.get("updates")
+    if not isinstance(data, list):
+        raise ValueError(f"{path}: expected a list of updates (or an 'updates:' list)")
+    updates = []
+    for i, item in enumerate(data):
+        missing = [c for c in COLUMNS if c not in item and c != "profession"]
+        if missing:
+            raise ValueError(f"{path}: update {i + 1}: missing {', '.join(missing)}")
+        updates.append(Update(
+            str(item["family"]), str(item.get("profession") or ""), str(item["specialty"]),
+            str(item["field"]), item["value"], f"{path}[{i + 1}]",
+        ))
+    return updates
+
+
+def read_updates(paths):
+    updates = []
+    for path in paths:
+        reader = read_csv if Path(path).suffix.lower() == ".csv" else read_yaml
+        updates.extend(reader(path))
+    return updates
+
+
+# ── editing ──
+
+def _reads_back(text, value):
+    try:
+        return yaml.load(text, Loader=Loader) == value
+    except yaml.YAMLError:
+        return False
+
+
+def render(value, style=None):
+    """a value as yaml text for one line, in the style of the value it replaces.
+
+    style is the old scalar's: "" plain, "'" or '"' quoted, None for a new
+    field. strings stay plain only if they read back the same, and new
+    fields are only left unquoted for identifier-like strings.
+    """
+    if isinstance(value, str):
+        plain = style == "" or style is None and _PLAIN.match(value)
+        if plain and "\n" not in value and value == value.strip() and _reads_back(value, value):
+            return value
+        if style == "'" and "\n" not in value:
+            return "'" + value.replace("'", "''") + "'"
+        return json.dumps(value, ensure_ascii=False)
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, ensure_ascii=False)
+    return yaml.dump(value, Dumper=Dumper).split("\n")[0]
+
+
+class YamlFile:
+    """a yaml file's text plus its composed node tree, edited in place by position."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.text = self.path.read_text()
+        self._line_starts = [0] + [m.end() for m in re.finditer("\n", self.text)]
+        self.root = yaml.compose(self.text, Loader=Loader)
+        self.edits = {}  # (start, end, new field or "") -> text
+
+    def _offset(self, mark):
+        # libyaml's mark.index is off on non-ascii text; line / column aren't
+        return self._line_starts[mark.line] + mark.column
+
+    def _end(self, node):
+        """offset just past a value node's last character.
+
+        block nodes' end marks sit on whatever follows them (the next key,
+        a trailing comment), so a block collection ends where its last item
+        does and a block scalar at its last non-blank character.
+        """
+        if isinstance(node, yaml.CollectionNode) and not node.flow_style and node.value:
+            last = node.value[-1]
+            return self._end(last[1] if isinstance(node, yaml.MappingNode) else last)
+        start, end = self._offset(node.start_mark), self._offset(node.end_mark)
+        if isinstance(node, yaml.ScalarNode) and node.style in ("|", ">"):
+            end = start + len(self.text[start:end].rstrip())
+        return end
+
+    def set_in(self, node, field, value):
+        """queue setting field of a block mapping node. returns the old value's text, or None if new.
+
+        a later edit of the same field replaces an earlier one; a value that
+        reads back the same keeps its original text. a block value (| / >
+        scalar, block list or mapping) is replaced from just after its key's
+        colon, so the one-line value that replaces it stays on the key's line.
+        """
+        for key, val in node.value:
+            if key.value == field:
+                start, end = self._offset(val.start_mark), self._end(val)
+                old = self.text[start:end]
+                if _reads_back(old, value):
+                    self.edits[(start, end, "")] = old
+                    return old
+                block = (isinstance(val, yaml.ScalarNode) and val.style in ("|", ">")
+                         or isinstance(val, yaml.CollectionNode) and not val.flow_style)
+                text = render(value, (val.style or "") if isinstance(val, yaml.ScalarNode) else '"')
+                if block:
+                    start = self.text.index(":", self._offset(key.end_mark)) + 1
+                    text = " " + text
+                self.edits[(start, end, "")] = text
+                return old
+        # new field: a line of its own after the mapping's last value
+        first_key, last_val = node.value[0][0], node.value[-1][1]
+        end = self._end(last_val)
+        if end and self.text[end - 1] != "\n":
+            newline = self.text.find("\n", end)
+            end = len(self.text) if newline < 0 else newline + 1
+        line = f"{' ' * first_key.start_mark.column}{field}: {render(value)}\n"
+        if end == len(self.text) and not self.text.endswith("\n"):
+            line = "\n" + line
+        self.edits[(end, end, field)] = line
+        return None
+
+    def patched(self):
+        """the text with every queued edit applied."""
+        pieces, pos = [], 0
+        # stable: new fields at the same spot keep the order they were given in
+        for (start, end, _), text in sorted(self.edits.items(), key=lambda e: e[0][:2]):
+            pieces += [self.text[pos:start], text]
+            pos = end
+        pieces.append(self.text[pos:])
+        return "".join(pieces)
+
+    def save(self, dry_run=False):
+        """write the edits atomically. returns True if the text changed.
+
+        the patched text is composed again first; if it no longer parses,
+        nothing is written and ValueError is raised.
+        """
+        if not self.edits:
+            return False
+        text = self.patched()
+        if text == self.text:
+            return False
+        try:
+            yaml.compose(text, Loader=Loader)
+        except yaml.YAMLError as e:
+            raise ValueError(f"{self.path.name}: edits don't parse, not written: {e}") from None
+        if not dry_run:
+            write_atomic(self.path, text)
+        return True
+
+
+def mapping_child(node, key):
+    """the value node for key in a mapping node, or None."""
+    for k, v in node.value:
+        if k.value == key:
+            return v
+    return None
+
+
+class SpecialtyFile(YamlFile):
+    """one specialty yaml, with each specialty's mapping node by name."""
+
+    def __init__(self, path):
+        super().__init__(path)
+        self.profession = mapping_child(self.root, "profession").value
+        self.specialties = {}
+        for node in mapping_child(self.root, "specialties").value:
+            name = mapping_child(node, "name")
+            if name is not None:
+                self.specialties[name.value] = node
+
+    def set(self, specialty, field, value):
+        """queue one edit to a specialty (see YamlFile.set_in)."""
+        return self.set_in(self.specialties[specialty], field, value)
+
+
+def write_atomic(path, text):
+    """replace path's contents in one rename, so a reader never sees half a file."""
+    path = Path(path)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+        os.chmod(tmp, path.stat().st_mode & 0o777)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def apply_updates(updates, data_dir=DATA_DIR, dry_run=False):
+    """apply updates to every specialty file they touch.
+
+    returns (applied [(update, old text)], unmatched [(update, reason)],
+    written paths).
+    """
+    by_family = {}
+    for u in updates:
+        by_family.setdefault(u.family, []).append(u)
+
+    applied, unmatched, written = [], [], []
+    for family, fam_updates in by_family.items():
+        spec_dir = Path(data_dir) / family / "specialties"
+        if not spec_dir.is_dir():
+            unmatched += [(u, f"no family '{family}'") for u in fam_updates]
+            continue
+        files = [SpecialtyFile(p) for p in sorted(spec_dir.glob("*.yaml"))]
+        edited = {}  # path -> its (update, old text) in applied
+        by_prof = {f.profession: f for f in files}
+        by_name = {}
+        for f in files:
+            for name in f.specialties:
+                by_name.setdefault(name, []).append(f)
+
+        for u in fam_updates:
+            if u.profession is not None:
+                target = by_prof.get(u.profession)
+                if target is None:
+                    unmatched.append((u, f"no profession '{u.profession}' in {family}"))
+                    continue
+                if u.specialty not in target.specialties:
+                    unmatched.append((u, f"no specialty '{u.specialty}' in {target.path.name}"))
+                    continue
+            else:
+                matches = by_name.get(u.specialty, [])
+                if len(matches) != 1:
+                    reason = (f"no specialty '{u.specialty}' in {family}" if not matches else
+                              f"'{u.specialty}' is in {len(matches)} professions — give one")
+                    unmatched.append((u, reason))
+                    continue
+                target = matches[0]
+            applied.append((u, target.set(u.specialty, u.field, u.value)))
+            edited.setdefault(target.path, []).append(applied[-1])
+
+        for f in files:
+            try:
+                if f.save(dry_run):
+                    written.append(f.path)
+            except ValueError as e:
+                failed = edited.pop(f.path)
+                unmatched += [(u, str(e)) for u, _ in failed]
+                failed = {id(item) for item in failed}
+                applied = [item for item in applied if id(item) not in failed]
+
+    order = {id(u): i for i, u in enumerate(updates)}
+    unmatched.sort(key=lambda item: order[id(item[0])])
+    return applied, unmatched, written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk field updates across the specialty YAML files")
+    parser.add_argument("updates", nargs="+", help="CSV or YAML files of (family, profession, specialty, field, value)")
+    parser.add_argument("--data-dir", default=str(DATA_DIR), help="data directory (default: repo data/)")
+    parser.add_argument("--dry-run", action="store_true", help="report what would change without writing")
+    parser.add_argument("--verbose", "-v", action="store_true", help="list every applied update")
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    try:
+        updates = read_updates(args.updates)
+    except (OSError, ValueError, yaml.YAMLError) as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        sys.exit(1)
+    applied, unmatched, written = apply_updates(updates, args.data_dir, args.dry_run)
+    elapsed = time.perf_counter() - t0
+
+    if args.verbose:
+        for u, old in applied:
+            print(f"  {u}: {old if old is not None else '(new)'} -> {render(u.value)}")
+    verb = "would write" if args.dry_run else "wrote"
+    print(f"{len(applied)} of {len(updates)} updates applied, {verb} {len(written)} files "
+          f"in {elapsed:.2f}s")
+    for path in written:
+        print(f"  {path}")
+
+    if unmatched:
+        print(f"\nFAILED — {len(unmatched)} updates didn't match:")
+        for u, reason in unmatched:
+            print(f"  x {u}: {reason}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,7 +7,11 @@ all specialties are scored equally. no "finalist" concept in the pipeline.
 
 usage:
   python process.py --family healthcare
+  python process.py --all --compact          # also write .min.json + .gz/.br
+  python process.py --all --shard            # also write lazy-load shards (shards.py)
+  python process.py --all --columnar         # also write struct-of-arrays tracks
   python process.py --validate ../src/data/healthcare.json
+  python process.py --lint                   # only lint the YAML inputs
 """
 
 import argparse
@@ -23,9 +27,15 @@ from config import (
     CATEGORIES, RADAR_DIMENSIONS, RADAR_CATEGORY_MAP,
     load_family_config, list_families,
 )
-from scoring import compute_all_category_scores, compute_all_scenario_totals
-from financial import derive_financial_params, derive_timeline, compute_net_worth_trajectory
+from scoring import compute_all_category_scores, compute_all_scenario_totals, radar_dicts
+from financial import (
+    derive_timeline, financial_defaults_for, track_financial_params,
+)
 from stress import derive_stress_scores
+from rankings import ranking_metrics, metric_columns, collect_columns, build_rankings
+from decision_table import compile_decision_table, leaf_keys, capture_tracks
+from pareto import DEFAULT_PARETO_SETS, build_frontiers
+from specialty import TrackTable
 
 
 def generate_key(name, used_keys):
@@ -67,68 +77,134 @@ def one_in_x_to_match_comp(one_in_x):
     return max(1, min(10, round(score)))
 
 
-def build_tracks(all_specialties, all_scores, all_scenario_totals,
-                 all_financial, all_stress, all_timelines, professions):
-    """Build the tracks array with full data for every specialty."""
-    tracks = []
+def track_head(spec, professions):
+    """the identity fields of a track: name, key, profession, group, color, path."""
+    return {
+        "name": spec["name"],
+        "key": spec["key"],
+        "profession": spec["profession"],
+        "group": spec.get("group", ""),
+        "color": spec["color"],
+        "path": professions.get(spec["profession"], {}).get("label", spec["profession"]),
+    }
+
+
+def build_track(spec, cat_scores, radar, scenario_totals, financial, stress, timeline, professions):
+    """Build one track dict from a specialty and its computed stage results."""
+    return {
+        **track_head(spec, professions),
+        "raw_data": {
+            "startSalary": spec.get("startSalary", 0),
+            "midSalary": spec.get("midSalary", 0),
+            "peakSalary": spec.get("peakSalary", 0),
+            "typicalPeak": spec.get("typicalPeak", 0),
+            "hoursWeek": spec.get("hoursWeek", 0),
+            "burnout": spec.get("burnout", 0),
+            "satisfaction": spec.get("satisfaction", 0),
+            "chooseAgain": spec.get("chooseAgain", 0),
+            "malpracticeCost": spec.get("malpracticeCost", 0),
+            "vacation": spec.get("vacation", 0),
+            "matchComp": spec.get("matchComp", 0),
+            "annualSpots": spec.get("annualSpots", 0),
+            "oneInX": spec.get("oneInX", 999),
+            "callSchedule": spec.get("callSchedule", 0),
+            "physicalToll": spec.get("physicalToll", 0),
+            "emotionalToll": spec.get("emotionalToll", 0),
+            "aiRiskNow": spec.get("aiRiskNow", 5),
+            "aiRiskMedium": spec.get("aiRiskMedium", 5),
+            "aiRiskLong": spec.get("aiRiskLong", 5),
+            "aiNarrative": spec.get("aiNarrative", ""),
+        },
+        "scores": {
+            f"category_{cid}": score
+            for cid, score in cat_scores.items()
+        },
+        "radar": radar,
+        "scenario_totals": scenario_totals,
+        "financial": financial,
+        "stress": stress,
+        "timeline": timeline,
+    }
+
+
+def build_tracks(all_specialties, table, professions):
+    """Build the tracks array with full data for every specialty, from its row of the table."""
+    return [
+        build_track(
+            spec, table.scores[spec.index], table.radar[spec.index], table.totals[spec.index],
+            table.financial[spec.index], table.stress[spec.index], table.timelines[spec.index],
+            professions,
+        )
+        for spec in all_specialties
+    ]
+
+
+def iter_tracks(all_specialties, l1_scores, rubric, scenario_profiles, professions):
+    """Yield one finished track per specialty, running every stage per spec.
+
+    the streaming counterpart of score_specialties → ... → build_tracks:
+    nothing but the current track is kept.
+    """
     for spec in all_specialties:
-        name = spec["name"]
-        key = spec["key"]
-        prof_label = professions.get(spec["profession"], {}).get("label", spec["profession"])
-
-        track = {
-            "name": name,
-            "key": key,
-            "profession": spec["profession"],
-            "group": spec.get("group", ""),
-            "color": spec["color"],
-            "path": prof_label,
-            "raw_data": {
-                "startSalary": spec.get("startSalary", 0),
-                "midSalary": spec.get("midSalary", 0),
-                "peakSalary": spec.get("peakSalary", 0),
-                "typicalPeak": spec.get("typicalPeak", 0),
-                "hoursWeek": spec.get("hoursWeek", 0),
-                "burnout": spec.get("burnout", 0),
-                "satisfaction": spec.get("satisfaction", 0),
-                "chooseAgain": spec.get("chooseAgain", 0),
-                "malpracticeCost": spec.get("malpracticeCost", 0),
-                "vacation": spec.get("vacation", 0),
-                "matchComp": spec.get("matchComp", 0),
-                "annualSpots": spec.get("annualSpots", 0),
-                "oneInX": spec.get("oneInX", 999),
-                "callSchedule": spec.get("callSchedule", 0),
-                "physicalToll": spec.get("physicalToll", 0),
-                "emotionalToll": spec.get("emotionalToll", 0),
-                "aiRiskNow": spec.get("aiRiskNow", 5),
-                "aiRiskMedium": spec.get("aiRiskMedium", 5),
-                "aiRiskLong": spec.get("aiRiskLong", 5),
-                "aiNarrative": spec.get("aiNarrative", ""),
-            },
-            "scores": {
-                f"category_{cid}": score
-                for cid, score in all_scores.get(name, {}).items()
-            },
-            "scenario_totals": all_scenario_totals.get(name, {}),
-            "financial": all_financial.get(name, {}),
-            "stress": all_stress.get(name, {}),
-            "timeline": all_timelines.get(name, {}),
-        }
-        tracks.append(track)
+        prof = spec["profession"]
+        cat_scores = compute_all_category_scores(spec, prof, l1_scores, rubric)
+        yield build_track(
+            spec, cat_scores, radar_dicts([cat_scores])[0],
+            compute_all_scenario_totals(cat_scores, scenario_profiles),
+            track_financial_params(spec, prof),
+            derive_stress_scores(spec, prof),
+            derive_timeline(spec, prof),
+            professions,
+        )
+
+
+def track_stubs(all_specialties, professions):
+    """lightweight per-track rows with just what assemble_output's indexes read.
+
+    lets the streaming writer build the header (counts, careers, group
+    salary ranges) before any track is scored.
+    """
+    return [
+        {**track_head(spec, professions), "raw_data": {"peakSalary": spec.get("peakSalary", 0)}}
+        for spec in all_specialties
+    ]
 
-    return tracks
 
+def assemble_output(cfg, tracks, scenario_profiles, rankings=None, pareto=None,
+                    decision_table=None):
+    """Assemble the final JSON output structure.
 
-def assemble_output(cfg, tracks, scenario_profiles):
-    """Assemble the final JSON output structure."""
+    rankings, pareto and decision_table are built from `tracks` by default; the
+    streaming writer passes callables that build them once the real tracks
+    have gone by.
+    """
+    # rankings and pareto share one pass over the tracks' metric values
+    metrics = ranking_metrics(scenario_profiles)
+    cached = []
+
+    def columns():
+        if not cached:
+            cached.append(metric_columns(tracks, metrics))
+        return cached[0]
+
+    track_counts = {}
+    for t in tracks:
+        track_counts[t["profession"]] = track_counts.get(t["profession"], 0) + 1
     professions_out = {}
     for prof, info in cfg["professions"].items():
         professions_out[prof] = {
             "label": info["label"],
             "color": info["color"],
-            "track_count": sum(1 for t in tracks if t["profession"] == prof),
+            "track_count": track_counts.get(prof, 0),
         }
 
+    # financial defaults shared by every track of a profession, stored once;
+    # financial.resolve_financial() rebuilds a track's full params
+    financial_defaults = {}
+    for t in tracks:
+        if t["profession"] not in financial_defaults:
+            financial_defaults[t["profession"]] = dict(financial_defaults_for(t["profession"]))
+
     # careers array: all tracks with key/name/color/path/group
     careers = [
         {"key": t["key"], "name": t["name"], "color": t["color"], "path": t["path"], "group": t["group"]}
@@ -164,6 +240,7 @@ def assemble_output(cfg, tracks, scenario_profiles):
             "source_file": "yaml",
         },
         "professions": professions_out,
+        "profession_financial_defaults": financial_defaults,
         "groups": groups_out,
         "careers": careers,
         "categories": [
@@ -177,52 +254,42 @@ def assemble_output(cfg, tracks, scenario_profiles):
         ],
         "scenario_profiles": scenario_profiles,
         "tracks": tracks,
+        "rankings": rankings if rankings is not None else build_rankings(
+            columns(), [t["group"] for t in tracks], metrics,
+        ),
+        "pareto": pareto if pareto is not None else build_frontiers(
+            columns(), metrics, cfg.get("pareto_sets") or DEFAULT_PARETO_SETS,
+        ),
         # keep decision tree and ranking as optional top-level features
         "decision_tree": cfg.get("decision_tree", {}),
         "decision_tree_results": cfg.get("decision_tree_results", {}),
+        "decision_table": decision_table if decision_table is not None else compile_decision_table(
+            cfg.get("decision_tree", {}), cfg.get("decision_tree_results", {}),
+            {t["key"]: t for t in tracks},
+        ),
         "ranking": cfg.get("final_ranking", []),
     }
 
 
-def process(family_slug, output_path=None):
-    """Process a family: score all specialties and output JSON."""
-    from yaml_reader import (
-        load_specialties, load_l1_scores, load_scoring_rubric,
-        load_scenario_profiles,
-    )
-
-    repo_root = Path(__file__).parent.parent
-    cfg = load_family_config(family_slug)
-
-    if output_path is None:
-        output_path = repo_root / "src" / "data" / f"{family_slug}.json"
+def annotate_difficulty(all_specialties, professions):
+    """compute the oneInX difficulty metric and matchComp for every specialty.
 
-    print(f"processing {family_slug}...")
-
-    # 1. load data
-    print("loading specialty data...")
-    all_specialties = load_specialties(family_slug)
-    print(f"  loaded {len(all_specialties)} specialties")
-
-    # 1.5 — compute oneInX difficulty metric from annualSpots + annualGraduates
-    print("computing oneInX difficulty metric...")
+    mutates the specialty records in place.
+    """
     for spec in all_specialties:
-        grads = cfg["professions"].get(spec["profession"], {}).get("annualGraduates", 0)
+        grads = professions.get(spec["profession"], {}).get("annualGraduates", 0)
         spots = spec.get("annualSpots", 0)
         spec["oneInX"] = compute_one_in_x(grads, spots)
         spec["matchComp"] = one_in_x_to_match_comp(spec["oneInX"])
 
-    print("loading L1 scores...")
-    l1_scores = load_l1_scores(family_slug)
 
-    print("loading scoring rubric...")
-    rubric = load_scoring_rubric(family_slug)
+def assign_keys_and_colors(all_specialties, cfg):
+    """give every specialty a unique key and a display color.
 
-    print("loading scenario profiles...")
-    scenario_profiles = load_scenario_profiles(family_slug)
-
-    # 2. assign keys and colors to all specialties
-    print("assigning keys and colors...")
+    legacy key/color overrides from config.yaml win; everything else gets a
+    generated key and a shade of its profession's base color.
+    mutates the specialty records in place.
+    """
     # check if config has legacy key/color overrides
     legacy_keys = {}
     legacy_colors = {}
@@ -253,52 +320,287 @@ def process(family_slug, output_path=None):
             prof_color_idx[prof] = idx + 1
         used_keys.add(spec["key"])
 
-    # 3. score ALL specialties
-    print("computing category scores for all specialties...")
-    all_scores = {}
-    all_scenario_totals = {}
-    for spec in all_specialties:
-        cat_scores = compute_all_category_scores(spec, spec["profession"], l1_scores, rubric)
-        all_scores[spec["name"]] = cat_scores
-        scen_totals = compute_all_scenario_totals(cat_scores, scenario_profiles)
-        all_scenario_totals[spec["name"]] = scen_totals
 
-    # 4. derive financial params, stress test, timeline for ALL specialties
-    print("deriving financial models...")
-    all_financial = {}
+def score_specialties(all_specialties, l1_scores, rubric, table):
+    """compute the 14 category scores for every specialty into table.scores."""
     for spec in all_specialties:
-        params = derive_financial_params(spec, spec["profession"])
-        all_financial[spec["name"]] = params
+        table.scores[spec.index] = compute_all_category_scores(spec, spec["profession"], l1_scores, rubric)
 
-    print("deriving stress test scores...")
-    all_stress = {}
+
+def radar_specialties(table):
+    """compute every specialty's radar dimension scores in one batch into table.radar."""
+    table.radar[:] = radar_dicts(table.scores)
+
+
+def total_specialties(table, scenario_profiles):
+    """compute every scenario total for every scored specialty into table.totals."""
+    table.totals[:] = [compute_all_scenario_totals(cat_scores, scenario_profiles)
+                       for cat_scores in table.scores]
+
+
+def derive_all_financial(all_specialties, table):
+    """derive financial params for every specialty into table.financial.
+
+    only the track's own fields and overrides are kept — the profession
+    defaults go into the output once (profession_financial_defaults).
+    """
     for spec in all_specialties:
-        all_stress[spec["name"]] = derive_stress_scores(spec, spec["profession"])
+        prof = spec["profession"]
+        table.financial[spec.index] = track_financial_params(spec, prof)
 
-    print("deriving timelines...")
-    all_timelines = {}
+
+def derive_all_stress(all_specialties, table):
+    """derive stress test scores for every specialty into table.stress."""
     for spec in all_specialties:
-        all_timelines[spec["name"]] = derive_timeline(spec, spec["profession"])
+        table.stress[spec.index] = derive_stress_scores(spec, spec["profession"])
 
-    # 5. build tracks and assemble output
-    print("building tracks...")
-    tracks = build_tracks(
-        all_specialties, all_scores, all_scenario_totals,
-        all_financial, all_stress, all_timelines, cfg["professions"],
-    )
 
-    output = assemble_output(cfg, tracks, scenario_profiles)
+def derive_all_timelines(all_specialties, table):
+    """derive training timelines for every specialty into table.timelines."""
+    for spec in all_specialties:
+        table.timelines[spec.index] = derive_timeline(spec, spec["profession"])
 
+
+def write_output(output, output_path):
+    """write the assembled output dict as indented JSON."""
     output_file = Path(output_path)
     output_file.parent.mkdir(parents=True, exist_ok=True)
     with open(output_file, "w") as f:
         json.dump(output, f, indent=2)
+    return output_file
+
+
+def _indented(value, level):
+    """json.dumps(value, indent=2) as it appears nested `level` deep in json.dump output."""
+    return json.dumps(value, indent=2).replace("\n", "\n" + "  " * level)
+
+
+def write_output_stream(output, tracks, output_path):
+    """write an output dict whose tracks come from an iterator, one at a time.
+
+    `output` is assemble_output()'s dict; its "tracks" entry is ignored and
+    `tracks` is written in its place. values that are callables are called
+    when reached, so keys after "tracks" can depend on the streamed tracks.
+    the bytes match write_output() exactly, but only the header, the
+    trailing keys and the current track are ever in memory. returns the
+    output path and the number of tracks written.
+    """
+    output_file = Path(output_path)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    n_tracks = 0
+    with open(output_file, "w") as f:
+        f.write("{")
+        for i, (key, value) in enumerate(output.items()):
+            f.write(("," if i else "") + "\n  " + json.dumps(key) + ": ")
+            if key != "tracks":
+                f.write(_indented(value() if callable(value) else value, 1))
+                continue
+            f.write("[")
+            for track in tracks:
+                f.write(("," if n_tracks else "") + "\n    " + _indented(track, 2))
+                n_tracks += 1
+            f.write("\n  ]" if n_tracks else "]")
+        f.write("\n}")
+    return output_file, n_tracks
+
+
+# process() stage names, in order. the first two load the inputs, the rest
+# score and write; bench.py times them one at a time.
+STAGES = [
+    "yaml_load", "annotate", "scoring", "scenario_totals",
+    "financial", "stress", "timeline", "assemble", "json_write",
+]
+INPUT_STAGES = 2
+
+
+def pipeline_stages(family_slug, output_path=None):
+    """process()'s stages as ([(name, fn)], state): closures sharing one state dict.
+
+    running them in order is process() without the extras; json_write
+    writes to output_path (state["output_file"]).
+    """
+    from yaml_reader import (
+        load_specialties, load_l1_scores, load_scoring_rubric,
+        load_scenario_profiles,
+    )
+
+    state = {}
+
+    def yaml_load():
+        # 1. load data
+        state["cfg"] = load_family_config(family_slug)
+        print("loading specialty data...")
+        state["specs"] = load_specialties(family_slug)
+        print(f"  loaded {len(state['specs'])} specialties")
+        print("loading L1 scores...")
+        state["l1"] = load_l1_scores(family_slug)
+        print("loading scoring rubric...")
+        state["rubric"] = load_scoring_rubric(family_slug)
+        print("loading scenario profiles...")
+        state["profiles"] = load_scenario_profiles(family_slug)
+
+    def annotate():
+        # 1.5 — compute oneInX difficulty metric from annualSpots + annualGraduates
+        print("computing oneInX difficulty metric...")
+        annotate_difficulty(state["specs"], state["cfg"]["professions"])
+        # 2. assign keys and colors to all specialties
+        print("assigning keys and colors...")
+        assign_keys_and_colors(state["specs"], state["cfg"])
+
+    def scoring():
+        # 3. score ALL specialties
+        print("computing category scores for all specialties...")
+        state["table"] = TrackTable(len(state["specs"]))
+        score_specialties(state["specs"], state["l1"], state["rubric"], state["table"])
+        radar_specialties(state["table"])
+
+    def scenario_totals():
+        total_specialties(state["table"], state["profiles"])
+
+    # 4. derive financial params, stress test, timeline for ALL specialties
+    def financial():
+        print("deriving financial models...")
+        derive_all_financial(state["specs"], state["table"])
+
+    def stress():
+        print("deriving stress test scores...")
+        derive_all_stress(state["specs"], state["table"])
+
+    def timeline():
+        print("deriving timelines...")
+        derive_all_timelines(state["specs"], state["table"])
+
+    def assemble():
+        # 5. build tracks and assemble output
+        print("building tracks...")
+        tracks = build_tracks(state["specs"], state["table"], state["cfg"]["professions"])
+        state["output"] = assemble_output(state["cfg"], tracks, state["profiles"])
+
+    def json_write():
+        state["output_file"] = write_output(state["output"], output_path)
+
+    fns = [yaml_load, annotate, scoring, scenario_totals, financial, stress,
+           timeline, assemble, json_write]
+    return [(fn.__name__, fn) for fn in fns], state
+
+
+def build_family(family_slug):
+    """a family's output dict, built in memory — nothing is written."""
+    stages, state = pipeline_stages(family_slug)
+    for name, fn in stages:
+        if name != "json_write":
+            fn()
+    return state["output"]
+
+
+def process(family_slug, output_path=None, compact=False, columnar=False, stream=False,
+            delta=False):
+    """Process a family: score all specialties and output JSON.
+
+    with compact=True, also writes the minified + precompressed artifacts
+    (see compact.py) next to the pretty JSON; with columnar=True, also
+    writes the struct-of-arrays variant (see columnar.py); with delta=True,
+    also writes a JSON Patch + change report against the file being
+    overwritten (see delta.py).
+
+    with stream=True, tracks are scored and written one at a time instead
+    of being collected first (same bytes, bounded memory — for very large
+    families). nothing is returned then unless an extra artifact needs the
+    output, in which case it is read back from the written file.
+    """
+    repo_root = Path(__file__).parent.parent
+    if output_path is None:
+        output_path = repo_root / "src" / "data" / f"{family_slug}.json"
+
+    print(f"processing {family_slug}...")
+
+    # the previous build, read before it's overwritten
+    previous = _load_previous(output_path) if delta else None
+
+    stages, state = pipeline_stages(family_slug, output_path)
+    for _, fn in stages[:INPUT_STAGES]:
+        fn()
+    if stream:
+        return _process_stream(state["cfg"], state["specs"], state["l1"], state["rubric"],
+                               state["profiles"], output_path, compact, columnar, previous)
+
+    for _, fn in stages[INPUT_STAGES:]:
+        fn()
+    output, output_file = state["output"], state["output_file"]
 
     print(f"\ndone! wrote {output_file}")
     print(f"  {output['meta']['total_tracks']} tracks scored")
+
+    _write_extras(output, output_file, compact, columnar, previous)
     return output
 
 
+def _load_previous(output_path):
+    """the existing output at output_path, or None if there isn't one yet."""
+    path = Path(output_path)
+    if not path.exists():
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def _process_stream(cfg, all_specialties, l1_scores, rubric, scenario_profiles,
+                    output_path, compact, columnar, previous):
+    """steps 3-5 of process() as a per-track generator feeding the writer."""
+    print("streaming tracks...")
+    # the header indexes (counts, careers, group salary ranges) only need
+    # each track's identity fields, so they're built before any scoring;
+    # rankings and pareto frontiers only need a column of values per
+    # metric (plus each track's group) and the decision table only the
+    # tracks the quiz ends on, all gathered as the tracks stream past
+    metrics = ranking_metrics(scenario_profiles)
+    columns, groups = [[] for _ in metrics], []
+    tree, tree_results = cfg.get("decision_tree", {}), cfg.get("decision_tree_results", {})
+    leaf_tracks = {}
+    output = assemble_output(
+        cfg, track_stubs(all_specialties, cfg["professions"]), scenario_profiles,
+        rankings=lambda: build_rankings(columns, groups, metrics),
+        pareto=lambda: build_frontiers(columns, metrics, cfg.get("pareto_sets") or DEFAULT_PARETO_SETS),
+        decision_table=lambda: compile_decision_table(tree, tree_results, leaf_tracks),
+    )
+    tracks = capture_tracks(
+        collect_columns(
+            iter_tracks(all_specialties, l1_scores, rubric, scenario_profiles, cfg["professions"]),
+            metrics, columns, groups,
+        ),
+        leaf_keys(tree), leaf_tracks,
+    )
+    output_file, n_tracks = write_output_stream(output, tracks, output_path)
+
+    print(f"\ndone! wrote {output_file}")
+    print(f"  {n_tracks} tracks scored")
+
+    if not (compact or columnar or previous is not None):
+        return None
+    with open(output_file) as f:
+        output = json.load(f)
+    _write_extras(output, output_file, compact, columnar, previous)
+    return output
+
+
+def _write_extras(output, output_file, compact, columnar, previous=None):
+    """write the optional compact / columnar / delta artifacts next to output_file."""
+    if compact:
+        from compact import write_compact, size_report, print_report
+        print_report([size_report(output_file, write_compact(output, output_file))])
+
+    if columnar:
+        from columnar import write_columnar
+        print(f"  wrote {write_columnar(output, output_file)}")
+
+    if previous is not None:
+        from delta import build_delta, write_delta, format_summary
+        changes = build_delta(previous, output)
+        print(f"  wrote {write_delta(changes, output_file)} ({len(changes['patch'])} patch ops)")
+        for line in format_summary(changes["summary"], limit=10):
+            print(f"    {line}")
+
+
 def _shade_color(hex_color, index):
     """Generate a shade of a base color by rotating hue slightly and varying saturation."""
     hex_color = hex_color.lstrip("#")
@@ -313,41 +615,10 @@ def _shade_color(hex_color, index):
 
 
 def validate(json_path):
-    """Validate the output JSON."""
+    """Validate the output JSON (every track; see validate_output.py)."""
+    from validate_output import validate_file
     print(f"validating {json_path}...")
-    with open(json_path) as f:
-        data = json.load(f)
-
-    errors = []
-
-    if data["meta"]["total_tracks"] < 1:
-        errors.append("no tracks found")
-    if "careers" not in data or len(data["careers"]) < 1:
-        errors.append("no careers array in output")
-
-    # check that every track has scores, scenario_totals, financial, stress, timeline
-    for t in data["tracks"]:
-        if not t.get("scores"):
-            errors.append(f"track '{t['name']}' missing scores")
-            break
-        if not t.get("scenario_totals"):
-            errors.append(f"track '{t['name']}' missing scenario_totals")
-            break
-        if not t.get("financial"):
-            errors.append(f"track '{t['name']}' missing financial")
-            break
-        if not t.get("stress"):
-            errors.append(f"track '{t['name']}' missing stress")
-            break
-        if not t.get("timeline"):
-            errors.append(f"track '{t['name']}' missing timeline")
-            break
-
-    # score range sanity check
-    for t in data["tracks"][:5]:
-        for cat_key, score in t.get("scores", {}).items():
-            if not (0.5 <= score <= 10.5):
-                errors.append(f"track '{t['name']}' {cat_key} out of range: {score}")
+    _, n_tracks, errors = validate_file(json_path)
 
     if errors:
         print(f"\nFAILED — {len(errors)} errors:")
@@ -355,31 +626,112 @@ def validate(json_path):
             print(f"  x {e}")
         return False
     else:
-        print(f"\nPASSED — {data['meta']['total_tracks']} tracks, all checks ok")
+        print(f"\nPASSED — {n_tracks} tracks, all checks ok")
         return True
 
 
+def lint_inputs(families):
+    """lint the YAML inputs of families in parallel. returns True if clean."""
+    from lint import lint, print_results
+    print(f"linting {len(families)} famil{'y' if len(families) == 1 else 'ies'}...")
+    return print_results(lint(families))
+
+
+def validate_build(paths):
+    """validate freshly written outputs in parallel. returns True if all passed."""
+    from validate_output import validate_files, print_results
+    print(f"\nvalidating {len(paths)} output(s)...")
+    return print_results(validate_files(paths))
+
+
+def _write_cross_family(outputs, args):
+    """write the artifacts that span every family (shards, search, neighbours, frontiers)."""
+    if args.shard:
+        from shards import write_shards, print_summary
+        print_summary(write_shards(outputs, per_track=args.shard_tracks, columnar=args.columnar))
+    if args.search:
+        from search_index import build_index, write_index
+        index = build_index(outputs)
+        print(f"wrote {write_index(index)} ({len(index['docs'])} tracks, {len(index['vocab'])} tokens)")
+    if args.similar:
+        from similar import build_similar, write_similar
+        similar = build_similar(outputs)
+        print(f"wrote {write_similar(similar)} ({len(similar['tracks'])} tracks x {similar['k']} neighbours)")
+    if args.pareto:
+        from pareto import build_global, write_global
+        print(f"wrote {write_global(build_global(outputs))}")
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="crossrd data pipeline")
     parser.add_argument("--family", help="profession family slug (e.g. healthcare)")
     parser.add_argument("--all", action="store_true", help="process all registered families")
     parser.add_argument("--output", help="path for the output json")
     parser.add_argument("--validate", help="validate an existing json file")
+    parser.add_argument("--lint", action="store_true",
+                        help="only lint the YAML inputs (lint.py) and exit")
+    parser.add_argument("--compact", action="store_true",
+                        help="also write minified json with .gz/.br siblings")
+    parser.add_argument("--columnar", action="store_true",
+                        help="also write <family>.columnar.json (struct-of-arrays tracks); "
+                             "with --shard, columnar family shards")
+    parser.add_argument("--shard", action="store_true",
+                        help="also write the content-hashed manifest + family shards")
+    parser.add_argument("--shard-tracks", action="store_true",
+                        help="with --shard, also write one shard per track")
+    parser.add_argument("--stream", action="store_true",
+                        help="score and write tracks one at a time (bounded memory, same output)")
+    parser.add_argument("--delta", action="store_true",
+                        help="also write <family>.delta.json (JSON Patch + change report vs the previous build)")
+    parser.add_argument("--search", action="store_true",
+                        help="also rebuild the cross-family search index")
+    parser.add_argument("--similar", action="store_true",
+                        help="also rebuild the cross-family nearest-neighbour lists")
+    parser.add_argument("--pareto", action="store_true",
+                        help="also rebuild the cross-family pareto frontiers")
     args = parser.parse_args()
+    opts = {"compact": args.compact, "columnar": args.columnar, "stream": args.stream,
+            "delta": args.delta}
 
     if args.validate:
         ok = validate(args.validate)
         sys.exit(0 if ok else 1)
+    elif args.lint:
+        ok = lint_inputs([args.family] if args.family else list_families())
+        sys.exit(0 if ok else 1)
     elif args.all:
         families = list_families()
         if not families:
             print("no families found (no data/*/config.yaml files)")
             sys.exit(1)
+        if not lint_inputs(families):
+            sys.exit(1)
         print(f"processing {len(families)} families: {', '.join(families)}")
+        outputs = {}
         for fam in families:
-            process(fam)
+            outputs[fam] = process(fam, **opts)
+        if args.shard or args.search or args.similar or args.pareto:
+            from shards import load_outputs
+            if args.stream:
+                # streamed outputs aren't kept in memory — read them back
+                outputs = load_outputs(families)
+            _write_cross_family(outputs, args)
+        if not validate_build([Path(__file__).parent.parent / "src" / "data" / f"{fam}.json" for fam in families]):
+            sys.exit(1)
     elif args.family:
-        process(args.family, args.output)
+        if not lint_inputs([args.family]):
+            sys.exit(1)
+        output = process(args.family, args.output, **opts)
+        output_path = args.output or Path(__file__).parent.parent / "src" / "data" / f"{args.family}.json"
+        if args.shard or args.search or args.similar or args.pareto:
+            from shards import load_outputs
+            outputs = load_outputs()
+            # a streamed output isn't kept in memory — read it back from
+            # where it was written (which may not be src/data with --output)
+            outputs[args.family] = output if output is not None else json.loads(Path(output_path).read_text())
+            _write_cross_family(outputs, args)
+        if not validate_build([output_path]):
+            sys.exit(1)
     else:
         parser.print_help()
         sys.exit(1)
@@ -0,0 +1,153 @@
+"""
+rankings.py — precomputed sort orders, ranks and percentiles
+
+every sorted view in the app (career list, full-field table, scenario
+totals, radar dimensions) used to re-sort the tracks on the client. this
+computes them once per build, for the whole family and within each group:
+
+  "rankings": {
+    "metrics": [{"id": "scenario:default", "order": "desc"}, ...],
+    "order": {metric: [track index, best first]},
+    "rank": {metric: [rank per track index]},           1 = best, ties share
+    "percentile": {metric: [0-100 per track index]},    share of others ranked below
+    "group_rank": {metric: [rank within the track's group]},
+    "group_percentile": {metric: [...]},
+  }
+
+track indices point into the output's tracks array. values are computed
+exactly the way the components compute them (|| fallbacks, Math.round)
+and orders are stable sorts, so a precomputed order matches what the
+client sort would have produced. that also makes a group's order just
+`order` filtered to the group, so it isn't stored twice.
+"""
+
+import math
+
+from config import RADAR_DIMENSIONS
+
+# raw_data columns the explore views sort by: (metric id, better direction)
+RAW_METRICS = [
+    ("typicalPeak", "desc"),
+    ("peakSalary", "desc"),
+    ("startSalary", "desc"),
+    ("satisfaction", "desc"),
+    ("hoursWeek", "asc"),
+    ("burnout", "asc"),
+    ("oneInX", "asc"),
+    ("aiRiskAvg", "asc"),
+]
+
+
+def js_round1(x):
+    """Math.round(x * 10) / 10 — rounds halves up, unlike python's round()."""
+    return math.floor(x * 10 + 0.5) / 10
+
+
+def _raw_value(raw, metric_id):
+    """a raw_data sort value, with the same fallbacks as App.jsx / CareerList.jsx."""
+    if metric_id == "aiRiskAvg":
+        risks = [raw.get(k) or 5 for k in ("aiRiskNow", "aiRiskMedium", "aiRiskLong")]
+        return js_round1(sum(risks) / 3)
+    if metric_id == "typicalPeak":
+        return raw.get("typicalPeak") or raw.get("peakSalary") or 0
+    return raw.get(metric_id) or 0
+
+
+def ranking_metrics(scenario_profiles):
+    """the metric list: every scenario, every radar dimension, the raw sort columns."""
+    metrics = [{"id": f"scenario:{s}", "order": "desc"} for s in scenario_profiles]
+    metrics += [{"id": f"radar:{d['dim']}", "order": "desc"} for d in RADAR_DIMENSIONS]
+    metrics += [{"id": m, "order": order} for m, order in RAW_METRICS]
+    return metrics
+
+
+def metric_values(track, metrics):
+    """one track's value for every metric, in metric order."""
+    values = []
+    for m in metrics:
+        kind, _, name = m["id"].partition(":")
+        if kind == "scenario":
+            values.append(track["scenario_totals"].get(name, 0))
+        elif kind == "radar":
+            values.append(track["radar"][name])
+        else:
+            values.append(_raw_value(track["raw_data"], m["id"]))
+    return values
+
+
+def metric_columns(tracks, metrics):
+    """every metric's values across tracks: one list per metric, in metric order."""
+    columns = []
+    for m in metrics:
+        kind, _, name = m["id"].partition(":")
+        if kind == "scenario":
+            columns.append([t["scenario_totals"].get(name, 0) for t in tracks])
+        elif kind == "radar":
+            columns.append([t["radar"][name] for t in tracks])
+        elif m["id"] in ("aiRiskAvg", "typicalPeak"):
+            columns.append([_raw_value(t["raw_data"], m["id"]) for t in tracks])
+        else:
+            columns.append([t["raw_data"].get(m["id"]) or 0 for t in tracks])
+    return columns
+
+
+def collect_columns(tracks, metrics, columns, groups):
+    """pass tracks through, appending each one's metric values to columns and group to groups.
+
+    lets the streaming writer gather what build_rankings() needs without
+    keeping the tracks themselves. columns starts as one empty list per metric.
+    """
+    for track in tracks:
+        for column, value in zip(columns, metric_values(track, metrics)):
+            column.append(value)
+        groups.append(track["group"])
+        yield track
+
+
+def _percentile(rank, n):
+    """share of the other tracks ranked below this one, 0-100."""
+    if n <= 1:
+        return 100
+    return math.floor(100 * (n - rank) / (n - 1) + 0.5)
+
+
+def build_rankings(columns, groups, metrics):
+    """the rankings block from per-metric value columns and each track's group."""
+    n = len(groups)
+    members = {}
+    for i, g in enumerate(groups):
+        members.setdefault(g, []).append(i)
+    # percentile by rank, overall and per group (ranks start at 1)
+    pct = [_percentile(r, n) for r in range(n + 1)]
+    group_pct = {g: [_percentile(r, len(idx)) for r in range(len(idx) + 1)] for g, idx in members.items()}
+
+    out = {
+        "metrics": metrics,
+        "order": {},
+        "rank": {},
+        "percentile": {},
+        "group_rank": {},
+        "group_percentile": {},
+    }
+    for m, values in zip(metrics, columns):
+        mid = m["id"]
+        # stable, so each group's best-first order is its subsequence of this one
+        order = sorted(range(n), key=values.__getitem__, reverse=m["order"] == "desc")
+        rank, group_rank = [0] * n, [0] * n
+        seen = dict.fromkeys(members, 0)
+        last = {}  # group -> index of its previous track in order
+        for pos, i in enumerate(order):
+            prev = order[pos - 1] if pos else None
+            tie = prev is not None and values[prev] == values[i]
+            rank[i] = rank[prev] if tie else pos + 1
+            g = groups[i]
+            seen[g] += 1
+            j = last.get(g)
+            group_rank[i] = group_rank[j] if j is not None and values[j] == values[i] else seen[g]
+            last[g] = i
+        out["order"][mid] = order
+        out["rank"][mid] = rank
+        out["percentile"][mid] = [pct[r] for r in rank]
+        out["group_rank"][mid] = group_rank
+        out["group_percentile"][mid] = [group_pct[g][r] for r, g in zip(group_rank, groups)]
+    return out
@@ -1,5 +1,8 @@
 #!/usr/bin/env python3
-"""One-time script to replace matchComp with annualSpots in all specialty YAML files."""
+"""One-time script to replace matchComp with annualSpots in all specialty YAML files.
+
+Kept for the record; for new bulk edits use patch_fields.py with a CSV or YAML of updates.
+"""
 
 import re
 from pathlib import Path
@@ -6,6 +6,10 @@ the scoring engine uses the rubric (scoring_rubric.yaml) to convert raw
 specialty data into category scores, then applies scenario weights.
 """
 
+import numpy as np
+
+from config import CATEGORIES, RADAR_DIMENSIONS, RADAR_CATEGORY_MAP
+
 
 def score_numeric(value, min_val, max_val, higher_is_better=True):
     """convert a numeric value to a 1-10 score using linear interpolation.
@@ -201,3 +205,34 @@ def compute_all_scenario_totals(category_scores, profiles):
         name: compute_scenario_total(category_scores, weights)
         for name, weights in profiles.items()
     }
+
+
+def compute_radar_scores(score_rows):
+    """roll category scores up into the radar dimensions, for many tracks at once.
+
+    args:
+        score_rows: list of {cat_id: score}, one per track
+    returns:
+        (n, 6) float array, columns in RADAR_DIMENSIONS order
+
+    matches the rollup the frontend used to do: a missing score counts as 5,
+    each dimension is the plain mean of its categories (summed in order), and
+    values round half-up to one decimal like Math.round(x * 10) / 10.
+    """
+    cat_ids = [cat["id"] for cat in CATEGORIES]
+    col = {cid: i for i, cid in enumerate(cat_ids)}
+    scores = np.array(
+        [[row.get(cid) or 5.0 for cid in cat_ids] for row in score_rows], dtype=float,
+    ).reshape(len(score_rows), len(cat_ids))
+
+    radar = np.empty((len(score_rows), len(RADAR_DIMENSIONS)))
+    for d, dim in enumerate(RADAR_DIMENSIONS):
+        cols = [col[cid] for cid in RADAR_CATEGORY_MAP[dim["dim"]]]
+        radar[:, d] = scores[:, cols].sum(axis=1) / len(cols)
+    return np.floor(radar * 10 + 0.5) / 10
+
+
+def radar_dicts(score_rows):
+    """compute_radar_scores() as one {dimension: score} dict per track."""
+    dims = [dim["dim"] for dim in RADAR_DIMENSIONS]
+    return [dict(zip(dims, row.tolist())) for row in compute_radar_scores(score_rows)]
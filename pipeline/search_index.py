@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+search_index.py — one search index across every family
+
+finding "anesthesiology" or "patent" used to mean loading each family's
+json and scanning names. this builds a single index over track names,
+group labels, profession labels and aiNarrative for all families:
+
+  {"format": "search/1",
+   "docs": [[family, key, name], ...],
+   "vocab": ["aba", "accountant", ...],                  sorted
+   "postings": [[doc, weight, doc, weight, ...], ...]}   one list per vocab token
+
+weights favour where a token appears (name > group/profession > narrative).
+the trigram index over the vocabulary is rebuilt on load rather than
+stored — it's derived from vocab in a few ms and would triple the file.
+
+queries match each word exactly, as a prefix ("anesth"), or fuzzily by
+trigram overlap ("anesthesiolgy"), and docs are ranked by summed weight
+times how many query words they matched.
+
+usage:
+  python search_index.py                   # build from src/data/*.json
+  python search_index.py --query patent    # query the built index (+ timing)
+  python process.py --all --search         # right after the pipeline
+"""
+
+import argparse
+import bisect
+import json
+import re
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+from compact import minify
+from shards import load_outputs
+
+FORMAT = "search/1"
+REPO_ROOT = Path(__file__).parent.parent
+INDEX_PATH = REPO_ROOT / "src" / "public" / "data" / "search_index.json"
+
+# how much a token counts depending on the field it came from
+# (ints keep the postings compact)
+FIELD_WEIGHTS = {"name": 6, "group": 3, "profession": 3, "narrative": 1}
+
+# words too common to be worth a posting list
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "but", "by", "can", "for", "from",
+    "has", "have", "in", "is", "it", "its", "it's", "not", "of", "on", "or", "so",
+    "than", "that", "the", "their", "this", "to", "with", "will", "you", "your",
+}
+
+PREFIX_SIM = 0.8      # score factor for a prefix match
+MIN_TRIGRAM_SIM = 0.4  # jaccard floor for a fuzzy match
+MIN_PREFIX_LEN = 3
+
+
+def tokenize(text):
+    """lowercase word tokens, stopwords dropped."""
+    return [t for t in re.findall(r"[a-z0-9]+", str(text).lower()) if t not in STOPWORDS]
+
+
+def trigrams(token):
+    """the token's trigrams, padded so short words and word edges count."""
+    padded = f"  {token} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+# ---- building ----
+
+def _doc_fields(output, track):
+    """(field, text) pairs indexed for one track."""
+    group = output.get("groups", {}).get(track["group"], {}).get("label", track["group"])
+    profession = output.get("professions", {}).get(track["profession"], {}).get("label", track["profession"])
+    return [
+        ("name", track["name"]),
+        ("group", group),
+        ("profession", profession),
+        ("narrative", track.get("raw_data", {}).get("aiNarrative", "")),
+    ]
+
+
+def build_index(outputs):
+    """the search index for {family: output}. see the module docstring for the shape."""
+    docs = []
+    weights = {}  # token -> {doc: weight}
+    for family, output in outputs.items():
+        for track in output["tracks"]:
+            doc = len(docs)
+            docs.append([family, track["key"], track["name"]])
+            for field, text in _doc_fields(output, track):
+                for token in tokenize(text):
+                    postings = weights.setdefault(token, {})
+                    postings[doc] = postings.get(doc, 0) + FIELD_WEIGHTS[field]
+
+    vocab = sorted(weights)
+    postings = []
+    for token in vocab:
+        flat = []
+        for doc, w in sorted(weights[token].items()):
+            flat += [doc, w]
+        postings.append(flat)
+    return {"format": FORMAT, "docs": docs, "vocab": vocab, "postings": postings}
+
+
+def write_index(index, path=INDEX_PATH):
+    """write the index minified. returns its path."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(minify(index))
+    return path
+
+
+# ---- querying ----
+
+class SearchIndex:
+    """an in-memory index with ranked fuzzy search."""
+
+    def __init__(self, index):
+        if index.get("format") != FORMAT:
+            raise ValueError(f"unsupported search index format: {index.get('format')}")
+        self.docs = index["docs"]
+        self.vocab = index["vocab"]
+        self.postings = [list(zip(p[::2], p[1::2])) for p in index["postings"]]
+        self.token_ids = {t: i for i, t in enumerate(self.vocab)}
+        self.trigram_ids = {}
+        self.trigram_counts = []
+        for i, token in enumerate(self.vocab):
+            grams = trigrams(token)
+            self.trigram_counts.append(len(grams))
+            for g in grams:
+                self.trigram_ids.setdefault(g, []).append(i)
+
+    @classmethod
+    def load(cls, path=INDEX_PATH):
+        with open(path) as f:
+            return cls(json.load(f))
+
+    def _matches(self, word):
+        """{vocab id: similarity} for one query word."""
+        exact = self.token_ids.get(word)
+        if exact is not None:
+            return {exact: 1.0}
+
+        matches = {}
+        if len(word) >= MIN_PREFIX_LEN:
+            i = bisect.bisect_left(self.vocab, word)
+            while i < len(self.vocab) and self.vocab[i].startswith(word):
+                matches[i] = PREFIX_SIM
+                i += 1
+        if matches:
+            return matches
+
+        grams = trigrams(word)
+        shared = Counter(tid for g in grams for tid in self.trigram_ids.get(g, ()))
+        for tid, n in shared.items():
+            sim = n / (len(grams) + self.trigram_counts[tid] - n)
+            if sim >= MIN_TRIGRAM_SIM:
+                matches[tid] = sim
+        return matches
+
+    def search(self, query, limit=10):
+        """ranked matches as [(score, family, key, name)], best first."""
+        words = tokenize(query)
+        if not words:
+            return []
+        scores = {}
+        hits = Counter()
+        for word in words:
+            best = {}  # doc -> best score for this word
+            for tid, sim in self._matches(word).items():
+                for doc, w in self.postings[tid]:
+                    s = sim * w
+                    if s > best.get(doc, 0):
+                        best[doc] = s
+            for doc, s in best.items():
+                scores[doc] = scores.get(doc, 0) + s
+                hits[doc] += 1
+
+        ranked = sorted(
+            scores, key=lambda d: (-scores[d] * hits[d] / len(words), self.docs[d][2]),
+        )[:limit]
+        return [
+            (round(scores[d] * hits[d] / len(words), 3), *self.docs[d])
+            for d in ranked
+        ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build / query the cross-family search index")
+    parser.add_argument("--query", "-q", help="search the built index instead of building it")
+    parser.add_argument("--limit", type=int, default=10, help="max results for --query")
+    parser.add_argument("--out", default=str(INDEX_PATH), help="index path")
+    args = parser.parse_args()
+
+    if args.query:
+        if not Path(args.out).exists():
+            print(f"ERROR: {args.out} not found — build the index first", file=sys.stderr)
+            sys.exit(1)
+        index = SearchIndex.load(args.out)
+        index.search(args.query, args.limit)  # warm up
+        runs = 200
+        t0 = time.perf_counter()
+        for _ in range(runs):
+            results = index.search(args.query, args.limit)
+        us = (time.perf_counter() - t0) / runs * 1e6
+        for score, family, key, name in results:
+            print(f"  {score:7.2f}  {family:<12} {key:<26} {name}")
+        print(f"{len(results)} results in {us:.0f} µs")
+        return
+
+    outputs = load_outputs()
+    if not outputs:
+        print("ERROR: no src/data/<family>.json outputs — run process.py first", file=sys.stderr)
+        sys.exit(1)
+    index = build_index(outputs)
+    path = write_index(index, args.out)
+    print(f"wrote {path}: {len(index['docs'])} tracks, {len(index['vocab'])} tokens, "
+          f"{path.stat().st_size / 1024:.1f} KB")
+
+
+if __name__ == "__main__":
+    main()
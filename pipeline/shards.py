@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+shards.py — lazy-loadable, content-hashed output for the frontend
+
+the app fetches its data on demand instead of bundling every family json
+(src/utils/loadData.js, used by App.jsx). this writes what it fetches:
+
+  src/public/data/
+    manifest.json                          family list, groups, careers index
+    families/<family>.<hash>.json          one full family output each;
+                                           with --columnar, tracks are stored as
+                                           columns (columnar.py) and loadData.js
+                                           decodes them (decodeColumnar.js)
+    tracks/<family>/<key>.<hash>.json      one track each (--tracks only)
+
+shard names carry a hash of their content, so they can be cached forever;
+only manifest.json has to be revalidated. shards no longer referenced by
+the manifest are pruned. the deploy workflow runs this before `npm run
+build`, so src/public/data/ isn't checked in.
+
+usage:
+  python shards.py                    # from the current src/data/*.json
+  python shards.py --tracks           # also write per-track shards
+  python shards.py --columnar         # columnar family shards (what deploy.yml writes)
+  python process.py --all --shard     # right after the pipeline
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+from pathlib import Path
+
+from columnar import encode_output
+from compact import minify
+from config import list_families
+
+REPO_ROOT = Path(__file__).parent.parent
+SHARD_DIR = REPO_ROOT / "src" / "public" / "data"
+HASH_LEN = 10
+
+
+def content_name(stem, data):
+    """file name with a content hash: <stem>.<sha256 prefix>.json"""
+    digest = hashlib.sha256(data).hexdigest()[:HASH_LEN]
+    return f"{stem}.{digest}.json"
+
+
+def _write_shard(out_dir, rel_path, data):
+    """write a shard unless an identical one is already there."""
+    path = out_dir / rel_path
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+    return rel_path
+
+
+def load_outputs(families=None):
+    """load the pretty pipeline outputs from src/data/ as {family: output}."""
+    data_dir = REPO_ROOT / "src" / "data"
+    outputs = {}
+    for fam in families or list_families():
+        path = data_dir / f"{fam}.json"
+        if path.exists():
+            with open(path) as f:
+                outputs[fam] = json.load(f)
+    return outputs
+
+
+def build_family_entry(output, family_file):
+    """the manifest entry for one family — enough to render the picker."""
+    meta = output["meta"]
+    return {
+        "name": meta["family_name"],
+        "icon": meta.get("icon", ""),
+        "headline": meta.get("headline", ""),
+        "subtitle": meta.get("subtitle", ""),
+        "note": meta.get("note", ""),
+        "total_tracks": meta["total_tracks"],
+        "file": family_file,
+        "professions": {
+            prof: {"label": info["label"], "color": info["color"]}
+            for prof, info in output["professions"].items()
+        },
+        "groups": output["groups"],
+    }
+
+
+def write_shards(outputs, out_dir=SHARD_DIR, per_track=False, columnar=False):
+    """write the manifest and content-hashed shards for {family: output}.
+
+    with columnar=True the family shards hold `tracks_columnar` instead of
+    `tracks` (per-track shards stay plain). returns the manifest dict.
+    """
+    out_dir = Path(out_dir)
+    manifest = {"families": {}, "careers": []}
+    written = set()
+
+    for slug, output in outputs.items():
+        data = minify(encode_output(output) if columnar else output)
+        family_file = _write_shard(out_dir, f"families/{content_name(slug, data)}", data)
+        written.add(family_file)
+        entry = build_family_entry(output, family_file)
+
+        profession_by_key = {t["key"]: t["profession"] for t in output["tracks"]}
+        for career in output["careers"]:
+            manifest["careers"].append({
+                **career,
+                "family": slug,
+                "profession": profession_by_key.get(career["key"], ""),
+            })
+
+        if per_track:
+            entry["tracks"] = {}
+            for track in output["tracks"]:
+                data = minify(track)
+                rel = _write_shard(out_dir, f"tracks/{slug}/{content_name(track['key'], data)}", data)
+                entry["tracks"][track["key"]] = rel
+                written.add(rel)
+
+        manifest["families"][slug] = entry
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    (out_dir / "manifest.json").write_bytes(minify(manifest))
+
+    # prune shards the new manifest doesn't reference
+    for sub in ("families", "tracks"):
+        sub_dir = out_dir / sub
+        if not sub_dir.exists():
+            continue
+        for path in sub_dir.rglob("*.json"):
+            if path.relative_to(out_dir).as_posix() not in written:
+                path.unlink()
+
+    return manifest
+
+
+def print_summary(manifest, out_dir=SHARD_DIR):
+    """print shard sizes next to what the eager bundle costs."""
+    out_dir = Path(out_dir)
+    manifest_kb = (out_dir / "manifest.json").stat().st_size / 1024
+    family_kb = {
+        slug: (out_dir / entry["file"]).stat().st_size / 1024
+        for slug, entry in manifest["families"].items()
+    }
+    print(f"\nwrote shards to {out_dir}/")
+    print(f"  manifest.json  {manifest_kb:7.1f} KB  ({len(manifest['careers'])} careers)")
+    for slug, kb in family_kb.items():
+        n_tracks = len(manifest["families"][slug].get("tracks", {}))
+        extra = f"  + {n_tracks} track shards" if n_tracks else ""
+        print(f"  {slug:<14} {kb:7.1f} KB{extra}")
+    print(f"  first load: {manifest_kb + max(family_kb.values(), default=0):.1f} KB "
+          f"(was {sum(family_kb.values()):.1f} KB for all families)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write lazy-loadable sharded output")
+    parser.add_argument("--tracks", action="store_true", help="also write one shard per track")
+    parser.add_argument("--columnar", action="store_true", help="store family shards' tracks as columns")
+    parser.add_argument("--out", default=str(SHARD_DIR), help="output directory")
+    args = parser.parse_args()
+
+    outputs = load_outputs()
+    if not outputs:
+        print("ERROR: no src/data/<family>.json outputs — run process.py first", file=sys.stderr)
+        sys.exit(1)
+    manifest = write_shards(outputs, args.out, per_track=args.tracks, columnar=args.columnar)
+    print_summary(manifest, args.out)
+
+
+if __name__ == "__main__":
+    main()
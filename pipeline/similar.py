@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+similar.py — "careers like this" nearest neighbours across every family
+
+each track is turned into a feature vector: its 14 category scores plus
+hoursWeek, peakSalary (log scale) and burnout. features are z-scored across
+all families together, and every track gets its k nearest tracks by
+euclidean distance, written to
+
+  src/public/data/similar.json
+    {"format": "similar/1", "k": 8, "features": [...],
+     "tracks": {"<family>/<key>": [["<family>/<key>", distance], ...]}}
+
+two search paths:
+- brute force: exact. distances are computed in row blocks (block x n), so
+  memory stays at one block no matter how large the catalog is
+- approximate: an inverted-file index — k-means cells, and each cell's
+  tracks only scan the `nprobe` cells nearest to it. for very large catalogs
+  (--bench compares the two: time and recall against brute force)
+
+usage:
+  python similar.py                          # all families, brute force
+  python similar.py --bench --sizes 2000 20000 100000
+  python process.py --all --similar          # right after the pipeline
+"""
+
+import argparse
+import math
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+from compact import minify
+from config import CATEGORIES
+from shards import load_outputs
+
+FORMAT = "similar/1"
+REPO_ROOT = Path(__file__).parent.parent
+SIMILAR_PATH = REPO_ROOT / "src" / "public" / "data" / "similar.json"
+
+DEFAULT_K = 8
+BLOCK_ROWS = 1024
+# raw_data fields used next to the category scores; log-scaled ones are skewed
+RAW_FEATURES = ["hoursWeek", "peakSalary", "burnout"]
+LOG_FEATURES = {"peakSalary"}
+
+
+# ---- features ----
+
+def feature_names():
+    """feature column names, in matrix column order."""
+    return [f"category_{cat['id']}" for cat in CATEGORIES] + RAW_FEATURES
+
+
+def track_features(track):
+    """one track's raw (unnormalized) feature row."""
+    row = [track["scores"].get(f"category_{cat['id']}", 5.0) for cat in CATEGORIES]
+    for field in RAW_FEATURES:
+        value = track["raw_data"].get(field) or 0
+        row.append(math.log1p(max(value, 0)) if field in LOG_FEATURES else value)
+    return row
+
+
+def normalize(features):
+    """z-score every column; constant columns become 0."""
+    if not len(features):
+        return features
+    mean = features.mean(axis=0)
+    std = features.std(axis=0)
+    std[std == 0] = 1.0
+    return (features - mean) / std
+
+
+def feature_matrix(outputs):
+    """(ids, normalized float32 matrix) for {family: output}; ids are "family/key"."""
+    ids, rows = [], []
+    for family, output in outputs.items():
+        for track in output["tracks"]:
+            ids.append(f"{family}/{track['key']}")
+            rows.append(track_features(track))
+    features = np.array(rows, dtype=np.float64).reshape(len(rows), len(feature_names()))
+    return ids, normalize(features).astype(np.float32)
+
+
+# ---- search ----
+
+def _top_k(dist, k):
+    """per row, the k smallest columns as (indices, distances), ties by index."""
+    k = min(k, dist.shape[1])
+    if k <= 0:
+        return np.empty((dist.shape[0], 0), dtype=np.int64), np.empty((dist.shape[0], 0))
+    part = np.argpartition(dist, k - 1, axis=1)[:, :k]
+    part_d = np.take_along_axis(dist, part, axis=1)
+    order = np.lexsort((part, part_d), axis=1)
+    idx = np.take_along_axis(part, order, axis=1)
+    return idx, np.take_along_axis(part_d, order, axis=1)
+
+
+def _sq_dists(queries, points, points_sq):
+    """squared euclidean distances, (len(queries), len(points)), clipped at 0."""
+    q_sq = np.einsum("ij,ij->i", queries, queries)
+    d = q_sq[:, None] + points_sq[None, :] - 2.0 * (queries @ points.T)
+    return np.maximum(d, 0.0, out=d)
+
+
+def knn_brute(x, k=DEFAULT_K, block_rows=BLOCK_ROWS):
+    """exact k nearest neighbours of every row (excluding itself).
+
+    returns (indices, distances), both (n, k). memory is block_rows x n.
+    """
+    n = len(x)
+    if n < 2:  # no other track to be near
+        return np.empty((n, 0), dtype=np.int64), np.empty((n, 0), dtype=np.float32)
+    k = min(k, n - 1)
+    x_sq = np.einsum("ij,ij->i", x, x)
+    indices = np.empty((n, k), dtype=np.int64)
+    dists = np.empty((n, k), dtype=np.float32)
+    for start in range(0, n, block_rows):
+        stop = min(start + block_rows, n)
+        d = _sq_dists(x[start:stop], x, x_sq)
+        d[np.arange(stop - start), np.arange(start, stop)] = np.inf
+        idx, dd = _top_k(d, k)
+        indices[start:stop] = idx
+        dists[start:stop] = np.sqrt(dd)
+    return indices, dists
+
+
+def _kmeans(x, n_cells, iters=8, seed=0):
+    """plain lloyd's k-means; returns (centroids, assignment)."""
+    rng = np.random.default_rng(seed)
+    centroids = x[rng.choice(len(x), n_cells, replace=False)].copy()
+    for _ in range(iters):
+        assign = np.empty(len(x), dtype=np.int64)
+        c_sq = np.einsum("ij,ij->i", centroids, centroids)
+        for start in range(0, len(x), BLOCK_ROWS):
+            stop = min(start + BLOCK_ROWS, len(x))
+            assign[start:stop] = _sq_dists(x[start:stop], centroids, c_sq).argmin(axis=1)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assign, x)
+        counts = np.bincount(assign, minlength=n_cells)
+        filled = counts > 0
+        centroids[filled] = sums[filled] / counts[filled, None]
+    return centroids, assign
+
+
+def knn_ivf(x, k=DEFAULT_K, n_cells=None, nprobe=6, seed=0):
+    """approximate k nearest neighbours through an inverted-file (k-means) index.
+
+    tracks are bucketed into k-means cells; the tracks of one cell are
+    searched together against the members of the nprobe cells nearest to
+    that cell's centroid (itself included). returns (indices, distances)
+    like knn_brute; rows with fewer than k candidates are padded with -1 / inf.
+    """
+    n = len(x)
+    if n < 2:  # no other track to be near
+        return np.empty((n, 0), dtype=np.int64), np.empty((n, 0), dtype=np.float32)
+    k = min(k, n - 1)
+    n_cells = n_cells or max(1, int(math.sqrt(n)))
+    nprobe = min(nprobe, n_cells)
+    centroids, assign = _kmeans(x, n_cells, seed=seed)
+    members = [np.flatnonzero(assign == c) for c in range(n_cells)]
+    c_sq = np.einsum("ij,ij->i", centroids, centroids)
+    probes, _ = _top_k(_sq_dists(centroids, centroids, c_sq), nprobe)
+
+    indices = np.full((n, k), -1, dtype=np.int64)
+    dists = np.full((n, k), np.inf, dtype=np.float32)
+    for cell in range(n_cells):
+        queries = members[cell]
+        if not len(queries):
+            continue
+        cand = np.concatenate([members[c] for c in probes[cell]])
+        cand_x = x[cand]
+        cand_sq = np.einsum("ij,ij->i", cand_x, cand_x)
+        for start in range(0, len(queries), BLOCK_ROWS):
+            q = queries[start:start + BLOCK_ROWS]
+            d = _sq_dists(x[q], cand_x, cand_sq)
+            d[cand[None, :] == q[:, None]] = np.inf
+            idx, dd = _top_k(d, k)
+            found = np.isfinite(dd)
+            indices[q] = np.where(found, cand[idx], -1)
+            dists[q] = np.sqrt(dd)
+    return indices, dists
+
+
+# ---- output ----
+
+def build_similar(outputs, k=DEFAULT_K, approximate=False):
+    """the similar.json document for {family: output}."""
+    ids, x = feature_matrix(outputs)
+    indices, dists = (knn_ivf if approximate else knn_brute)(x, k)
+    tracks = {}
+    for i, track_id in enumerate(ids):
+        tracks[track_id] = [
+            [ids[j], round(float(d), 3)]
+            for j, d in zip(indices[i], dists[i]) if j >= 0
+        ]
+    return {"format": FORMAT, "k": k, "features": feature_names(), "tracks": tracks}
+
+
+def write_similar(similar, path=SIMILAR_PATH):
+    """write the neighbour lists minified. returns the path."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(minify(similar))
+    return path
+
+
+# ---- benchmark ----
+
+def synthetic_features(x, size, seed=0):
+    """a catalog of `size` rows resampled from real rows plus gaussian noise."""
+    rng = np.random.default_rng(seed)
+    base = x[rng.integers(0, len(x), size)]
+    return (base + rng.normal(0, 0.35, base.shape)).astype(np.float32)
+
+
+def recall(approx, exact):
+    """share of the exact neighbours the approximate search also found."""
+    hits = sum(len(np.intersect1d(a, e)) for a, e in zip(approx, exact))
+    return hits / exact.size
+
+
+def run_bench(outputs, sizes, k=DEFAULT_K, seed=0):
+    """time brute force vs ivf on synthetic catalogs; prints a table."""
+    _, real = feature_matrix(outputs)
+    print(f"\n{'size':>8}{'brute s':>10}{'ivf s':>9}{'speedup':>9}{'recall@' + str(k):>11}")
+    for size in sizes:
+        x = synthetic_features(real, size, seed)
+        t0 = time.perf_counter()
+        exact, _ = knn_brute(x, k)
+        brute_s = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        approx, _ = knn_ivf(x, k, seed=seed)
+        ivf_s = time.perf_counter() - t0
+        print(f"{size:>8}{brute_s:>10.2f}{ivf_s:>9.2f}{brute_s / ivf_s:>8.1f}x"
+              f"{recall(approx, exact):>11.1%}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Nearest-neighbour 'careers like this' lists")
+    parser.add_argument("--k", type=int, default=DEFAULT_K, help="neighbours per track")
+    parser.add_argument("--approximate", action="store_true", help="use the ivf index instead of brute force")
+    parser.add_argument("--bench", action="store_true", help="benchmark brute force vs ivf on synthetic catalogs")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[2000, 20000], help="catalog sizes for --bench")
+    parser.add_argument("--out", default=str(SIMILAR_PATH), help="output path")
+    args = parser.parse_args()
+
+    outputs = load_outputs()
+    if not outputs:
+        print("ERROR: no src/data/<family>.json outputs — run process.py first", file=sys.stderr)
+        sys.exit(1)
+
+    if args.bench:
+        run_bench(outputs, args.sizes, args.k)
+        return
+
+    similar = build_similar(outputs, args.k, args.approximate)
+    path = write_similar(similar, args.out)
+    print(f"wrote {path}: {len(similar['tracks'])} tracks x {args.k} neighbours, "
+          f"{path.stat().st_size / 1024:.1f} KB")
+
+
+if __name__ == "__main__":
+    main()
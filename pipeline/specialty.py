@@ -0,0 +1,102 @@
+"""
+specialty.py — compact specialty records and the per-track results table
+
+a family's specialties all share one FieldTable (field name -> slot), and
+each Specialty keeps only a list of values in slot order plus its
+position in the family. that's a fraction of a dict per specialty at
+100k+ specialties, and the position is what every stage indexes its
+results by: TrackTable holds one list per stage result (scores, radar,
+totals, financial, stress, timeline), so building a track is list
+indexing instead of a lookup by name — and two specialties that share a
+name in different professions no longer overwrite each other's results.
+
+Specialty is a read/write Mapping, so the stages that read raw fields
+(spec.get("peakSalary", 400)) work on it unchanged. a field that's in the
+yaml as null is present with value None, as it was in the dicts.
+"""
+
+from collections.abc import Mapping
+
+_MISSING = object()
+
+
+class FieldTable:
+    """field name -> slot, shared by every Specialty of a family; grows as fields are set."""
+
+    __slots__ = ("names", "slots")
+
+    def __init__(self, names=()):
+        self.names = []
+        self.slots = {}
+        for name in names:
+            self.slot(name)
+
+    def slot(self, name):
+        """the slot for a field, adding it if it's new."""
+        slot = self.slots.get(name)
+        if slot is None:
+            slot = self.slots[name] = len(self.names)
+            self.names.append(name)
+        return slot
+
+    def __len__(self):
+        return len(self.names)
+
+
+class Specialty(Mapping):
+    """one specialty's raw fields (plus what annotate adds) as a slot-ordered value list."""
+
+    __slots__ = ("index", "_fields", "_values")
+
+    def __init__(self, fields, index, data=None):
+        self.index = index
+        self._fields = fields
+        self._values = []
+        for name, value in (data or {}).items():
+            self[name] = value
+
+    def __getitem__(self, name):
+        value = self.get(name, _MISSING)
+        if value is _MISSING:
+            raise KeyError(name)
+        return value
+
+    def get(self, name, default=None):
+        slot = self._fields.slots.get(name)
+        if slot is None or slot >= len(self._values):
+            return default
+        value = self._values[slot]
+        return default if value is _MISSING else value
+
+    def __setitem__(self, name, value):
+        slot = self._fields.slot(name)
+        values = self._values
+        if slot >= len(values):
+            values.extend([_MISSING] * (slot + 1 - len(values)))
+        values[slot] = value
+
+    def __contains__(self, name):
+        return self.get(name, _MISSING) is not _MISSING
+
+    def __iter__(self):
+        names = self._fields.names
+        return (names[i] for i, v in enumerate(self._values) if v is not _MISSING)
+
+    def __len__(self):
+        return sum(1 for v in self._values if v is not _MISSING)
+
+    def __repr__(self):
+        return f"Specialty({self.index}, {self.get('name')!r})"
+
+
+class TrackTable:
+    """every stage's per-specialty results, one list per stage, indexed by Specialty.index."""
+
+    __slots__ = ("scores", "radar", "totals", "financial", "stress", "timelines")
+
+    def __init__(self, n):
+        for column in self.__slots__:
+            setattr(self, column, [None] * n)
+
+    def __len__(self):
+        return len(self.scores)
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+synth_family.py — seeded synthetic profession family generator
+
+writes a complete data/<slug>/ tree (config, scoring rubric, L1 scores,
+scenario profiles, specialties) of any size so the pipeline can be tested
+at scale. value ranges come from the template family's scoring_rubric.yaml,
+professions come from financial.PROFESSION_DEFAULTS, and the L1 layout
+mirrors the template's l1_scores.yaml.
+
+specialties are written one at a time, so generating a million of them
+never holds more than one specialty in memory. the result runs through
+the normal pipeline:
+
+    python synth_family.py --slug synth_10k --size 10000
+    python process.py --family synth_10k --output /tmp/synth_10k.json
+
+usage:
+  python synth_family.py --slug synth --size 1000 --seed 7
+  python synth_family.py --slug _scratch --size 100 --template law --force
+"""
+
+import argparse
+import random
+import shutil
+import sys
+from pathlib import Path
+
+import yaml
+
+from financial import PROFESSION_DEFAULTS
+from patch_fields import Dumper
+
+# short words only — generate_key truncates keys to 24 chars, so names
+# must stay unique within that prefix
+NAME_WORDS_A = [
+    "Neuro", "Cardio", "Pedi", "Geri", "Ortho", "Sports", "Rural", "Urban",
+    "Tele", "Applied", "Field", "Clinic", "Digital", "Marine", "Civic", "Green",
+]
+NAME_WORDS_B = [
+    "Care", "Design", "Ops", "Law", "Data", "Repair", "Surgery", "Review",
+    "Systems", "Policy", "Imaging", "Rehab", "Audit", "Build", "Lab", "Tech",
+]
+
+TEXT_SNIPPETS = [
+    "Varies by employer", "Mostly salaried", "Mixed team model", "Growing demand",
+    "Steady regional need", "Hybrid schedule common", "Shift-based", "Project-based",
+]
+
+PALETTE = [
+    "#E55934", "#1982C4", "#8AC926", "#6A4C93", "#F9A825", "#00897B",
+    "#D81B60", "#3949AB", "#6D4C41", "#546E7A",
+]
+
+# raw fields the pipeline reads that are not in the rubric
+EXTRA_INT_FIELDS = {"aiRiskNow": (1, 10), "aiRiskMedium": (1, 10), "aiRiskLong": (1, 10)}
+
+
+def _repo_data_dir():
+    return Path(__file__).parent.parent / "data"
+
+
+def _load_yaml(path):
+    with open(path) as f:
+        return yaml.safe_load(f)
+
+
+def _dump(data, path, comment):
+    with open(path, "w") as f:
+        f.write(comment + "\n")
+        yaml.safe_dump(data, f, sort_keys=False, allow_unicode=True)
+
+
+def build_config(slug, name, professions, n_groups, rng):
+    """build the config.yaml dict for a synthetic family."""
+    groups = {
+        f"group_{g + 1}": {
+            "label": f"Group {g + 1}",
+            "icon": "",
+            "tagline": "synthetic group",
+            "description": "generated by synth_family.py",
+        }
+        for g in range(n_groups)
+    }
+    return {
+        "name": name,
+        "slug": slug,
+        "icon": "",
+        "headline": f"Synthetic Family: {name}",
+        "subtitle": "Generated test data",
+        "note": "synthetic — not real career data",
+        "groups": groups,
+        "professions": {
+            prof: {
+                "label": prof,
+                "color": PALETTE[i % len(PALETTE)],
+                "annualGraduates": rng.randrange(500, 50_000, 50),
+            }
+            for i, prof in enumerate(professions)
+        },
+    }
+
+
+def build_l1_scores(template_l1, professions, rng):
+    """build l1_scores.yaml with the same category layout as the template.
+
+    every profession gets the template's first profession's data point
+    count per category, filled with seeded 1-10 integer scores.
+    """
+    layout = next(iter(template_l1.values()))["l1_data_points"]
+    out = {}
+    for prof in professions:
+        points = {}
+        for cat_id in sorted(layout):
+            scores = [rng.randint(1, 10) for _ in range(layout[cat_id]["count"])]
+            points[cat_id] = {
+                "scores": scores,
+                "count": len(scores),
+                "average": round(sum(scores) / len(scores), 2),
+            }
+        out[prof] = {"l1_only": {}, "l1_data_points": points}
+    return out
+
+
+def _rubric_value(field_def, rng):
+    """draw a raw value for one rubric field, inside its declared range."""
+    conv = field_def.get("conversion")
+    if conv is None:
+        return rng.choice(TEXT_SNIPPETS)
+    if conv["method"] == "passthrough":
+        return rng.randint(1, 10)
+    lo, hi = conv["min"], conv["max"]
+    if isinstance(lo, int) and isinstance(hi, int):
+        return rng.randint(lo, hi)
+    return round(rng.uniform(lo, hi), 1)
+
+
+def generate_specialty(index, rubric, n_groups, rng):
+    """generate one synthetic specialty dict from the rubric ranges."""
+    name = f"{rng.choice(NAME_WORDS_A)} {rng.choice(NAME_WORDS_B)} {index}"
+    spec = {"name": name, "group": f"group_{rng.randint(1, n_groups)}"}
+    for field_name, field_def in rubric.items():
+        spec[field_name] = _rubric_value(field_def, rng)
+
+    # keep the salary ladder realistic: start <= mid <= typical peak <= peak
+    if {"startSalary", "midSalary", "peakSalary"} <= spec.keys():
+        start, mid, peak = sorted([spec["startSalary"], spec["midSalary"], spec["peakSalary"]])
+        spec["startSalary"], spec["midSalary"], spec["peakSalary"] = start, mid, peak
+        spec["typicalPeak"] = rng.randint(mid, peak)
+
+    # matchComp is recomputed from annualSpots by process.py
+    spec.pop("matchComp", None)
+    spec["annualSpots"] = rng.randint(10, 5000)
+
+    spec["fellowshipOptions"] = rng.choice([None, "Optional 1yr", "Optional 1-2yr", "Required 2yr"])
+    for field_name, (lo, hi) in EXTRA_INT_FIELDS.items():
+        spec[field_name] = rng.randint(lo, hi)
+    spec["aiNarrative"] = f"Synthetic narrative for {name}."
+    return spec
+
+
+def write_family(slug, size, seed=0, template="healthcare", n_professions=4,
+                 n_groups=8, data_dir=None, force=False):
+    """write a synthetic family of `size` specialties to data/<slug>/.
+
+    returns the family directory. specialties are round-robined across
+    professions and streamed to disk one record at a time.
+    """
+    data_dir = Path(data_dir) if data_dir else _repo_data_dir()
+    family_dir = data_dir / slug
+    if family_dir.exists():
+        if not force:
+            raise FileExistsError(f"{family_dir} already exists (use --force to replace)")
+        shutil.rmtree(family_dir)
+    (family_dir / "specialties").mkdir(parents=True)
+
+    rng = random.Random(seed)
+    template_dir = data_dir / template
+    rubric_doc = _load_yaml(template_dir / "scoring_rubric.yaml")
+    rubric = rubric_doc["fields"]
+    professions = rng.sample(sorted(PROFESSION_DEFAULTS), min(n_professions, len(PROFESSION_DEFAULTS)))
+
+    _dump(build_config(slug, f"Synthetic {size:,}", professions, n_groups, rng),
+          family_dir / "config.yaml", f"# config.yaml — synthetic family (seed {seed})")
+    _dump(rubric_doc, family_dir / "scoring_rubric.yaml",
+          f"# scoring_rubric.yaml — copied from {template}")
+    _dump({"professions": build_l1_scores(_load_yaml(template_dir / "l1_scores.yaml")["professions"],
+                                          professions, rng)},
+          family_dir / "l1_scores.yaml", f"# L1 profession-level category scores — synthetic (seed {seed})")
+    shutil.copy(template_dir / "scenario_profiles.yaml", family_dir / "scenario_profiles.yaml")
+
+    files = {}
+    try:
+        for prof in professions:
+            fname = prof.lower().replace("/", "_").replace(" ", "_").replace("+", "_plus") + ".yaml"
+            files[prof] = open(family_dir / "specialties" / fname, "w")
+            files[prof].write(f"# {prof} specialty raw data — synthetic (seed {seed})\n")
+            yaml.safe_dump({"profession": prof}, files[prof], allow_unicode=True)
+            files[prof].write("specialties:\n")
+        for i in range(size):
+            prof = professions[i % len(professions)]
+            spec = generate_specialty(i, rubric, n_groups, rng)
+            files[prof].write(yaml.dump([spec], Dumper=Dumper, sort_keys=False, allow_unicode=True))
+    finally:
+        for f in files.values():
+            f.close()
+
+    return family_dir
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic profession family")
+    parser.add_argument("--slug", required=True, help="family slug (prefix with _ to hide from --all)")
+    parser.add_argument("--size", type=int, required=True, help="number of specialties")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument("--template", default="healthcare", help="family whose rubric/L1 layout to follow")
+    parser.add_argument("--professions", type=int, default=4, help="number of professions")
+    parser.add_argument("--groups", type=int, default=8, help="number of groups")
+    parser.add_argument("--force", action="store_true", help="replace an existing data/<slug>/")
+    args = parser.parse_args()
+
+    try:
+        family_dir = write_family(
+            args.slug, args.size, seed=args.seed, template=args.template,
+            n_professions=args.professions, n_groups=args.groups, force=args.force,
+        )
+    except FileExistsError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"wrote {args.size:,} synthetic specialties to {family_dir}/")
+    print(f"  next: python process.py --family {args.slug} --output /tmp/{args.slug}.json")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+test_import_match.py — csv header handling in import_match's readers
+
+exports spell their headers however they like ("Annual Graduates",
+"annual_graduates", "FAMILY"). the readers resolve each column once with
+_column and must then read rows through the names it returned, not the
+spelling we'd have used. each case writes a small csv to a temp dir.
+
+Usage:
+    python test_import_match.py
+    python -m pytest test_import_match.py
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+from import_match import read_graduates, read_positions
+
+
+def _csv(tmp, text):
+    path = Path(tmp) / "export.csv"
+    path.write_text(text)
+    return path
+
+
+def test_graduates_capitalized_headers():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _csv(tmp, "Family,Profession,Annual Graduates\nhealthcare,MD/DO,\"30,000\"\nlaw, JD ,35000\n")
+        grads = read_graduates(path)
+    assert grads == {("healthcare", "MD/DO"): 30000, ("law", "JD"): 35000}, grads
+
+
+def test_graduates_separator_variants():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _csv(tmp, "FAMILY,profession,annual_graduates\nlaw,JD,35000\n")
+        assert read_graduates(path) == {("law", "JD"): 35000}
+
+
+def test_graduates_missing_column():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _csv(tmp, "Family,Annual Graduates\nlaw,35000\n")
+        try:
+            read_graduates(path)
+        except ValueError as e:
+            assert "no profession column" in str(e), e
+        else:
+            raise AssertionError("read_graduates accepted a csv without a profession column")
+
+
+def test_positions_capitalized_headers():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _csv(tmp, "Program Name,Positions Offered,Family\nDermatology,12,healthcare\n")
+        rows = read_positions([path], name_col="Program Name", spots_col="positions offered")
+    assert [r[1:] for r in rows] == [("Dermatology", "healthcare", None, 12)], rows
+
+
+def main():
+    tests = [(name, fn) for name, fn in globals().items() if name.startswith("test_") and callable(fn)]
+    failures = []
+    for name, fn in tests:
+        try:
+            fn()
+        except AssertionError as e:
+            failures.append(f"{name}: {e}")
+    if failures:
+        print(f"FAILED — {len(failures)} of {len(tests)} cases:")
+        for failure in failures:
+            print(f"  x {failure}")
+        sys.exit(1)
+    print(f"PASSED — {len(tests)} import_match cases")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+test_patch_fields.py — in-place yaml edits of block values and new fields
+
+patch_fields edits specialty files as text at each value's position; the
+awkward spans are block values (| / > scalars, block lists and mappings),
+whose end marks sit on the next key. each case patches a small family in
+a temp dir and checks the result parses, has the new values, and leaves
+everything else (comments included) as it was.
+
+Usage:
+    python test_patch_fields.py
+    python -m pytest test_patch_fields.py
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+import yaml
+
+from patch_fields import Update, YamlFile, apply_updates
+
+SPECIALTIES = """\
+profession: MD
+specialties:
+  - name: Block
+    notes: |
+      line one
+      line two
+
+    tags:
+      - a
+      - b
+    # kept: comment after the list
+    hoursWeek: 50
+  - name: Flush
+    tags:
+    - a
+    extra:
+      x: 1
+      y: [1, 2]
+  - name: Folded
+    hoursWeek: 40
+    summary: >
+      folded text
+      over two lines
+"""
+
+
+def _family(tmp):
+    spec_dir = Path(tmp) / "fam" / "specialties"
+    spec_dir.mkdir(parents=True)
+    path = spec_dir / "md.yaml"
+    path.write_text(SPECIALTIES)
+    return path
+
+
+def _patch(tmp, *changes):
+    path = _family(tmp)
+    updates = [Update("fam", "MD", spec, field, value, f"case:{i}")
+               for i, (spec, field, value) in enumerate(changes)]
+    applied, unmatched, written = apply_updates(updates, Path(tmp))
+    assert not unmatched, unmatched
+    assert written == [path], written
+    text = path.read_text()
+    specs = {s["name"]: s for s in yaml.safe_load(text)["specialties"]}
+    return text, specs
+
+
+def test_block_scalar_and_sequence():
+    with tempfile.TemporaryDirectory() as tmp:
+        text, specs = _patch(tmp, ("Block", "notes", "short"), ("Block", "tags", "x"))
+    assert specs["Block"] == {"name": "Block", "notes": "short", "tags": "x", "hoursWeek": 50}
+    assert '    notes: "short"\n' in text and '    tags: "x"\n' in text
+    assert "    # kept: comment after the list\n    hoursWeek: 50\n" in text
+
+
+def test_flush_sequence_and_block_mapping():
+    with tempfile.TemporaryDirectory() as tmp:
+        text, specs = _patch(tmp, ("Flush", "tags", ["p", "q"]), ("Flush", "extra", {"z": 2}))
+    assert specs["Flush"] == {"name": "Flush", "tags": ["p", "q"], "extra": {"z": 2}}
+    assert specs["Folded"]["summary"] == "folded text over two lines\n"
+
+
+def test_new_fields_after_block_values():
+    with tempfile.TemporaryDirectory() as tmp:
+        text, specs = _patch(tmp, ("Flush", "stress", 3), ("Folded", "stress", 4),
+                             ("Folded", "tier", "high"))
+    assert specs["Flush"]["extra"] == {"x": 1, "y": [1, 2]} and specs["Flush"]["stress"] == 3
+    assert specs["Folded"]["summary"] == "folded text over two lines\n"
+    assert specs["Folded"]["stress"] == 4 and specs["Folded"]["tier"] == "high"
+    assert text.endswith("      over two lines\n    stress: 4\n    tier: high\n")
+
+
+def test_unparseable_edit_is_not_written():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _family(tmp)
+        doc = YamlFile(path)
+        doc.edits[(0, 0, "")] = "[unclosed\n"
+        try:
+            doc.save()
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("save() wrote a file that doesn't parse")
+        assert path.read_text() == SPECIALTIES
+
+
+def main():
+    tests = [(name, fn) for name, fn in globals().items() if name.startswith("test_") and callable(fn)]
+    failures = []
+    for name, fn in tests:
+        try:
+            fn()
+        except AssertionError as e:
+            failures.append(f"{name}: {e}")
+    if failures:
+        print(f"FAILED — {len(failures)} of {len(tests)} cases:")
+        for failure in failures:
+            print(f"  x {failure}")
+        sys.exit(1)
+    print(f"PASSED — {len(tests)} patch_fields cases")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,36 +2,73 @@
 """
 test_regression.py — verify pipeline output hasn't changed unexpectedly
 
-Saves a reference copy of the current JSON, re-runs the pipeline,
-and compares the output field by field. Reports differences.
+Rebuilds every family in-process (no subprocess, no temp file) and compares
+it with the committed src/data/<family>.json, field by field. Families run
+in parallel. Tracks whose content hash matches the reference are skipped
+without a walk; numbers compare within a tolerance.
+
+Families with a ground_truth.yaml are also checked against the excel-era
+scores: their error stats must match ground_truth_baseline.json (see
+ground_truth.py).
 
 Usage:
-    python test_regression.py                     # test healthcare (default)
-    python test_regression.py --family engineering
+    python test_regression.py                          # every family
+    python test_regression.py --family engineering     # just one (repeatable)
+    python test_regression.py --abs-tol 0.05           # looser numbers everywhere
+    python test_regression.py --tol financial=1 --tol radar=0.1
 """
 
 import argparse
+import contextlib
+import io
 import json
+import math
+import os
 import sys
-import tempfile
-import subprocess
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+from config import list_families
+from delta import format_summary, summarize, track_hash
+from ground_truth import check_output, compare_to_baseline, format_report, load_baseline
+
 # fields that are expected to change between runs
 IGNORE_KEYS = {"last_updated"}
 
+# default numeric tolerance: float noise only
+ABS_TOL = 1e-9
+REL_TOL = 1e-9
+
+REPO_ROOT = Path(__file__).parent.parent
+
+
+def _is_number(v):
+    return isinstance(v, (int, float)) and not isinstance(v, bool)
+
+
+def deep_diff(a, b, path="", tol=(ABS_TOL, REL_TOL), field_tols=None):
+    """recursively compare two JSON-like structures, return list of differences.
 
-def deep_diff(a, b, path=""):
-    """recursively compare two JSON-like structures, return list of differences."""
+    numbers are equal within tol = (abs, rel); field_tols ({key: abs}) sets
+    the absolute tolerance for everything under a dict key.
+    """
+    if a == b and type(a) == type(b):
+        return []
     diffs = []
 
+    if _is_number(a) and _is_number(b):
+        if not math.isclose(a, b, rel_tol=tol[1], abs_tol=tol[0]):
+            diffs.append(f"{path}: {a} -> {b}")
+        return diffs
+
     if type(a) != type(b):
         diffs.append(f"{path}: type mismatch ({type(a).__name__} vs {type(b).__name__})")
         return diffs
 
     if isinstance(a, dict):
         all_keys = set(a.keys()) | set(b.keys())
-        for k in sorted(all_keys):
+        for k in sorted(all_keys, key=str):
             if k in IGNORE_KEYS:
                 continue
             key_path = f"{path}.{k}" if path else k
@@ -40,12 +77,13 @@ def deep_diff(a, b, path=""):
             elif k not in b:
                 diffs.append(f"{key_path}: MISSING key (was in reference)")
             else:
-                diffs.extend(deep_diff(a[k], b[k], key_path))
+                key_tol = (field_tols[k], tol[1]) if field_tols and k in field_tols else tol
+                diffs.extend(deep_diff(a[k], b[k], key_path, key_tol, field_tols))
     elif isinstance(a, list):
         if len(a) != len(b):
             diffs.append(f"{path}: list length {len(a)} vs {len(b)}")
         for i in range(min(len(a), len(b))):
-            diffs.extend(deep_diff(a[i], b[i], f"{path}[{i}]"))
+            diffs.extend(deep_diff(a[i], b[i], f"{path}[{i}]", tol, field_tols))
     else:
         if a != b:
             a_str = str(a)[:80]
@@ -55,58 +93,138 @@ def deep_diff(a, b, path=""):
     return diffs
 
 
-def main():
-    parser = argparse.ArgumentParser(description="Pipeline regression test")
-    parser.add_argument("--family", default="healthcare", help="Family slug to test")
-    args = parser.parse_args()
+def diff_outputs(reference, fresh, tol=(ABS_TOL, REL_TOL), field_tols=None):
+    """deep_diff for a whole family output.
 
-    repo_root = Path(__file__).parent.parent
-    json_path = repo_root / "src" / "data" / f"{args.family}.json"
-    pipeline_dir = Path(__file__).parent
+    tracks are matched by key and only walked when their content hashes
+    differ; everything else goes through deep_diff.
+    """
+    diffs = []
+    ref_rest = {k: v for k, v in reference.items() if k != "tracks"}
+    new_rest = {k: v for k, v in fresh.items() if k != "tracks"}
+    diffs.extend(deep_diff(ref_rest, new_rest, "", tol, field_tols))
+
+    ref_tracks = {t["key"]: (i, t) for i, t in enumerate(reference.get("tracks", []))}
+    new_tracks = {t["key"]: (i, t) for i, t in enumerate(fresh.get("tracks", []))}
+    for key, (i, old) in ref_tracks.items():
+        if key not in new_tracks:
+            diffs.append(f"tracks[{i}] ({key}): MISSING track (was in reference)")
+            continue
+        j, new = new_tracks[key]
+        if i != j:
+            diffs.append(f"tracks[{i}] ({key}): moved to tracks[{j}]")
+        if track_hash(old) != track_hash(new):
+            diffs.extend(deep_diff(old, new, f"tracks[{i}] ({key})", tol, field_tols))
+    for key, (j, _) in new_tracks.items():
+        if key not in ref_tracks:
+            diffs.append(f"tracks[{j}] ({key}): NEW track (not in reference)")
+    return diffs
 
-    if not json_path.exists():
-        print(f"ERROR: {json_path} not found — run the pipeline first", file=sys.stderr)
-        sys.exit(1)
 
-    # load current (reference) output
+def check_family(family, tol=(ABS_TOL, REL_TOL), field_tols=None):
+    """rebuild one family in-process and diff it against its committed json.
+
+    returns (family, diffs, change summary lines, ground truth lines,
+    ground truth stats that moved, error or None).
+    """
+    from process import build_family
+
+    json_path = REPO_ROOT / "src" / "data" / f"{family}.json"
+    if not json_path.exists():
+        return family, [], [], [], [], f"{json_path} not found — run the pipeline first"
     with open(json_path) as f:
         reference = json.load(f)
 
-    print(f"Reference loaded: {json_path}")
-    print(f"Re-running pipeline for '{args.family}'...")
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            fresh = build_family(family)
+    except Exception as e:
+        return family, [], [], [], [], f"pipeline failed: {type(e).__name__}: {e}"
 
-    # re-run pipeline to a temp file
-    with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as tmp:
-        tmp_path = tmp.name
+    diffs = diff_outputs(reference, fresh, tol, field_tols)
+    summary = format_summary(summarize(reference, fresh)) if diffs else []
 
-    result = subprocess.run(
-        [sys.executable, str(pipeline_dir / "process.py"),
-         "--family", args.family, "--output", tmp_path],
-        capture_output=True, text=True
-    )
+    truth_lines, moved = [], []
+    report = check_output(family, fresh)
+    if report is not None:
+        truth_lines = format_report(family, report, outlier_limit=0)
+        moved = compare_to_baseline(family, report, load_baseline())
+    return family, diffs, summary, truth_lines, moved, None
 
-    if result.returncode != 0:
-        print(f"ERROR: pipeline failed:\n{result.stderr}", file=sys.stderr)
-        sys.exit(1)
 
-    with open(tmp_path) as f:
-        fresh = json.load(f)
+def _check_args(args):
+    return check_family(*args)
+
 
-    Path(tmp_path).unlink()
+def parse_field_tols(items):
+    """{key: abs tolerance} from ["financial=1", ...]."""
+    tols = {}
+    for item in items or []:
+        key, sep, value = item.partition("=")
+        if not sep:
+            raise argparse.ArgumentTypeError(f"--tol expects key=value, got {item!r}")
+        tols[key] = float(value)
+    return tols
 
-    # compare
-    diffs = deep_diff(reference, fresh)
 
-    if not diffs:
-        print("PASSED — output identical to reference (ignoring: " +
-              ", ".join(IGNORE_KEYS) + ")")
+def main():
+    parser = argparse.ArgumentParser(description="Pipeline regression test")
+    parser.add_argument("--family", action="append", help="Family slug to test (default: all, repeatable)")
+    parser.add_argument("--abs-tol", type=float, default=ABS_TOL, help="absolute tolerance for numbers")
+    parser.add_argument("--rel-tol", type=float, default=REL_TOL, help="relative tolerance for numbers")
+    parser.add_argument("--tol", action="append", metavar="KEY=ABS",
+                        help="absolute tolerance for everything under a field (repeatable)")
+    parser.add_argument("--jobs", "-j", type=int, help="parallel processes (default: cpu count)")
+    args = parser.parse_args()
+
+    families = args.family or list_families()
+    tol = (args.abs_tol, args.rel_tol)
+    field_tols = parse_field_tols(args.tol)
+    work = [(fam, tol, field_tols) for fam in families]
+
+    t0 = time.perf_counter()
+    jobs = min(args.jobs or os.cpu_count() or 1, len(work))
+    if jobs <= 1:
+        results = [check_family(*w) for w in work]
     else:
-        print(f"DIFFERENCES FOUND ({len(diffs)}):")
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(_check_args, work))
+    elapsed = time.perf_counter() - t0
+
+    failed = 0
+    for family, diffs, summary, truth_lines, moved, error in results:
+        if error:
+            failed += 1
+            print(f"ERROR  {family}: {error}")
+            continue
+        for line in truth_lines:
+            print(f"       {line}")
+        if moved:
+            failed += 1
+            print(f"FAIL   {family}: GROUND TRUTH ERRORS MOVED ({len(moved)}):")
+            for m in moved:
+                print(f"  {m}")
+        if not diffs:
+            if not moved:
+                print(f"ok     {family}")
+            continue
+        if not moved:
+            failed += 1
+        print(f"FAIL   {family}: DIFFERENCES FOUND ({len(diffs)}):")
         for d in diffs[:50]:
             print(f"  {d}")
         if len(diffs) > 50:
             print(f"  ... and {len(diffs) - 50} more")
+        print("\n  CHANGE SUMMARY (by track):")
+        for line in summary:
+            print(f"    {line}")
+
+    ignoring = ", ".join(sorted(IGNORE_KEYS))
+    if failed:
+        print(f"\nFAILED — {failed} of {len(results)} families differ ({elapsed:.1f}s)")
         sys.exit(1)
+    print(f"\nPASSED — {len(results)} families identical to reference "
+          f"(ignoring: {ignoring}; abs tol {tol[0]:g}) in {elapsed:.1f}s")
 
 
 if __name__ == "__main__":
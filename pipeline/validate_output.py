@@ -0,0 +1,387 @@
+#!/usr/bin/env python3
+"""
+validate_output.py — schema-driven validation of the pipeline output
+
+checks every track of every family, not just the first few, and reports
+every error instead of stopping at the first:
+
+- types and ranges of every track field (scores, radar, stress, scenario
+  totals, raw data), from TRACK_SCHEMA
+- unique track keys; careers, counts and group / profession references
+  agree with the tracks
+- profession_financial_defaults is complete and covers every track's
+  profession; financial checks resolve against it, not the pipeline's table
+- trajectories that must not go backwards: start <= mid <= peak salary,
+  typical <= peak, training stages in order without overlap, earning
+  starts after training
+- derived blocks (rankings, pareto, decision_table) point at real tracks
+
+the schema is compiled once into nested check functions, so validating a
+family is a single pass with no schema interpretation per track. families
+are validated in parallel processes.
+
+usage:
+  python validate_output.py                     # every src/data/<family>.json
+  python validate_output.py ../src/data/law.json
+  python process.py --validate ../src/data/law.json
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from config import CATEGORIES, RADAR_DIMENSIONS, list_families
+from financial import financial_defaults_for, resolve_financial
+
+REPO_ROOT = Path(__file__).parent.parent
+
+# ---- schema ----
+
+def _num(lo=None, hi=None):
+    return {"type": "number", "min": lo, "max": hi}
+
+
+SCORE = _num(1, 10)
+PERCENT = _num(0, 100)
+RATING = _num(0, 10)
+NON_NEGATIVE = _num(0)
+
+TRACK_SCHEMA = {
+    "type": "object",
+    "fields": {
+        "name": {"type": "str", "nonempty": True},
+        "key": {"type": "str", "nonempty": True},
+        "profession": {"type": "str", "nonempty": True},
+        "group": {"type": "str"},
+        "color": {"type": "color"},
+        "path": {"type": "str"},
+        "raw_data": {
+            "type": "object",
+            "fields": {
+                "startSalary": NON_NEGATIVE,
+                "midSalary": NON_NEGATIVE,
+                "peakSalary": NON_NEGATIVE,
+                "typicalPeak": NON_NEGATIVE,
+                "hoursWeek": _num(0, 100),
+                "burnout": PERCENT,
+                "satisfaction": PERCENT,
+                "chooseAgain": PERCENT,
+                "malpracticeCost": NON_NEGATIVE,
+                "vacation": NON_NEGATIVE,
+                "matchComp": RATING,
+                "annualSpots": NON_NEGATIVE,
+                "oneInX": NON_NEGATIVE,
+                "callSchedule": RATING,
+                "physicalToll": RATING,
+                "emotionalToll": RATING,
+                "aiRiskNow": RATING,
+                "aiRiskMedium": RATING,
+                "aiRiskLong": RATING,
+                "aiNarrative": {"type": "str"},
+            },
+        },
+        "scores": {
+            "type": "object",
+            "fields": {f"category_{cat['id']}": SCORE for cat in CATEGORIES},
+        },
+        "radar": {
+            "type": "object",
+            "fields": {dim["dim"]: SCORE for dim in RADAR_DIMENSIONS},
+        },
+        "scenario_totals": {"type": "object", "values": SCORE, "nonempty": True},
+        "financial": {"type": "object", "values": {"type": "number"}},
+        "stress": {
+            "type": "object",
+            "fields": {k: SCORE for k in ("ai", "pay", "injury", "match")},
+        },
+        "timeline": {
+            "type": "object",
+            "fields": {
+                "college": {"type": "span"},
+                "school": {"type": "span"},
+                "residency": {"type": "span"},
+                "fellowship": {"type": "span"},
+                "earnAge": _num(14, 80),
+                "startSalary": NON_NEGATIVE,
+            },
+        },
+    },
+}
+
+
+def _is_number(v):
+    return isinstance(v, (int, float)) and not isinstance(v, bool)
+
+
+def compile_schema(spec):
+    """turn a schema node into check(value, path, errors)."""
+    kind = spec["type"]
+
+    if kind == "number":
+        lo, hi = spec.get("min"), spec.get("max")
+
+        def check(v, path, errors):
+            if not _is_number(v):
+                errors.append(f"{path}: expected a number, got {type(v).__name__}")
+            elif lo is not None and v < lo:
+                errors.append(f"{path}: {v} < {lo}")
+            elif hi is not None and v > hi:
+                errors.append(f"{path}: {v} > {hi}")
+        return check
+
+    if kind == "str":
+        nonempty = spec.get("nonempty", False)
+
+        def check(v, path, errors):
+            if not isinstance(v, str):
+                errors.append(f"{path}: expected a string, got {type(v).__name__}")
+            elif nonempty and not v:
+                errors.append(f"{path}: empty")
+        return check
+
+    if kind == "color":
+        def check(v, path, errors):
+            if not (isinstance(v, str) and len(v) == 7 and v[0] == "#"
+                    and all(c in "0123456789abcdefABCDEF" for c in v[1:])):
+                errors.append(f"{path}: not a #rrggbb color: {v!r}")
+        return check
+
+    if kind == "span":
+        # a training stage the track doesn't have is null
+        def check(v, path, errors):
+            if v is None:
+                return
+            if not (isinstance(v, list) and len(v) == 2 and all(map(_is_number, v))):
+                errors.append(f"{path}: expected [start, end] ages, got {v!r}")
+            elif v[0] > v[1]:
+                errors.append(f"{path}: ends before it starts {v}")
+        return check
+
+    if kind == "object":
+        fields = {k: compile_schema(s) for k, s in spec.get("fields", {}).items()}
+        values = compile_schema(spec["values"]) if "values" in spec else None
+        nonempty = spec.get("nonempty", False)
+
+        def check(v, path, errors):
+            if not isinstance(v, dict):
+                errors.append(f"{path}: expected an object, got {type(v).__name__}")
+                return
+            if nonempty and not v:
+                errors.append(f"{path}: empty")
+            for k, field_check in fields.items():
+                if k not in v:
+                    errors.append(f"{path}.{k}: missing")
+                else:
+                    field_check(v[k], f"{path}.{k}", errors)
+            if values is not None:
+                for k, item in v.items():
+                    values(item, f"{path}.{k}", errors)
+        return check
+
+    raise ValueError(f"unknown schema type: {kind}")
+
+
+# compiled once per process
+CHECK_TRACK = compile_schema(TRACK_SCHEMA)
+
+TIMELINE_STAGES = ("college", "school", "residency", "fellowship")
+
+# every profession_financial_defaults entry needs the full set the model uses
+DEFAULT_FINANCIAL_KEYS = tuple(financial_defaults_for("MD/DO"))
+
+
+# ---- cross-field checks ----
+
+def _check_trajectories(track, path, errors, financial_defaults):
+    """salary and training trajectories that must not go backwards.
+
+    the track's financial params are resolved against the file's own
+    profession_financial_defaults, not the pipeline's.
+    """
+    raw = track.get("raw_data", {})
+    salaries = [raw.get(k) for k in ("startSalary", "midSalary", "peakSalary")]
+    if all(map(_is_number, salaries)) and not salaries[0] <= salaries[1] <= salaries[2]:
+        errors.append(f"{path}.raw_data: start/mid/peak salary not increasing {salaries}")
+    typical, peak = raw.get("typicalPeak"), raw.get("peakSalary")
+    if _is_number(typical) and _is_number(peak) and typical > peak:
+        errors.append(f"{path}.raw_data: typicalPeak {typical} > peakSalary {peak}")
+
+    fin = resolve_financial(track.get("financial", {}), track.get("profession", ""), financial_defaults)
+    fin_salaries = [fin.get(k) for k in ("starting_salary", "mid_salary", "peak_salary")]
+    if all(map(_is_number, fin_salaries)) and not fin_salaries[0] <= fin_salaries[1] <= fin_salaries[2]:
+        errors.append(f"{path}.financial: starting/mid/peak salary not increasing {fin_salaries}")
+
+    timeline = track.get("timeline", {})
+    prev_end = None
+    for stage in TIMELINE_STAGES:
+        span = timeline.get(stage)
+        if not (isinstance(span, list) and len(span) == 2):
+            continue
+        if prev_end is not None and span[0] < prev_end:
+            errors.append(f"{path}.timeline.{stage}: starts at {span[0]}, before the previous stage ends ({prev_end})")
+        prev_end = span[1]
+    earn = timeline.get("earnAge")
+    if prev_end is not None and _is_number(earn) and earn < prev_end:
+        errors.append(f"{path}.timeline.earnAge: {earn} is before training ends ({prev_end})")
+
+
+def _check_indices(indices, n, path, errors):
+    bad = [i for i in indices if not (isinstance(i, int) and 0 <= i < n)]
+    if bad:
+        errors.append(f"{path}: track indices out of range {bad[:5]}")
+
+
+def _check_derived(data, keys, errors):
+    """rankings, pareto and decision_table agree with the tracks."""
+    n = len(data["tracks"])
+    rankings = data.get("rankings")
+    if rankings:
+        for metric, order in rankings.get("order", {}).items():
+            if sorted(order) != list(range(n)):
+                errors.append(f"rankings.order.{metric}: not a permutation of the {n} tracks")
+        for section in ("rank", "percentile", "group_rank", "group_percentile"):
+            for metric, values in rankings.get(section, {}).items():
+                if len(values) != n:
+                    errors.append(f"rankings.{section}.{metric}: {len(values)} values for {n} tracks")
+
+    for i, frontier in enumerate(data.get("pareto", [])):
+        path = f"pareto[{i}] ({frontier.get('id')})"
+        front, dominated = frontier.get("frontier", []), frontier.get("dominated", [])
+        _check_indices(front + dominated, n, path, errors)
+        if sorted(front + dominated) != list(range(n)):
+            errors.append(f"{path}: frontier + dominated don't cover every track exactly once")
+        if n and not front:
+            errors.append(f"{path}: empty frontier")
+
+    table = data.get("decision_table") or {}
+    for path, result in table.get("results", {}).items():
+        if result.get("key") not in keys:
+            errors.append(f"decision_table.results.{path}: '{result.get('key')}' is not a track")
+
+
+def validate_output(data):
+    """every problem with one family's output, as a list of messages."""
+    errors = []
+    for section in ("meta", "professions", "groups", "careers", "tracks"):
+        if section not in data:
+            errors.append(f"{section}: missing")
+    if errors:
+        return errors
+
+    tracks = data["tracks"]
+    if not tracks:
+        errors.append("tracks: empty")
+
+    financial_defaults = data.get("profession_financial_defaults")
+    if not isinstance(financial_defaults, dict):
+        errors.append("profession_financial_defaults: missing")
+        financial_defaults = {}
+    for prof, defaults in financial_defaults.items():
+        missing = [k for k in DEFAULT_FINANCIAL_KEYS if not _is_number((defaults or {}).get(k))]
+        if missing:
+            errors.append(f"profession_financial_defaults.{prof}: missing or not a number: {', '.join(missing)}")
+
+    seen = {}
+    for i, t in enumerate(tracks):
+        path = f"tracks[{i}]"
+        if isinstance(t, dict) and isinstance(t.get("key"), str):
+            path += f" ({t['key']})"
+        CHECK_TRACK(t, path, errors)
+        if not isinstance(t, dict):
+            continue
+        _check_trajectories(t, path, errors, financial_defaults)
+
+        key = t.get("key")
+        if key in seen:
+            errors.append(f"{path}: duplicate key (also tracks[{seen[key]}])")
+        seen.setdefault(key, i)
+        if t.get("profession") not in data["professions"]:
+            errors.append(f"{path}.profession: '{t.get('profession')}' is not in professions")
+        if t.get("profession") not in financial_defaults:
+            errors.append(f"{path}.profession: '{t.get('profession')}' is not in profession_financial_defaults")
+        if data["groups"] and t.get("group") not in data["groups"]:
+            errors.append(f"{path}.group: '{t.get('group')}' is not in groups")
+
+    keys = [t.get("key") for t in tracks if isinstance(t, dict)]
+    if data["meta"].get("total_tracks") != len(tracks):
+        errors.append(f"meta.total_tracks: {data['meta'].get('total_tracks')} but there are {len(tracks)} tracks")
+    career_keys = [c.get("key") for c in data["careers"]]
+    if career_keys != keys:
+        errors.append("careers: keys don't match the tracks (same keys, same order)")
+    for prof, info in data["professions"].items():
+        count = sum(1 for t in tracks if isinstance(t, dict) and t.get("profession") == prof)
+        if info.get("track_count") != count:
+            errors.append(f"professions.{prof}.track_count: {info.get('track_count')} but {count} tracks")
+    for slug, info in data["groups"].items():
+        count = sum(1 for t in tracks if isinstance(t, dict) and t.get("group") == slug)
+        if info.get("count") != count:
+            errors.append(f"groups.{slug}.count: {info.get('count')} but {count} tracks")
+
+    _check_derived(data, set(keys), errors)
+    return errors
+
+
+def validate_file(json_path):
+    """(path, track count, errors) for one output file."""
+    try:
+        with open(json_path) as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        return str(json_path), 0, [f"can't read: {e}"]
+    n = len(data.get("tracks", [])) if isinstance(data, dict) else 0
+    return str(json_path), n, validate_output(data)
+
+
+def validate_files(paths, jobs=None):
+    """validate_file() over paths, in parallel when there is more than one."""
+    jobs = min(jobs or os.cpu_count() or 1, len(paths))
+    if jobs <= 1:
+        return [validate_file(p) for p in paths]
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(validate_file, paths))
+
+
+def print_results(results, limit=50):
+    """print a per-file report. returns True if everything passed."""
+    ok = True
+    for path, n, errors in results:
+        name = Path(path).name
+        if not errors:
+            print(f"  ok    {name:<22} {n} tracks")
+            continue
+        ok = False
+        print(f"  FAIL  {name:<22} {len(errors)} errors")
+        for e in errors[:limit]:
+            print(f"          x {e}")
+        if len(errors) > limit:
+            print(f"          ... and {len(errors) - limit} more")
+    return ok
+
+
+def default_paths():
+    data_dir = REPO_ROOT / "src" / "data"
+    return [data_dir / f"{fam}.json" for fam in list_families()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate pipeline output files")
+    parser.add_argument("paths", nargs="*", help="output json files (default: all families)")
+    parser.add_argument("--jobs", "-j", type=int, help="parallel processes (default: cpu count)")
+    args = parser.parse_args()
+
+    paths = args.paths or default_paths()
+    t0 = time.perf_counter()
+    results = validate_files(paths, args.jobs)
+    ok = print_results(results)
+    total = sum(n for _, n, _ in results)
+    print(f"\n{'PASSED' if ok else 'FAILED'} — {len(results)} files, {total} tracks "
+          f"in {(time.perf_counter() - t0) * 1000:.0f} ms")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
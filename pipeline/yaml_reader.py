@@ -9,6 +9,8 @@ YAML files under data/<family>/.
 import yaml
 from pathlib import Path
 
+from specialty import FieldTable, Specialty
+
 
 def _data_dir(family_slug):
     """return the data directory for a family."""
@@ -20,16 +22,19 @@ def load_specialties(family_slug):
     """load all specialty raw data from YAML files.
 
     reads every file in data/<family>/specialties/*.yaml and returns
-    a flat list of specialty dicts, each with a 'profession' key added.
+    a flat list of Specialty records (see specialty.py) sharing one field
+    table, each with a 'profession' field added and its position as .index.
     """
     spec_dir = _data_dir(family_slug) / "specialties"
+    fields = FieldTable()
     all_specialties = []
 
     for yaml_file in sorted(spec_dir.glob("*.yaml")):
         with open(yaml_file) as f:
             data = yaml.safe_load(f)
         profession = data["profession"]
-        for spec in data["specialties"]:
+        for raw in data["specialties"]:
+            spec = Specialty(fields, len(all_specialties), raw)
             spec["profession"] = profession
             all_specialties.append(spec)
 
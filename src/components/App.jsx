@@ -1,16 +1,11 @@
 // App.jsx — Main app shell
 // Multi-family support: FamilyPicker → 4 tabs (Explore, Compare, Quiz, Sources)
 // Manages family state + picks state (persisted in localStorage) and derives chart data.
+// Family data is fetched lazily: the manifest (family list + careers index) first,
+// then only the family shards that are opened or have picks on the Compare tab.
 
 import { useState, useEffect, useMemo } from "react";
-import healthcareData from "../data/healthcare.json";
-import lawData from "../data/law.json";
-import engineeringData from "../data/engineering.json";
-import businessData from "../data/business.json";
-import governmentData from "../data/government.json";
-import tradesData from "../data/trades.json";
-import educationData from "../data/education.json";
-import futureData from "../data/future.json";
+import { loadManifest, loadFamily } from "../utils/loadData";
 import {
   buildNetWorthFromTracks,
   buildRadarFromTracks,
@@ -27,17 +22,8 @@ import Sources from "./Sources";
 import Methodology from "./Methodology";
 import PicksBar from "./PicksBar";
 
-// all available profession families
-const FAMILIES = {
-  healthcare: healthcareData,
-  law: lawData,
-  engineering: engineeringData,
-  business: businessData,
-  government: governmentData,
-  trades: tradesData,
-  education: educationData,
-  future: futureData,
-};
+// picker order; families the manifest adds later follow, alphabetically
+const FAMILY_ORDER = ["healthcare", "law", "engineering", "business", "government", "trades", "education", "future"];
 
 const MAX_PICKS = 6;
 const FAMILY_KEY = "crossrd-family";
@@ -45,6 +31,23 @@ const FAMILY_KEY = "crossrd-family";
 export default function App() {
   const [tab, setTab] = useState("explore");
 
+  // manifest + the family outputs loaded so far ({ slug: data })
+  const [manifest, setManifest] = useState(null);
+  const [loadError, setLoadError] = useState(null);
+  const [loaded, setLoaded] = useState({});
+
+  useEffect(() => {
+    loadManifest().then(setManifest, setLoadError);
+  }, []);
+
+  const requestFamily = (slug) => {
+    if (loaded[slug]) return;
+    loadFamily(slug).then(
+      (fd) => setLoaded((prev) => ({ ...prev, [slug]: fd })),
+      setLoadError
+    );
+  };
+
   // family state — null = show picker
   const [family, setFamily] = useState(() => {
     try {
@@ -66,29 +69,26 @@ export default function App() {
   // per-family picks storage key
   const storageKey = family ? `crossrd-picks-${family}` : null;
 
-  // current dataset
-  const data = family ? FAMILIES[family] : null;
+  // current dataset (null while its shard is loading)
+  const familyEntry = family ? manifest?.families[family] : null;
+  const data = familyEntry ? loaded[family] : null;
 
-  // valid keys for this dataset
+  useEffect(() => {
+    if (familyEntry) requestFamily(family);
+  }, [family, familyEntry]);
+
+  // valid keys for this family, from the manifest's careers index
   const validKeys = useMemo(
-    () => (data ? new Set(data.careers.map((c) => c.key)) : new Set()),
-    [data]
+    () => new Set((manifest?.careers || []).filter((c) => c.family === family).map((c) => c.key)),
+    [manifest, family]
   );
 
-  // picks state — restored from localStorage (per family)
-  const [picks, setPicks] = useState(() => {
-    if (!storageKey) return [];
-    try {
-      const saved = localStorage.getItem(storageKey);
-      if (saved) {
-        return JSON.parse(saved).filter((k) => validKeys.has(k));
-      }
-    } catch {}
-    return [];
-  });
+  // picks state — restored from localStorage (per family) once the manifest is in
+  const [picks, setPicks] = useState([]);
 
   // reload picks when family changes
   useEffect(() => {
+    if (!manifest) return;
     if (!storageKey) {
       setPicks([]);
       return;
@@ -104,14 +104,14 @@ export default function App() {
     } catch {
       setPicks([]);
     }
-  }, [family, storageKey, validKeys]);
+  }, [manifest, family, storageKey, validKeys]);
 
-  // persist picks
+  // persist picks (not before they've been restored)
   useEffect(() => {
-    if (storageKey) {
+    if (storageKey && manifest) {
       localStorage.setItem(storageKey, JSON.stringify(picks));
     }
-  }, [picks, storageKey]);
+  }, [picks, storageKey, manifest]);
 
   const togglePick = (key) => {
     setPicks((prev) => {
@@ -130,55 +130,68 @@ export default function App() {
   // tick counter to force re-derive when other families' picks change
   const [mergedTick, setMergedTick] = useState(0);
 
+  const families = useMemo(() => {
+    const rank = (slug) => (FAMILY_ORDER.includes(slug) ? FAMILY_ORDER.indexOf(slug) : FAMILY_ORDER.length);
+    const entries = Object.entries(manifest?.families || {});
+    return Object.fromEntries(entries.sort(([a], [b]) => rank(a) - rank(b)));
+  }, [manifest]);
+
+  // careers of every family come with the manifest; tracks only from the
+  // families loaded so far (the Compare tab loads the ones with picks)
   const mergedTracks = useMemo(() => {
     const tracks = [];
-    for (const [slug, fd] of Object.entries(FAMILIES)) {
+    for (const [slug, fd] of Object.entries(loaded)) {
       for (const t of fd.tracks) {
         tracks.push({ ...t, family: slug });
       }
     }
     return tracks;
-  }, []);
+  }, [loaded]);
 
   const mergedCareers = useMemo(() => {
     const careers = [];
-    for (const [slug, fd] of Object.entries(FAMILIES)) {
-      for (const c of fd.careers) {
-        const track = fd.tracks.find((t) => t.key === c.key);
-        careers.push({
-          ...c,
-          profession: track?.profession || "",
-          family: slug,
-          familyIcon: fd.meta.icon,
-          familyName: fd.meta.family_name,
-        });
+    for (const [slug, entry] of Object.entries(families)) {
+      for (const c of manifest.careers) {
+        if (c.family === slug) {
+          careers.push({ ...c, familyIcon: entry.icon, familyName: entry.name });
+        }
       }
     }
     return careers;
-  }, []);
+  }, [manifest, families]);
+
+  // profession financial defaults from every loaded family (profession names
+  // are shared across families, so one table resolves any merged track)
+  const mergedFinancialDefaults = useMemo(() => {
+    const defaults = {};
+    for (const fd of Object.values(loaded)) {
+      Object.assign(defaults, fd.profession_financial_defaults);
+    }
+    return defaults;
+  }, [loaded]);
 
   const mergedProfColors = useMemo(() => {
     const colors = {};
-    for (const fd of Object.values(FAMILIES)) {
-      Object.entries(fd.professions).forEach(([k, v]) => { colors[k] = v.color; });
+    for (const entry of Object.values(families)) {
+      Object.entries(entry.professions).forEach(([k, v]) => { colors[k] = v.color; });
     }
     return colors;
-  }, []);
+  }, [families]);
 
   const mergedProfLabels = useMemo(() => {
     const labels = {};
-    for (const fd of Object.values(FAMILIES)) {
-      Object.entries(fd.professions).forEach(([k, v]) => { labels[k] = v.label; });
+    for (const entry of Object.values(families)) {
+      Object.entries(entry.professions).forEach(([k, v]) => { labels[k] = v.label; });
     }
     return labels;
-  }, []);
+  }, [families]);
 
   // read picks from ALL families
   // use React state for current family (localStorage may be stale during render)
   const allPicks = useMemo(() => {
     void mergedTick; // depend on tick
     const merged = [];
-    for (const slug of Object.keys(FAMILIES)) {
+    for (const slug of Object.keys(families)) {
       if (slug === family) {
         merged.push(...picks);
       } else {
@@ -189,14 +202,25 @@ export default function App() {
       }
     }
     return merged;
-  }, [picks, family, mergedTick]);
+  }, [picks, family, mergedTick, families]);
+
+  // the Compare tab needs the tracks of every picked career
+  useEffect(() => {
+    if (tab !== "compare") return;
+    const pickedFamilies = new Set(
+      mergedCareers.filter((c) => allPicks.includes(c.key)).map((c) => c.family)
+    );
+    pickedFamilies.forEach(requestFamily);
+  }, [tab, allPicks, mergedCareers]);
 
   // derive merged chart data
   const mergedSelected = allPicks
     .map((k) => mergedCareers.find((c) => c.key === k))
     .filter(Boolean);
   const mergedNetWorth =
-    allPicks.length >= 2 ? buildNetWorthFromTracks(mergedTracks, allPicks) : [];
+    allPicks.length >= 2
+      ? buildNetWorthFromTracks(mergedTracks, allPicks, mergedFinancialDefaults)
+      : [];
   const mergedRadar =
     allPicks.length >= 2 ? buildRadarFromTracks(mergedTracks, allPicks) : [];
   const mergedStress =
@@ -204,14 +228,16 @@ export default function App() {
       ? buildStressFromTracks(mergedTracks, allPicks)
       : { scenarios: [], scores: [] };
   const mergedMoney =
-    allPicks.length >= 2 ? buildMoneyFromTracks(mergedTracks, allPicks) : [];
+    allPicks.length >= 2
+      ? buildMoneyFromTracks(mergedTracks, allPicks, mergedFinancialDefaults)
+      : [];
   const mergedTimeline =
     allPicks.length >= 2 ? buildTimelineFromTracks(mergedTracks, allPicks) : [];
 
   // toggle pick from Compare (handles careers from any family)
   const togglePickCrossFamily = (key) => {
-    for (const [slug, fd] of Object.entries(FAMILIES)) {
-      if (fd.careers.some((c) => c.key === key)) {
+    for (const slug of Object.keys(families)) {
+      if (mergedCareers.some((c) => c.family === slug && c.key === key)) {
         const sk = `crossrd-picks-${slug}`;
         try {
           const saved = localStorage.getItem(sk);
@@ -234,24 +260,35 @@ export default function App() {
 
   // jump straight to compare from front page
   const goCompare = () => {
-    const firstFamily = Object.keys(FAMILIES)[0];
+    const firstFamily = Object.keys(families)[0];
     setFamily(firstFamily);
     setTab("compare");
   };
 
+  const shellStyle = {
+    maxWidth: 680,
+    margin: "0 auto",
+    background: "#fafaf8",
+    minHeight: "100vh",
+    fontFamily: "'DM Sans', sans-serif",
+  };
+
+  // manifest or family shard still on its way (or failed)
+  if (!manifest || (familyEntry && !data)) {
+    return (
+      <div style={shellStyle}>
+        <div style={{ textAlign: "center", padding: "80px 16px", fontSize: 13, color: "#999" }}>
+          {loadError ? `couldn't load the career data (${loadError.message})` : "loading..."}
+        </div>
+      </div>
+    );
+  }
+
   // if no family selected, show picker
   if (!family || !data) {
     return (
-      <div
-        style={{
-          maxWidth: 680,
-          margin: "0 auto",
-          background: "#fafaf8",
-          minHeight: "100vh",
-          fontFamily: "'DM Sans', sans-serif",
-        }}
-      >
-        <FamilyPicker families={FAMILIES} onSelect={setFamily} onCompare={goCompare} />
+      <div style={shellStyle}>
+        <FamilyPicker families={families} onSelect={setFamily} onCompare={goCompare} />
       </div>
     );
   }
@@ -291,7 +328,9 @@ export default function App() {
 
   // derive chart data only when we have picks
   const netWorthData =
-    picks.length >= 2 ? buildNetWorthFromTracks(data.tracks, picks) : [];
+    picks.length >= 2
+      ? buildNetWorthFromTracks(data.tracks, picks, data.profession_financial_defaults)
+      : [];
   const radarData =
     picks.length >= 2 ? buildRadarFromTracks(data.tracks, picks) : [];
   const stressData =
@@ -299,7 +338,9 @@ export default function App() {
       ? buildStressFromTracks(data.tracks, picks)
       : { scenarios: [], scores: [] };
   const moneyData =
-    picks.length >= 2 ? buildMoneyFromTracks(data.tracks, picks) : [];
+    picks.length >= 2
+      ? buildMoneyFromTracks(data.tracks, picks, data.profession_financial_defaults)
+      : [];
   const timelineData =
     picks.length >= 2 ? buildTimelineFromTracks(data.tracks, picks) : [];
 
@@ -353,9 +394,11 @@ export default function App() {
       <div style={{ padding: "0 0 24px" }}>
         {tab === "explore" && (
           <Explore
+            family={family}
             meta={data.meta}
             groups={data.groups}
             allTracks={allTracks}
+            rankings={data.rankings}
             profColors={profColors}
             profLabels={profLabels}
             picks={picks}
@@ -1,8 +1,10 @@
 // CareerList.jsx — List of career cards within a group
-// Shows sortable career cards with key stats and a pick button.
+// Shows sortable career cards with key stats, similar careers and a pick button.
 
-import { useState } from "react";
+import { useState, useEffect } from "react";
 import { formatDollars } from "../styles/theme";
+import { rankedTracks, trackRank } from "../utils/rankings";
+import { loadManifest, loadSimilar } from "../utils/loadData";
 
 // AI risk dot color: 1-3 green, 4-6 amber, 7-10 red
 function aiDotColor(score) {
@@ -21,9 +23,12 @@ const SORT_OPTIONS = [
 ];
 
 export default function CareerList({
+  family,
   group,
   groupInfo,
   tracks,
+  allTracks,
+  rankings,
   picks,
   onTogglePick,
   onBack,
@@ -31,14 +36,44 @@ export default function CareerList({
 }) {
   const [sortKey, setSortKey] = useState("typicalPeak");
 
+  // nearest careers across every family, with display names from the manifest;
+  // optional — the cards just skip the row if similar.json isn't there
+  const [similar, setSimilar] = useState(null);
+  useEffect(() => {
+    let live = true;
+    Promise.all([loadSimilar(), loadManifest()]).then(
+      ([sim, manifest]) => {
+        if (!live) return;
+        const label = new Map(
+          manifest.careers.map((c) => [
+            `${c.family}/${c.key}`,
+            c.family === family ? c.name : `${c.name} ${manifest.families[c.family]?.icon || ""}`,
+          ])
+        );
+        setSimilar({ tracks: sim.tracks, label });
+      },
+      () => {}
+    );
+    return () => {
+      live = false;
+    };
+  }, [family]);
+
   const sortOpt = SORT_OPTIONS.find((s) => s.key === sortKey) || SORT_OPTIONS[0];
   const getVal = (t, opt) => t[opt.key] || (opt.fallback ? t[opt.fallback] : 0) || 0;
-  const sorted = [...tracks].sort((a, b) =>
-    sortOpt.dir === "desc" ? getVal(b, sortOpt) - getVal(a, sortOpt) : getVal(a, sortOpt) - getVal(b, sortOpt)
-  );
+  // the family's precomputed order filtered to this group is the group's order
+  const ranked = rankedTracks(allTracks || [], rankings, sortOpt.key, sortOpt.dir, (t) => getVal(t, sortOpt));
+  const sorted = ranked
+    ? ranked.filter((t) => t.group === group)
+    : [...tracks].sort((a, b) =>
+        sortOpt.dir === "desc" ? getVal(b, sortOpt) - getVal(a, sortOpt) : getVal(a, sortOpt) - getVal(b, sortOpt)
+      );
 
   const isPicked = (key) => picks.includes(key);
 
+  // rank badges need each track's index in data.tracks (= allTracks)
+  const trackIndex = new Map((allTracks || []).map((t, i) => [t.key, i]));
+
   return (
     <div style={{ padding: "0 8px" }}>
       {/* back + header */}
@@ -119,6 +154,10 @@ export default function CareerList({
         {sorted.map((t) => {
           const picked = isPicked(t.key);
           const profColor = profColors[t.profession] || "#888";
+          const rank = trackRank(rankings, sortOpt.key, trackIndex.get(t.key));
+          const alike = (similar?.tracks[`${family}/${t.key}`] || [])
+            .map(([id]) => similar.label.get(id))
+            .filter(Boolean);
           return (
             <div
               key={t.key}
@@ -163,6 +202,19 @@ export default function CareerList({
                     >
                       {t.profession}
                     </span>
+                    {rank && (
+                      <span
+                        title={`${sortOpt.label}: better than ${rank.percentile}% of the family, ${rank.groupPercentile}% of this group`}
+                        style={{
+                          fontFamily: "'DM Sans', sans-serif",
+                          fontSize: 11,
+                          color: "#D4A537",
+                          fontWeight: 600,
+                        }}
+                      >
+                        · #{rank.groupRank} here · #{rank.rank} of {allTracks.length} overall
+                      </span>
+                    )}
                   </div>
                 </div>
                 <button
@@ -220,6 +272,20 @@ export default function CareerList({
                   ))}
                 </span>
               </div>
+
+              {/* careers like this one (any family) */}
+              {alike.length > 0 && (
+                <div
+                  style={{
+                    fontFamily: "'DM Sans', sans-serif",
+                    fontSize: 11,
+                    color: "#999",
+                    marginTop: 6,
+                  }}
+                >
+                  👯 similar: {alike.join(" · ")}
+                </div>
+              )}
             </div>
           );
         })}
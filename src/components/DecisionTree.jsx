@@ -1,6 +1,8 @@
 // DecisionTree.jsx — Interactive decision tree + final ranking table
 // Walks the user through a few questions to find their best-fit career,
-// then shows the official final ranking underneath.
+// then shows the official final ranking underneath. the tree comes
+// precompiled (pipeline/decision_table.py): every answer path maps straight
+// to its next question or its result, so each step is one lookup.
 
 import { useState } from "react";
 import { styles } from "../styles/theme";
@@ -8,53 +10,25 @@ import { styles } from "../styles/theme";
 // rank emojis for the final table (positions 1-3 get medals)
 const RANK_EMOJI = { 1: "🥇", 2: "🥈", 3: "🥉" };
 
-function buildTree(raw, results) {
-  return {
-    q: raw.q,
-    emoji: "❓",
-    yes: {
-      q: raw.yes.q,
-      emoji: "📚",
-      yes: {
-        q: raw.yes.yes.q,
-        emoji: "🔬",
-        yes: { result: raw.yes.yes.procedural, ...results[raw.yes.yes.procedural] },
-        no: { result: raw.yes.yes.variety, ...results[raw.yes.yes.variety] },
-      },
-      no: { result: raw.yes.no, ...results[raw.yes.no] },
-    },
-    no: {
-      q: raw.no.q,
-      emoji: "🎯",
-      options: raw.no.options.map((opt) => ({
-        label: opt.label,
-        result: opt.result,
-        ...results[opt.result],
-      })),
-    },
-  };
-}
+// question emojis by answer path (anything else gets ❓)
+const QUESTION_EMOJI = { yes: "📚", "yes/yes": "🔬", no: "🎯" };
 
-export default function DecisionTree({ decisionTree, decisionTreeResults, ranking, allCareers, picks = [], onTogglePick }) {
-  const tree = buildTree(decisionTree, decisionTreeResults);
+// labels for yes/no answers (option answers carry their own)
+const STEP_LABEL = { yes: "Yes!", no: "Nope" };
 
+export default function DecisionTree({ decisionTable, ranking, allCareers, picks = [], onTogglePick }) {
   const [path, setPath] = useState([]);
 
-  const navigate = (choice) => setPath((prev) => [...prev, choice]);
+  const navigate = (step) => setPath((prev) => [...prev, step]);
   const reset = () => setPath([]);
 
-  // walk the tree to find the current node
-  let current = tree;
-  for (const step of path) {
-    if (typeof step === "number") {
-      current = current.options[step];
-    } else {
-      current = current[step];
-    }
-  }
-
-  const isResult = current?.result != null;
-  const rc = isResult ? allCareers.find((c) => c.key === current.result) : null;
+  // one lookup: the current path is either a question or a result
+  const pathKey = path.join("/");
+  const rc = decisionTable.results[pathKey] || null;
+  const isResult = rc != null;
+  const current = isResult
+    ? rc
+    : { ...decisionTable.questions[pathKey], emoji: QUESTION_EMOJI[pathKey] || "❓" };
 
   const btnStyle = (color) => ({
     fontFamily: "'DM Sans', sans-serif",
@@ -78,7 +52,7 @@ export default function DecisionTree({ decisionTree, decisionTreeResults, rankin
       <div
         style={{ display: "flex", justifyContent: "center", gap: 6, marginBottom: 16 }}
       >
-        {[0, 1, 2].map((i) => (
+        {Array.from({ length: decisionTable.depth }, (_, i) => i).map((i) => (
           <div
             key={i}
             style={{
@@ -132,28 +106,19 @@ export default function DecisionTree({ decisionTree, decisionTreeResults, rankin
               margin: "0 auto",
             }}
           >
-            {current.options ? (
-              current.options.map((opt, i) => (
-                <button
-                  key={i}
-                  onClick={() => navigate(i)}
-                  style={btnStyle(
-                    i === 0 ? "#2e7d32" : i === 1 ? "#1565c0" : "#6a1b9a"
-                  )}
-                >
-                  {opt.label}
-                </button>
-              ))
-            ) : (
-              <>
-                <button onClick={() => navigate("yes")} style={btnStyle("#2e7d32")}>
-                  Yes!
-                </button>
-                <button onClick={() => navigate("no")} style={btnStyle("#c62828")}>
-                  Nope
-                </button>
-              </>
-            )}
+            {current.choices.map((choice, i) => (
+              <button
+                key={choice.step}
+                onClick={() => navigate(choice.step)}
+                style={btnStyle(
+                  choice.step === "yes" ? "#2e7d32"
+                    : choice.step === "no" ? "#c62828"
+                    : i === 0 ? "#2e7d32" : i === 1 ? "#1565c0" : "#6a1b9a"
+                )}
+              >
+                {choice.label ?? STEP_LABEL[choice.step]}
+              </button>
+            ))}
           </div>
         </div>
       ) : (
@@ -219,7 +184,7 @@ export default function DecisionTree({ decisionTree, decisionTreeResults, rankin
           </div>
           {onTogglePick && (
             <button
-              onClick={() => onTogglePick(current.result)}
+              onClick={() => onTogglePick(rc.key)}
               style={{
                 marginTop: 12,
                 fontFamily: "'DM Sans', sans-serif",
@@ -227,15 +192,15 @@ export default function DecisionTree({ decisionTree, decisionTreeResults, rankin
                 fontWeight: 700,
                 padding: "8px 20px",
                 borderRadius: 12,
-                border: picks.includes(current.result)
+                border: picks.includes(rc.key)
                   ? `2px solid ${rc.color}`
                   : "2px solid #D4A537",
-                background: picks.includes(current.result) ? rc.color : "#D4A537",
+                background: picks.includes(rc.key) ? rc.color : "#D4A537",
                 color: "white",
                 cursor: "pointer",
               }}
             >
-              {picks.includes(current.result) ? "Picked!" : "⭐ Add to My Picks"}
+              {picks.includes(rc.key) ? "Picked!" : "⭐ Add to My Picks"}
             </button>
           )}
         </div>
@@ -9,9 +9,11 @@ import CareerList from "./CareerList";
 import FullField from "./FullField";
 
 export default function Explore({
+  family,
   meta,
   groups,
   allTracks,
+  rankings,
   profColors,
   profLabels,
   picks,
@@ -41,7 +43,7 @@ export default function Explore({
             &larr; Back to Groups
           </button>
         </div>
-        <FullField allTracks={allTracks} profColors={profColors} profLabels={profLabels} />
+        <FullField allTracks={allTracks} rankings={rankings} profColors={profColors} profLabels={profLabels} />
       </div>
     );
   }
@@ -53,9 +55,12 @@ export default function Explore({
     return (
       <div style={{ padding: "8px 0" }}>
         <CareerList
+          family={family}
           group={activeGroup}
           groupInfo={groupInfo}
           tracks={groupTracks}
+          allTracks={allTracks}
+          rankings={rankings}
           picks={picks}
           onTogglePick={onTogglePick}
           onBack={() => setActiveGroup(null)}
@@ -1,11 +1,11 @@
 // FamilyPicker.jsx — Landing page: pick a profession family
-// Shows crossrd branding + clickable cards for each available family.
+// Shows crossrd branding + clickable cards for each family in the data manifest.
 
 export default function FamilyPicker({ families, onSelect, onCompare }) {
   const available = Object.entries(families);
 
   // compute totals from actual data
-  const totalCareers = available.reduce((sum, [, fd]) => sum + fd.meta.total_tracks, 0);
+  const totalCareers = available.reduce((sum, [, fd]) => sum + fd.total_tracks, 0);
   const totalFields = available.length;
   const dataPointsEach = 107;
   const totalDataPoints = (totalCareers * dataPointsEach).toLocaleString();
@@ -20,7 +20,7 @@ export default function FamilyPicker({ families, onSelect, onCompare }) {
         const count = JSON.parse(saved).length;
         if (count > 0) {
           totalPicks += count;
-          pickSummary.push(`${fd.meta.icon} ${count}`);
+          pickSummary.push(`${fd.icon} ${count}`);
         }
       }
     } catch {}
@@ -159,7 +159,7 @@ export default function FamilyPicker({ families, onSelect, onCompare }) {
             }}
           >
             <div style={{ fontSize: 36, marginBottom: 8 }}>
-              {data.meta.icon}
+              {data.icon}
             </div>
             <div
               style={{
@@ -170,12 +170,12 @@ export default function FamilyPicker({ families, onSelect, onCompare }) {
                 marginBottom: 4,
               }}
             >
-              {data.meta.family_name}
+              {data.name}
             </div>
             <div style={{ fontSize: 12, color: "#999" }}>
-              {data.meta.total_tracks} careers · {Object.keys(data.groups).length} groups
+              {data.total_tracks} careers · {Object.keys(data.groups).length} groups
             </div>
-            {data.meta.note && (
+            {data.note && (
               <div
                 style={{
                   fontSize: 10,
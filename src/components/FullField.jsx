@@ -14,6 +14,7 @@ import {
   ResponsiveContainer,
 } from "recharts";
 import { styles } from "../styles/theme";
+import { rankedTracks } from "../utils/rankings";
 
 // AI risk dot color: 1-3 green, 4-6 amber, 7-10 red
 function aiDotColor(score) {
@@ -34,7 +35,7 @@ const COLUMNS = [
   { key: "burnout", label: "🔥 Burn", fmt: (v) => `${v}%` },
 ];
 
-export default function FullField({ allTracks, profColors, profLabels }) {
+export default function FullField({ allTracks, rankings, profColors, profLabels }) {
   const [sortKey, setSortKey] = useState("typicalPeak");
   const [sortDir, setSortDir] = useState("desc");
   const [filterProf, setFilterProf] = useState("ALL");
@@ -51,17 +52,18 @@ export default function FullField({ allTracks, profColors, profLabels }) {
     }
   };
 
-  // sorted + filtered list for the table
+  // sorted + filtered list for the table (precomputed order when the data has one)
   const sorted = useMemo(() => {
-    let data = [...allTracks];
+    const sortValue = (t) => t[sortKey] || (sortKey === "typicalPeak" ? t.peakSalary : 0) || 0;
+    let data = rankedTracks(allTracks, rankings, sortKey, sortDir, sortValue);
+    if (!data) {
+      data = [...allTracks].sort((a, b) =>
+        sortDir === "desc" ? sortValue(b) - sortValue(a) : sortValue(a) - sortValue(b)
+      );
+    }
     if (filterProf !== "ALL") data = data.filter((d) => d.profession === filterProf);
-    data.sort((a, b) => {
-      const av = a[sortKey] || (sortKey === "typicalPeak" ? a.peakSalary : 0) || 0;
-      const bv = b[sortKey] || (sortKey === "typicalPeak" ? b.peakSalary : 0) || 0;
-      return sortDir === "desc" ? bv - av : av - bv;
-    });
     return data;
-  }, [allTracks, sortKey, sortDir, filterProf]);
+  }, [allTracks, rankings, sortKey, sortDir, filterProf]);
 
   // filtered list for the scatter plot (no sorting needed)
   const scatterData = useMemo(
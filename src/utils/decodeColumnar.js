@@ -0,0 +1,46 @@
+// decodeColumnar.js — rebuild the tracks array from the columnar output
+// (pipeline/columnar.py). each column holds one field across all tracks:
+//   { path: "scores.category_1", scale: 100, values: [325, ...] }  fixed-point
+//   { path: "profession", dict: ["MD/DO", ...], codes: [0, 0, 1] } dictionary
+//   { path: "name", values: ["Neurosurgery", ...] }               plain
+// the result has exactly the shape of data.tracks, so components don't change.
+
+const FORMAT = "columnar/1";
+
+function columnValues(column) {
+  if (column.codes) return column.codes.map((c) => column.dict[c]);
+  if (column.scale) return column.values.map((v) => v / column.scale);
+  return column.values;
+}
+
+export function decodeTracks(encoded) {
+  if (encoded.format !== FORMAT) {
+    throw new Error(`unsupported columnar format: ${encoded.format}`);
+  }
+  const tracks = Array.from({ length: encoded.count }, () => ({}));
+  for (const column of encoded.columns) {
+    const dot = column.path.indexOf(".");
+    const section = dot === -1 ? column.path : column.path.slice(0, dot);
+    const field = dot === -1 ? null : column.path.slice(dot + 1);
+    const values = columnValues(column);
+    for (let i = 0; i < tracks.length; i++) {
+      if (field === null) {
+        tracks[i][section] = values[i];
+      } else {
+        (tracks[i][section] ||= {})[field] = values[i];
+      }
+    }
+  }
+  return tracks;
+}
+
+// family output with tracks_columnar → the usual shape with a tracks array
+export function decodeFamily(data) {
+  if (!data.tracks_columnar) return data;
+  const out = {};
+  for (const [k, v] of Object.entries(data)) {
+    if (k === "tracks_columnar") out.tracks = decodeTracks(v);
+    else out[k] = v;
+  }
+  return out;
+}
@@ -3,16 +3,6 @@
 
 const SNAPSHOT_AGES = [18, 23, 28, 33, 38, 43, 48, 53, 58, 65];
 
-// radar dimension → category mapping (mirrors pipeline/config.py)
-const RADAR_CATEGORY_MAP = {
-  Money: [5, 7],
-  Happiness: [12],
-  "Free Time": [9],
-  "Hard to Get In": [1, 2, 4],
-  "Robot-Proof": [11],
-  "Safety Net": [14],
-};
-
 const RADAR_DIMENSIONS = [
   { dim: "Money", emoji: "💰" },
   { dim: "Happiness", emoji: "😊" },
@@ -79,28 +69,38 @@ function computeNetWorthAtAge(fin, age, useTypical = true) {
   return Math.round(cumulative);
 }
 
-export function buildNetWorthFromTracks(tracks, selectedKeys) {
+// tracks only carry their own financial fields; the profession-level ones
+// live once in data.profession_financial_defaults (mirrors financial.resolve_financial)
+export function resolveFinancial(track, financialDefaults = {}) {
+  if (!track?.financial) return null;
+  return { ...(financialDefaults[track.profession] || {}), ...track.financial };
+}
+
+export function buildNetWorthFromTracks(tracks, selectedKeys, financialDefaults) {
+  const fins = {};
+  for (const key of selectedKeys) {
+    fins[key] = resolveFinancial(tracks.find((t) => t.key === key), financialDefaults);
+  }
   return SNAPSHOT_AGES.map((age) => {
     const point = { age };
     for (const key of selectedKeys) {
-      const track = tracks.find((t) => t.key === key);
-      if (!track?.financial) continue;
-      point[key] = computeNetWorthAtAge(track.financial, age, true);
-      point[`${key}_ceiling`] = computeNetWorthAtAge(track.financial, age, false);
+      const fin = fins[key];
+      if (!fin) continue;
+      point[key] = computeNetWorthAtAge(fin, age, true);
+      point[`${key}_ceiling`] = computeNetWorthAtAge(fin, age, false);
     }
     return point;
   });
 }
 
 export function buildRadarFromTracks(tracks, selectedKeys) {
+  // radar scores are rolled up from the categories by the pipeline
+  // (scoring.compute_radar_scores, RADAR_CATEGORY_MAP in pipeline/config.py)
+  const radars = selectedKeys.map((key) => [key, tracks.find((t) => t.key === key)?.radar]);
   return RADAR_DIMENSIONS.map((dim) => {
     const point = { dim: dim.dim, emoji: dim.emoji };
-    const catIds = RADAR_CATEGORY_MAP[dim.dim];
-    for (const key of selectedKeys) {
-      const track = tracks.find((t) => t.key === key);
-      if (!track?.scores) continue;
-      const vals = catIds.map((c) => track.scores[`category_${c}`] || 5);
-      point[key] = Math.round((vals.reduce((a, b) => a + b, 0) / vals.length) * 10) / 10;
+    for (const [key, radar] of radars) {
+      if (radar) point[key] = radar[dim.dim];
     }
     return point;
   });
@@ -133,12 +133,12 @@ export function buildStressFromTracks(tracks, selectedKeys) {
   };
 }
 
-export function buildMoneyFromTracks(tracks, selectedKeys) {
+export function buildMoneyFromTracks(tracks, selectedKeys, financialDefaults) {
   return selectedKeys
     .map((key) => {
       const track = tracks.find((t) => t.key === key);
-      if (!track?.financial) return null;
-      const fin = track.financial;
+      const fin = resolveFinancial(track, financialDefaults);
+      if (!fin) return null;
       return {
         key,
         start: fin.starting_salary || track.raw_data?.startSalary || 0,
@@ -160,4 +160,4 @@ export function buildTimelineFromTracks(tracks, selectedKeys) {
     .filter(Boolean);
 }
 
-export { RADAR_DIMENSIONS, RADAR_CATEGORY_MAP };
+export { RADAR_DIMENSIONS };
@@ -0,0 +1,78 @@
+// loadData.js — lazy loader for the sharded pipeline output
+// reads public/data/manifest.json (written by pipeline/shards.py) and fetches
+// only the family / track shards that are actually opened. shard file names
+// are content-hashed, so the browser can cache them forever; only the
+// manifest is revalidated. family shards may store their tracks as columns
+// (shards.py --columnar); they're decoded here, so callers always get the
+// usual data.tracks array.
+
+import { decodeFamily } from "./decodeColumnar";
+
+const DATA_BASE = `${import.meta.env.BASE_URL}data/`;
+
+let manifestPromise = null;
+const shardCache = new Map();
+
+function fetchJson(path, init) {
+  return fetch(`${DATA_BASE}${path}`, init).then((res) => {
+    if (!res.ok) throw new Error(`failed to load ${path}: ${res.status}`);
+    return res.json();
+  });
+}
+
+// shards are immutable — one fetch (and decode) per file, shared by every caller
+function fetchShard(path, decode = (data) => data) {
+  if (!shardCache.has(path)) {
+    const promise = fetchJson(path).then(decode).catch((err) => {
+      shardCache.delete(path);
+      throw err;
+    });
+    shardCache.set(path, promise);
+  }
+  return shardCache.get(path);
+}
+
+// { families: { slug: { name, icon, total_tracks, file, groups, professions, tracks? } },
+//   careers: [{ key, name, color, path, group, family, profession }] }
+export function loadManifest() {
+  if (!manifestPromise) {
+    manifestPromise = fetchJson("manifest.json", { cache: "no-cache" }).catch((err) => {
+      manifestPromise = null;
+      throw err;
+    });
+  }
+  return manifestPromise;
+}
+
+// "careers like this" across every family (pipeline/similar.py):
+// { k, tracks: { "family/key": [["family/key", distance], ...] } }
+let similarPromise = null;
+export function loadSimilar() {
+  if (!similarPromise) {
+    similarPromise = fetchJson("similar.json", { cache: "no-cache" }).catch((err) => {
+      similarPromise = null;
+      throw err;
+    });
+  }
+  return similarPromise;
+}
+
+// full family output (same shape as src/data/<family>.json)
+export async function loadFamily(slug) {
+  const manifest = await loadManifest();
+  const entry = manifest.families[slug];
+  if (!entry) throw new Error(`unknown family: ${slug}`);
+  return fetchShard(entry.file, decodeFamily);
+}
+
+// a single track — uses its own shard when the pipeline wrote one,
+// otherwise falls back to the family shard
+export async function loadTrack(slug, key) {
+  const manifest = await loadManifest();
+  const entry = manifest.families[slug];
+  if (!entry) throw new Error(`unknown family: ${slug}`);
+  const trackFile = entry.tracks?.[key];
+  if (trackFile) return fetchShard(trackFile);
+  const family = await fetchShard(entry.file, decodeFamily);
+  return family.tracks.find((t) => t.key === key) || null;
+}
@@ -0,0 +1,35 @@
+// rankings.js — sorted views from the pipeline's precomputed rankings
+// (pipeline/rankings.py). data.rankings.order[metric] lists track indices
+// best first, so a sorted view is a lookup instead of a sort.
+
+// tracks (indexed like data.tracks) in `metric` order, or null when the
+// data has no precomputed order for it — callers then sort as before.
+// dir flips the metric's own best-first order; value(track) is the sort
+// value, so tied tracks stay in index order either way, as they would in
+// the stable client sort (reversing the order would flip them too).
+export function rankedTracks(tracks, rankings, metric, dir, value) {
+  const order = rankings?.order?.[metric];
+  if (!order || order.length !== tracks.length) return null;
+  const meta = rankings.metrics.find((m) => m.id === metric);
+  if (!dir || !meta || dir === meta.order) return order.map((i) => tracks[i]);
+  if (!value) return null;
+  const pos = new Array(order.length);
+  order.forEach((i, p) => {
+    pos[i] = p;
+  });
+  return [...order]
+    .sort((a, b) => (value(tracks[a]) === value(tracks[b]) ? a - b : pos[b] - pos[a]))
+    .map((i) => tracks[i]);
+}
+
+// a track's family / group rank and percentile for one metric, or null when
+// the data has no per-track ranks (outputs from before they were added)
+export function trackRank(rankings, metric, index) {
+  if (!rankings?.rank?.[metric] || index === undefined) return null;
+  return {
+    rank: rankings.rank[metric][index],
+    percentile: rankings.percentile[metric][index],
+    groupRank: rankings.group_rank[metric][index],
+    groupPercentile: rankings.group_percentile[metric][index],
+  };
+}